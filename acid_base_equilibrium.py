@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+pH растворов кислот, оснований, солей и буферов
+Концентрация H+ находится из точного уравнения электронейтральности
+(многоосновные кислоты - через доли всех форм) бисекцией по pH на
+отрезке [-2, 16]. Все вычисления идут над массивами NumPy, поэтому
+один вызов считает pH сразу для целого ряда концентраций
+"""
+
+import re
+
+import numpy as np
+
+from chemistry_data import ACID_CONSTANTS, BASE_CONSTANTS, KW, STRONG_BASES
+from formula_correction import correct_query
+from ion_exchange import make_compound, split_ions
+from name_resolver import resolve_names
+
+PH_BOUNDS = (-2.0, 16.0)
+BISECTION_STEPS = 60
+
+PH_QUERY_RE = re.compile(r'^\s*pH\b[\s:]*(.+)$', re.IGNORECASE)
+COMPONENT_RE = re.compile(r'^(\d+(?:[.,]\d+)?(?:[eE]-?\d+)?)\s*(?:M|М|моль/л|mol/l)?\s+(.+)$', re.IGNORECASE)
+COMPONENT_SPLIT_RE = re.compile(r'\s*[+;]\s*')
+
+
+class Solution:
+    """Раствор как набор вкладов в уравнение электронейтральности"""
+
+    def __init__(self):
+        self.fixed = 0.0   # заряд катионов сильных оснований и солей
+        self.acids = []    # (константы по ступеням, концентрация)
+        self.bases = []    # (Ka сопряженной кислоты, концентрация)
+
+    def add(self, formula, concentration):
+        """Добавляет вещество; False, если для него нет данных"""
+        concentration = np.asarray(concentration, dtype=float)
+        if formula in ACID_CONSTANTS:
+            self.acids.append((ACID_CONSTANTS[formula], concentration))
+        elif formula in BASE_CONSTANTS:
+            self.bases.append((KW / BASE_CONSTANTS[formula], concentration))
+        elif formula in STRONG_BASES:
+            (_, charge), cation_count, _, _ = split_ions(formula)
+            self.fixed = self.fixed + charge * cation_count * concentration
+        else:
+            return self._add_salt(formula, concentration)
+        return True
+
+    def _add_salt(self, formula, concentration):
+        ions = split_ions(formula)
+        if not ions or ions[2] == 'OH':
+            return False
+        (cation, charge), cation_count, anion, anion_count = ions
+
+        acid = make_compound(('H', 1), anion)
+        if acid not in ACID_CONSTANTS:
+            return False
+
+        if cation == 'NH4':
+            self.bases.append((KW / BASE_CONSTANTS['NH3'], cation_count * concentration))
+        else:
+            self.fixed = self.fixed + charge * cation_count * concentration
+        self.acids.append((ACID_CONSTANTS[acid], anion_count * concentration))
+        return True
+
+    def charge_balance(self, h):
+        """Невязка электронейтральности; возрастает вместе с [H+]"""
+        residual = h + self.fixed - KW / h
+        for ka, concentration in self.bases:
+            residual = residual + concentration * h / (h + ka)
+        for constants, concentration in self.acids:
+            residual = residual - concentration * acid_charge(h, constants)
+        return residual
+
+    def ph(self):
+        """pH бисекцией по всем концентрациям сразу"""
+        shapes = [np.shape(c) for _, c in self.acids + self.bases] + [np.shape(self.fixed)]
+        shape = np.broadcast_shapes(*shapes)
+        low = np.full(shape, PH_BOUNDS[0])
+        high = np.full(shape, PH_BOUNDS[1])
+        for _ in range(BISECTION_STEPS):
+            middle = (low + high) / 2
+            positive = self.charge_balance(10.0 ** -middle) > 0
+            # Невязка положительна - [H+] слишком велика, корень при большем pH
+            low = np.where(positive, middle, low)
+            high = np.where(positive, high, middle)
+        result = (low + high) / 2
+        return float(result) if result.ndim == 0 else result
+
+
+def acid_charge(h, constants):
+    """Средний заряд аниона кислоты (число отданных протонов) при [H+] = h"""
+    n = len(constants)
+    terms = [h ** n]
+    product = 1.0
+    for i, constant in enumerate(constants, start=1):
+        product *= constant
+        terms.append(product * h ** (n - i))
+    total = sum(terms)
+    return sum(i * term for i, term in enumerate(terms)) / total
+
+
+def solution_ph(solution):
+    """
+    pH раствора {формула: концентрация (моль/л)}; концентрации могут быть массивами
+    Возвращает None, если для какого-то вещества нет констант
+    """
+    mixture = Solution()
+    for formula, concentration in solution.items():
+        if not mixture.add(formula, concentration):
+            return None
+    return mixture.ph()
+
+
+def ph(formula, concentration):
+    """pH раствора одного вещества: ph('CH3COOH', 0.1) -> 2.88"""
+    return solution_ph({formula: concentration})
+
+
+def buffer_ph(acid, acid_concentration, salt, salt_concentration):
+    """pH буфера: buffer_ph('CH3COOH', 0.1, 'CH3COONa', 0.1) -> 4.74"""
+    return solution_ph({acid: acid_concentration, salt: salt_concentration})
+
+
+def parse_ph_query(text):
+    """'pH 0.1M CH3COOH + 0.1M CH3COONa' -> {'CH3COOH': 0.1, 'CH3COONa': 0.1} или None"""
+    match = PH_QUERY_RE.match(text)
+    if not match:
+        return None
+
+    solution = {}
+    for part in COMPONENT_SPLIT_RE.split(match.group(1).strip()):
+        component = COMPONENT_RE.match(part)
+        if not component:
+            return None
+        formula = correct_query(resolve_names(component.group(2).strip()))
+        solution[formula] = float(component.group(1).replace(',', '.'))
+    return solution or None
+
+
+def format_ph(solution, value):
+    """Текст ответа для бота"""
+    components = ' + '.join(f"{c:g} M {formula}" for formula, c in solution.items())
+    h = 10 ** -value
+    kind = "кислая" if value < 6.5 else "щелочная" if value > 7.5 else "нейтральная"
+    response = f"🧪 {components}\n\n"
+    response += f"📊 pH = {value:.2f} (pOH = {14 - value:.2f})\n"
+    response += f"⚗️ [H⁺] = {h:.2e} моль/л\n"
+    response += f"💡 Среда {kind}"
+    return response
@@ -10,6 +10,21 @@ import os
 import random
 from collections import defaultdict, Counter
 import math
+from query_matcher import ChemicalQueryMatcher
+from reaction_similarity import ReactionSimilarityIndex
+from chemistry_core import split_coefficient
+from chemistry_data import ACTIVITY_RANK
+from ion_exchange import ACIDIC_OXIDES, split_basic_oxide, split_ions
+from chemistry_result import ChemistryResult
+from equilibrium import solve_equilibria
+from formula_correction import correct_query
+from name_resolver import resolve_names
+from oxidation_states import is_redox
+from response_cache import ResponseCache
+from result_renderers import render, render_telegram
+from solving_pipeline import SolvingPipeline, normalize_query
+from suggest_index import SuggestIndex
+from thermochemistry import STANDARD_TEMPERATURE, reaction_thermo
 
 class AdvancedNeuralChemistry:
     """Продвинутая нейронная сеть для химических реакций"""
@@ -19,6 +34,11 @@ class AdvancedNeuralChemistry:
         self.reaction_patterns = {}
         self.context_memory = defaultdict(list)
         self.confidence_scores = {}
+        # Готовые ChemistryResult по нормализованному запросу - для любых
+        # запросов (объяснения, справка), до анализа. Кэш конвейера хранит
+        # только решения реакций и нужен термохимии, равновесиям и
+        # predict_reaction, которые идут в конвейер мимо solve_structured
+        self.response_cache = ResponseCache(maxsize=512, ttl=3600)
         self.load_advanced_knowledge()
 
     def load_advanced_knowledge(self):
@@ -116,13 +136,60 @@ class AdvancedNeuralChemistry:
             'educated_guess': 0.4,   # Образованное предположение
         }
 
+        # Металлы, которые распознаются как отдельный реагент
+        self.common_metals = frozenset(['Li', 'Na', 'K', 'Ca', 'Mg', 'Zn', 'Fe', 'Al', 'Cu'])
+
+        # Все индикаторы и ключевые слова компилируются в один автомат
+        self.matcher = ChemicalQueryMatcher({
+            'balancing': (['->', '='], False),
+            'separator': (['+'], False),
+            'prediction': (['HCl', 'H2SO4', 'HNO3', 'O2', 'NaOH'], False),
+            'explanation': (['почему', 'как', 'что', 'explain', 'why', 'how'], False),
+            'calculation': (['сколько', 'масс', 'объем', 'calculate', 'how much'], False),
+            'oxidizers': (['MnO2', 'KMnO4', 'K2Cr2O7', 'H2O2', 'Cl2'], True),
+            'oxygen': (['O2'], True),
+        })
+
+        # Индекс сходства для поиска ближайших известных реакций
+        self.similarity_index = ReactionSimilarityIndex(self.knowledge_base)
+
+        # Подсказки при вводе: формулы, названия и известные реакции
+        self.suggest_index = SuggestIndex(self.knowledge_base)
+
+        # Конвейер решения: база знаний -> правила -> балансировка -> перебор
+        self.pipeline = SolvingPipeline(self)
+
+        # Ответы, построенные по старой базе знаний, больше не годятся
+        self.response_cache.clear()
+
     def solve_reaction_chatgpt_style(self, query):
         """
         Решение химических реакций в стиле ChatGPT
         Анализирует запрос, понимает контекст и дает подробный ответ
         """
-        query = query.strip()
+        return render_telegram(self.solve_structured(query))
 
+    def prepare_query(self, query):
+        """
+        Названия веществ заменяются формулами: "цинк + соляная кислота" -> "Zn + HCl",
+        регистр и опечатки исправляются: "zn + hcl" -> "Zn + HCl"
+        """
+        return correct_query(resolve_names(query.strip()))
+
+    def solve_structured(self, query):
+        """Структурированный результат (ChemistryResult) с кэшем по запросу"""
+        query = self.prepare_query(query)
+
+        # Ответ детерминирован - повторные запросы отдаются из кэша
+        key = normalize_query(query)
+        result = self.response_cache.get(key)
+        if result is None:
+            result = self.build_result(query)
+            self.response_cache.put(key, result)
+        return result
+
+    def build_result(self, query):
+        """Анализ запроса и построение результата"""
         # Анализируем тип запроса
         analysis = self.analyze_query(query)
 
@@ -131,11 +198,11 @@ class AdvancedNeuralChemistry:
         elif analysis['type'] == 'balancing':
             return self.balance_equation_advanced(query, analysis)
         elif analysis['type'] == 'explanation':
-            return self.explain_reaction(query, analysis)
+            return ChemistryResult('explanation', query)
         elif analysis['type'] == 'calculation':
-            return self.calculate_stoichiometry(query, analysis)
+            return ChemistryResult('calculation', query)
         else:
-            return self.general_chemistry_help(query, analysis)
+            return ChemistryResult('help', query)
 
     def analyze_query(self, query):
         """Анализ запроса пользователя"""
@@ -143,25 +210,41 @@ class AdvancedNeuralChemistry:
             'type': 'unknown',
             'confidence': 0.0,
             'components': [],
+            'species': [],
             'reaction_type': None,
             'complexity': 'simple'
         }
 
+        # Один проход автомата по запросу
+        found = self.matcher.scan(query)
+
         # Определяем тип запроса
-        if '->' in query or '=' in query:
+        if found['balancing']:
             analysis['type'] = 'balancing'
-        elif '+' in query and any(elem in query.upper() for elem in ['HCL', 'H2SO4', 'HNO3', 'O2', 'NAOH']):
+        elif found['separator'] and found['prediction']:
             analysis['type'] = 'reaction_prediction'
-        elif any(word in query.lower() for word in ['почему', 'как', 'что', 'explain', 'why', 'how']):
+        elif found['explanation']:
             analysis['type'] = 'explanation'
-        elif any(word in query.lower() for word in ['сколько', 'масс', 'объем', 'calculate', 'how much']):
+        elif found['calculation']:
             analysis['type'] = 'calculation'
 
         # Анализируем компоненты
         analysis['components'] = self.extract_chemicals(query)
 
+        # Распознанные вещества (без вложенных совпадений вроде O2 внутри MnO2)
+        metals = [comp for comp in analysis['components'] if comp in self.common_metals]
+        candidates = metals + found['oxidizers'] + found['prediction']
+        for species in candidates:
+            nested = any(species != other and species in other for other in candidates)
+            if not nested and species not in analysis['species']:
+                analysis['species'].append(species)
+
         # Определяем тип реакции
-        analysis['reaction_type'] = self.classify_reaction(analysis['components'])
+        analysis['reaction_type'] = self.classify_reaction(analysis['components'], found)
+
+        # Обмен между солями распознается по ионам, а не по ключевым словам
+        if analysis['type'] == 'unknown' and analysis['reaction_type'] in ('exchange', 'displacement'):
+            analysis['type'] = 'reaction_prediction'
 
         # Оцениваем сложность
         if len(analysis['components']) > 2 or analysis['reaction_type'] == 'redox':
@@ -170,124 +253,42 @@ class AdvancedNeuralChemistry:
         return analysis
 
     def predict_reaction_advanced(self, query, analysis):
-        """Продвинутое предсказание реакции"""
-        components = analysis['components']
-
-        # Сначала ищем точное совпадение
-        normalized = self.normalize_formula(query)
-        if normalized in self.knowledge_base:
-            products = self.knowledge_base[normalized]
-            confidence = self.confidence_scores['exact_match']
-
-            response = f"🧪 На основе моей базы знаний:\n\n"
-            response += f"📥 Реагенты: {query}\n"
-            response += f"🤖 Продукты: {products}\n"
-            response += f"🎯 Уверенность: {confidence*100:.0f}%\n\n"
-
-            if analysis['reaction_type']:
-                response += f"📋 Тип реакции: {self.get_reaction_type_name(analysis['reaction_type'])}\n"
-
-            response += self.add_educational_note(analysis['reaction_type'])
-            return response
-
-        # Если точного совпадения нет, используем паттерны
-        prediction = self.predict_by_pattern(query, analysis)
-        if prediction:
-            confidence = self.confidence_scores['pattern_match']
-
-            response = f"🧠 Анализируя по паттернам:\n\n"
-            response += f"📥 Реагенты: {query}\n"
-            response += f"🤖 Предполагаемые продукты: {prediction}\n"
-            response += f"🎯 Уверенность: {confidence*100:.0f}%\n\n"
-
-            if analysis['reaction_type']:
-                response += f"📋 Тип реакции: {self.get_reaction_type_name(analysis['reaction_type'])}\n"
-
-            response += "⚠️ Это предсказание может требовать проверки!\n"
-            response += self.add_educational_note(analysis['reaction_type'])
-            return response
-
-        # Если ничего не нашли
-        return self.generate_helpful_response(query, analysis)
-
-    def predict_by_pattern(self, query, analysis):
-        """Предсказание по паттернам"""
-        reaction_type = analysis['reaction_type']
-
-        if reaction_type == 'metal_acid':
-            return self.predict_metal_acid_advanced(query)
-        elif reaction_type == 'metal_oxygen':
-            return self.predict_metal_oxygen_advanced(query)
-        elif reaction_type == 'acid_base':
-            return self.predict_acid_base_advanced(query)
-        elif reaction_type == 'redox':
-            return self.predict_redox_advanced(query)
-        elif reaction_type == 'combustion':
-            return "CO2+H2O"
-        elif reaction_type == 'decomposition':
-            return self.predict_decomposition_advanced(query)
-
-        return None
-
-    def predict_metal_acid_advanced(self, query):
-        """Продвинутое предсказание металл + кислота"""
-        parts = [p.strip() for p in query.split('+')]
-        if len(parts) != 2:
+        """Продвинутое предсказание реакции через конвейер решения"""
+        result = self.pipeline.solve(query, analysis)
+        if not result:
+            return self.generate_helpful_response(query, analysis)
+        return ChemistryResult.from_pipeline('prediction', query, result)
+
+    def predict_reaction(self, query):
+        """Продукты для реагентов запроса строкой 'A+B' (None, если не найдены)"""
+        query = self.prepare_query(query)
+        result = self.pipeline.solve(query)
+        if not result or not result['proceeds']:
             return None
+        # Реакции, которым нужны дополнительные реагенты (гидролиз), здесь не подходят
+        if len(result['reactants']) != len(self.extract_chemicals(query)):
+            return None
+        return '+'.join(result['products'])
 
-        metal = parts[0].strip()
-        acid = parts[1].strip()
-
-        # Валентности металлов
-        valences = {
-            'Li': 1, 'Na': 1, 'K': 1, 'Rb': 1, 'Cs': 1,
-            'Be': 2, 'Mg': 2, 'Ca': 2, 'Sr': 2, 'Ba': 2, 'Ra': 2,
-            'Al': 3, 'Zn': 2, 'Fe': 2, 'Cu': 2, 'Ag': 1, 'Au': 3,
-            'Sn': [2, 4], 'Pb': [2, 4]
-        }
-
-        # Определяем анион кислоты
-        if 'HCl' in acid:
-            anion = 'Cl'
-        elif 'H2SO4' in acid:
-            anion = 'SO4'
-        elif 'HNO3' in acid:
-            anion = 'NO3'
-        elif 'HBr' in acid:
-            anion = 'Br'
-        elif 'HI' in acid:
-            anion = 'I'
-        else:
-            anion = 'Cl'
-
-        # Получаем валентность
-        if metal in valences:
-            valency = valences[metal]
-            if isinstance(valency, list):
-                valency = valency[0]  # Берем первую валентность
-        else:
-            valency = 2  # По умолчанию
-
-        # Формируем соль
-        if anion in ['Cl', 'Br', 'I']:
-            if valency == 1:
-                salt = f"{metal}{anion}"
-            else:
-                salt = f"{metal}{anion}{valency}"
-        elif anion == 'SO4':
-            if valency == 2:
-                salt = f"{metal}{anion}"
-            else:
-                salt = f"{metal}{anion}"  # Для Al будет Al2(SO4)3, но упрощаем
-        elif anion == 'NO3':
-            if valency == 1:
-                salt = f"{metal}{anion}"
-            else:
-                salt = f"{metal}({anion}){valency}"
-        else:
-            salt = f"{metal}{anion}{valency}"
+    def thermochemistry(self, query, temperature=STANDARD_TEMPERATURE):
+        """ΔH°, ΔS° и ΔG°(T) для уравнения или реагентов запроса (None, если данных нет)"""
+        result = self.pipeline.solve(self.prepare_query(query))
+        if not result or not result['proceeds'] or result['coefficients'] is None:
+            return None
+        return reaction_thermo(result['reactants'], result['products'], result['coefficients'], temperature)
 
-        return f"{salt}+H2"
+    def equilibrium(self, queries, constants, initial):
+        """
+        Равновесный состав для одного или нескольких уравнений запроса
+        initial - {формула: c0}, c0 может быть списком условий
+        """
+        reactions = []
+        for query in queries:
+            result = self.pipeline.solve(self.prepare_query(query))
+            if not result or not result['products'] or result['coefficients'] is None:
+                return None
+            reactions.append((result['reactants'], result['products'], result['coefficients']))
+        return solve_equilibria(reactions, constants, initial)
 
     def predict_redox_advanced(self, query):
         """Продвинутое предсказание ОВР реакции"""
@@ -302,18 +303,28 @@ class AdvancedNeuralChemistry:
 
         return None
 
-    def classify_reaction(self, components):
+    def classify_reaction(self, components, found=None):
         """Классификация типа реакции"""
         if len(components) == 0:
             return None
 
-        # Проверяем на ОВР
-        redox_indicators = ['MnO2', 'KMnO4', 'K2Cr2O7', 'H2O2', 'Cl2']
-        if any(ind in str(components) for ind in redox_indicators):
+        if found is None:
+            found = self.matcher.scan('+'.join(components))
+
+        # Пара солей/кислот/оснований/оксидов (BaCl2 содержит 'Cl2', но это не ОВР)
+        ionic_pair = len(components) == 2 and all(self._is_ionic(comp) for comp in components)
+
+        # Металл + соль или кислота (CuCl2 тоже содержит 'Cl2')
+        metal_pair = (len(components) == 2 and any(comp in ACTIVITY_RANK for comp in components)
+                      and any(split_ions(comp) for comp in components))
+
+        # ОВР - если известные продукты меняют степени окисления элементов
+        redox_products = None if ionic_pair or metal_pair else self.predict_redox_advanced('+'.join(components))
+        if redox_products and is_redox(components, [split_coefficient(p)[1] for p in redox_products.split('+')]):
             return 'redox'
 
         # Проверяем на горение
-        if 'O2' in str(components) and any('C' in comp or 'H' in comp for comp in components):
+        if found['oxygen'] and not ionic_pair and any('C' in comp or 'H' in comp for comp in components):
             return 'combustion'
 
         # Проверяем на кислота + основание
@@ -323,22 +334,33 @@ class AdvancedNeuralChemistry:
             return 'acid_base'
 
         # Проверяем на металл + кислота
-        has_metal = any(comp in ['Li', 'Na', 'K', 'Ca', 'Mg', 'Zn', 'Fe', 'Al', 'Cu'] for comp in components)
+        has_metal = any(comp in self.common_metals for comp in components)
         has_acid = any('H' in comp and len(comp) > 1 for comp in components)
         if has_metal and has_acid:
             return 'metal_acid'
 
         # Проверяем на металл + кислород
-        has_metal = any(comp in ['Li', 'Na', 'K', 'Ca', 'Mg', 'Zn', 'Fe', 'Al', 'Cu'] for comp in components)
-        if has_metal and 'O2' in str(components):
+        if has_metal and found['oxygen']:
             return 'metal_oxygen'
 
+        # Обмен ионами между солями, кислотами, основаниями и оксидами
+        if ionic_pair:
+            return 'exchange'
+
+        # Металл + соль: вытеснение по ряду активности
+        if metal_pair:
+            return 'displacement'
+
         # Разложение (один реагент)
         if len(components) == 1:
             return 'decomposition'
 
         return 'unknown'
 
+    def _is_ionic(self, formula):
+        """Вещество раскладывается на ионы таблицы растворимости или является оксидом"""
+        return bool(split_ions(formula) or split_basic_oxide(formula) or formula in ACIDIC_OXIDES)
+
     def extract_chemicals(self, query):
         """Извлечение химических веществ из запроса"""
         # Упрощенная версия - разделяем по + и убираем пробелы
@@ -353,73 +375,43 @@ class AdvancedNeuralChemistry:
         """Нормализация формулы"""
         return re.sub(r'\s+', '', formula)
 
-    def get_reaction_type_name(self, reaction_type):
-        """Получение названия типа реакции на русском"""
-        names = {
-            'metal_acid': 'Металл + кислота',
-            'metal_oxygen': 'Металл + кислород',
-            'acid_base': 'Кислота + основание',
-            'combustion': 'Горение',
-            'decomposition': 'Разложение',
-            'redox': 'Окислительно-восстановительная',
-            'unknown': 'Неизвестный тип'
-        }
-        return names.get(reaction_type, 'Неизвестный тип')
-
-    def add_educational_note(self, reaction_type):
-        """Добавление образовательной заметки"""
-        notes = {
-            'metal_acid': "\n💡 Металлы реагируют с кислотами, образуя соль и водород. Активность металла определяет возможность реакции.",
-            'metal_oxygen': "\n💡 Металлы окисляются кислородом, образуя оксиды. Щелочные металлы дают пероксиды.",
-            'acid_base': "\n💡 Кислоты реагируют с основаниями в реакции нейтрализации, образуя соль и воду.",
-            'combustion': "\n💡 При горении углеводороды полностью окисляются до CO₂ и H₂O.",
-            'redox': "\n💡 ОВР включают перенос электронов. Один элемент окисляется, другой восстанавливается.",
-            'decomposition': "\n💡 Разложение - обратный процесс синтеза. Часто требует нагрева или катализаторов."
-        }
-        return notes.get(reaction_type, "")
-
     def generate_helpful_response(self, query, analysis):
-        """Генерация полезного ответа когда ничего не найдено"""
-        response = f"🤔 Я не смог точно определить реакцию для: {query}\n\n"
+        """Результат, когда реакция не найдена: ближайшие известные реакции"""
+        result = ChemistryResult('unmatched', query, components=analysis['components'],
+                                 reaction_type=analysis['reaction_type'])
 
         if analysis['components']:
-            response += f"📋 Распознанные компоненты: {', '.join(analysis['components'])}\n"
+            # Ближайшие известные реакции из базы знаний
+            result.neighbours = self.similarity_index.nearest(analysis['components'], k=3)
+            result.analogy = next((n for n in result.neighbours if n['analogy']), None)
+            if result.analogy:
+                result.confidence = self.confidence_scores['inferred']
 
-        response += "\n💡 Попробуйте:\n"
-        response += "• Указать полную реакцию с продуктами (H2 + O2 -> H2O)\n"
-        response += "• Использовать только реагенты (Zn + HCl)\n"
-        response += "• Проверить правильность написания формул\n\n"
-
-        response += "📚 Доступные команды:\n"
-        response += "/start - Мини-приложение\n"
-        response += "/periodic - Периодическая таблица\n"
-        response += "/help - Подробная помощь"
-
-        return response
+        return result
 
     def balance_equation_advanced(self, query, analysis):
         """Продвинутое балансирование уравнения"""
-        # Это можно расширить для использования существующего балансировщика
-        return f"⚖️ Для балансирования уравнения: {query}\n\nИспользуйте обычный режим ввода без команды."
-
-    def explain_reaction(self, query, analysis):
-        """Объяснение реакции"""
-        return f"📖 Объяснение для: {query}\n\nЭто функция в разработке. Попробуйте предсказать реакцию!"
-
-    def calculate_stoichiometry(self, query, analysis):
-        """Расчет стехиометрии"""
-        return f"🧮 Расчет для: {query}\n\nФункция стехиометрических расчетов в разработке."
-
-    def general_chemistry_help(self, query, analysis):
-        """Общая помощь по химии"""
-        return f"🧪 По запросу: {query}\n\nЯ - ИИ для решения химических реакций. Отправьте формулы веществ через '+' для предсказания реакции!"
+        result = self.pipeline.solve(query, analysis)
+        if not result:
+            return ChemistryResult('balancing', query, reaction_type=analysis['reaction_type'])
+        return ChemistryResult.from_pipeline('balancing', query, result)
+
+    def get_info(self):
+        """Сведения о базе знаний и работе ступеней конвейера"""
+        info = "🤖 ИИ для химических реакций\n\n"
+        info += f"📚 Реакций в базе знаний: {len(self.knowledge_base)}\n\n"
+        info += "⏱ Ступени решения (вызовы / ответы / среднее время):\n"
+        for name, metrics in self.pipeline.metrics.items():
+            average = metrics['total_ms'] / metrics['calls'] if metrics['calls'] else 0.0
+            info += f"• {name}: {metrics['calls']} / {metrics['answers']} / {average:.3f} мс\n"
+        return info
 
 # Глобальный экземпляр продвинутой нейронной сети
 advanced_neural_predictor = AdvancedNeuralChemistry()
 
-def solve_chemistry_chatgpt(query):
-    """Функция для решения химических задач в стиле ChatGPT"""
-    return advanced_neural_predictor.solve_reaction_chatgpt_style(query)
+def solve_chemistry_chatgpt(query, fmt='text'):
+    """Функция для решения химических задач в стиле ChatGPT ('text', 'html' или 'json')"""
+    return render(advanced_neural_predictor.solve_structured(query), fmt)
 
 if __name__ == "__main__":
     # Тестирование продвинутой нейронной сети
@@ -3,6 +3,12 @@ from tkinter import ttk, scrolledtext, messagebox
 from fractions import Fraction
 import re
 from collections import defaultdict
+from advanced_neural_chemistry import advanced_neural_predictor
+from chemistry_data import STANDARD_POTENTIALS, THERMO_DATA
+from combustion import combustion
+from displacement import displacement_predictor
+from equation_renderer import render_equation
+from ion_exchange import SOLUBILITY_LABELS, ion_exchange_predictor, solubility_groups
 
 class ChemicalEquationSolver:
     def __init__(self, root):
@@ -121,12 +127,6 @@ class ChemicalEquationSolver:
             'Co': [2, 3], 'Ni': [2, 3], 'Ti': [2, 3, 4], 'V': [2, 3, 4, 5]
         }
         
-        # Ряд активности металлов
-        self.metal_activity_series = [
-            'Li', 'K', 'Ba', 'Ca', 'Na', 'Mg', 'Al', 'Mn', 'Zn', 'Cr',
-            'Fe', 'Cd', 'Co', 'Ni', 'Sn', 'Pb', 'H', 'Cu', 'Hg', 'Ag', 'Pt', 'Au'
-        ]
-        
         # Анионы
         self.anions = {
             'Cl': 'хлорид', 'Br': 'бромид', 'I': 'иодид', 'F': 'фторид',
@@ -532,59 +532,17 @@ class ChemicalEquationSolver:
     # Расширенные функции для предсказания реакций
     def metal_acid_reaction(self, metal, acid):
         """Металл + кислота"""
-        acid_upper = acid.upper()
-        if 'HCL' in acid_upper or (acid_upper.startswith('H') and 'CL' in acid_upper):
-            anion = 'Cl'
-        elif 'H2SO4' in acid_upper or 'SO4' in acid_upper:
-            anion = 'SO4'
-        elif 'HNO3' in acid_upper or 'NO3' in acid_upper:
-            anion = 'NO3'
-        elif 'HBR' in acid_upper:
-            anion = 'Br'
-        elif 'HI' in acid_upper:
-            anion = 'I'
-        else:
-            anion = 'Cl'
-        
-        if metal in self.metals:
-            valency = self.metals[metal]
-            if isinstance(valency, list):
-                valency = valency[0]
-        else:
-            valency = 1
-        
-        if anion in ['Cl', 'Br', 'I', 'F']:
-            salt = f"{metal}{anion}{valency}" if valency > 1 else f"{metal}{anion}"
-        elif anion == 'SO4':
-            salt = f"{metal}{anion}" if valency == 2 else f"{metal}2({anion})" if valency == 1 else f"{metal}2({anion})3"
-        elif anion == 'NO3':
-            salt = f"{metal}({anion}){valency}" if valency > 1 else f"{metal}{anion}"
-        else:
-            salt = f"{metal}({anion}){valency}" if valency > 1 else f"{metal}{anion}"
-        
-        if metal in self.metal_activity_series:
-            metal_pos = self.metal_activity_series.index(metal)
-            h_pos = self.metal_activity_series.index('H')
-            if metal_pos < h_pos:
-                return [salt, "H2"]
-        return [salt]
+        return self.displacement_products(metal, acid)
     
     def metal_salt_reaction(self, metal, salt):
         """Металл + соль (вытеснение)"""
-        salt_metal = salt[0] if salt[0].isupper() else salt[:2]
-        if salt_metal in self.metal_activity_series and metal in self.metal_activity_series:
-            metal_pos = self.metal_activity_series.index(metal)
-            salt_metal_pos = self.metal_activity_series.index(salt_metal)
-            if metal_pos < salt_metal_pos:
-                anion = salt.replace(salt_metal, '').strip()
-                if metal in self.metals:
-                    valency = self.metals[metal]
-                    if isinstance(valency, list):
-                        valency = valency[0]
-                else:
-                    valency = 2
-                new_salt = f"{metal}{anion}" if valency == 1 else f"{metal}{anion}{valency}"
-                return [new_salt, salt_metal]
+        return self.displacement_products(metal, salt)
+    
+    def displacement_products(self, metal, other):
+        """Продукты замещения по ряду активности (None, если реакция не идет)"""
+        result = displacement_predictor.predict(metal.strip(), other.strip())
+        if result and result['proceeds']:
+            return result['products']
         return None
     
     def acid_base_reaction(self, acid, base):
@@ -623,25 +581,39 @@ class ChemicalEquationSolver:
     
     def oxide_acid_reaction(self, oxide, acid):
         """Оксид + кислота"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(oxide, acid)
     
     def oxide_base_reaction(self, oxide, base):
         """Оксид + основание"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(oxide, base)
     
     def salt_salt_reaction(self, salt1, salt2):
         """Соль + соль (обмен)"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(salt1, salt2)
+    
+    def exchange_products(self, first, second):
+        """Продукты реакции обмена, если она идет (осадок, газ или вода)"""
+        result = ion_exchange_predictor.predict(first.strip(), second.strip())
+        # Гидролиз требует воды среди реагентов - такие случаи оставляем полному уравнению
+        if result and result['proceeds'] and len(result['reactants']) == 2:
+            return result['products']
+        return None
     
     def combustion_reaction(self, organic):
-        """Горение органических соединений"""
-        return ["CO2", "H2O"]
+        """Горение органических соединений: продукты по составу топлива"""
+        result = combustion(organic)
+        return result['products'] if result else None
     
     def predict_reaction_products(self, reactants):
         """Улучшенное предсказание продуктов реакции"""
         if len(reactants) == 0:
             return None
         
+        # Сначала общий конвейер решения (база знаний, правила, балансировка)
+        prediction = advanced_neural_predictor.predict_reaction(" + ".join(reactants))
+        if prediction:
+            return prediction.split('+')
+        
         reactant_types = [self.identify_compound_type(r) for r in reactants]
         
         # Реакция разложения
@@ -651,7 +623,9 @@ class ChemicalEquationSolver:
         # Реакция соединения
         if len(reactants) == 2:
             if any(t in ['metal', 'hydrogen', 'oxygen', 'oxide'] for t in reactant_types):
-                return self.predict_combination(reactants)
+                combination = self.predict_combination(reactants)
+                if combination:
+                    return combination
         
         # Реакция замещения
         if 'metal' in reactant_types:
@@ -681,6 +655,12 @@ class ChemicalEquationSolver:
             if acid and base:
                 return self.acid_base_reaction(acid, base)
         
+        # Реакция ионного обмена по таблице растворимости
+        if len(reactants) == 2:
+            exchange = self.exchange_products(reactants[0], reactants[1])
+            if exchange:
+                return exchange
+        
         # Горение
         if any('O2' in r.upper() for r in reactants):
             for r in reactants:
@@ -866,88 +846,39 @@ class ChemicalEquationSolver:
             
             if coefficients and all(c > 0 for c in coefficients):
                 coefficients = self.normalize_coefficients(coefficients)
-                
-                if any(c <= 0 for c in coefficients):
-                    coefficients = self.balance_by_trial_optimized(reactant_elements, product_elements, all_elements)
-                
-                if coefficients:
-                    result = "✨ Сбалансированное уравнение:\n\n"
-                    
-                    reactant_parts = []
-                    for i, reactant in enumerate(reactants):
-                        coeff = int(coefficients[i])
-                        if coeff > 1:
-                            reactant_parts.append(f"{coeff}{reactant}")
-                        else:
-                            reactant_parts.append(reactant)
-                    
-                    result += " + ".join(reactant_parts)
-                    result += " → "
-                    
-                    product_parts = []
-                    for i, product in enumerate(products):
-                        coeff = int(coefficients[num_reactants + i])
-                        if coeff > 1:
-                            product_parts.append(f"{coeff}{product}")
-                        else:
-                            product_parts.append(product)
-                    
-                    result += " + ".join(product_parts)
-                    
-                    result += "\n\n✅ Проверка баланса:\n"
-                    for element in sorted(all_elements):
-                        reactant_count = sum(coefficients[i] * reactant_elements[i].get(element, 0) 
-                                           for i in range(num_reactants))
-                        product_count = sum(coefficients[num_reactants + i] * product_elements[i].get(element, 0) 
-                                          for i in range(num_products))
-                        result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
-                    
-                    self.result_text.delete('1.0', tk.END)
-                    self.result_text.insert('1.0', result)
-                else:
-                    messagebox.showerror("Ошибка", "Не удалось сбалансировать уравнение.")
-            else:
+            # Нулевые и отрицательные коэффициенты - не решение, пробуем подбором
+            if coefficients and any(c <= 0 for c in coefficients):
+                coefficients = None
+            if not coefficients:
                 coefficients = self.balance_by_trial_optimized(reactant_elements, product_elements, all_elements)
-                if coefficients:
-                    result = "✨ Сбалансированное уравнение:\n\n"
-                    
-                    reactant_parts = []
-                    for i, reactant in enumerate(reactants):
-                        coeff = int(coefficients[i])
-                        if coeff > 1:
-                            reactant_parts.append(f"{coeff}{reactant}")
-                        else:
-                            reactant_parts.append(reactant)
-                    
-                    result += " + ".join(reactant_parts)
-                    result += " → "
-                    
-                    product_parts = []
-                    for i, product in enumerate(products):
-                        coeff = int(coefficients[num_reactants + i])
-                        if coeff > 1:
-                            product_parts.append(f"{coeff}{product}")
-                        else:
-                            product_parts.append(product)
-                    
-                    result += " + ".join(product_parts)
-                    
-                    result += "\n\n✅ Проверка баланса:\n"
-                    for element in sorted(all_elements):
-                        reactant_count = sum(coefficients[i] * reactant_elements[i].get(element, 0) 
-                                           for i in range(num_reactants))
-                        product_count = sum(coefficients[num_reactants + i] * product_elements[i].get(element, 0) 
-                                          for i in range(num_products))
-                        result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
-                    
-                    self.result_text.delete('1.0', tk.END)
-                    self.result_text.insert('1.0', result)
-                else:
-                    messagebox.showerror("Ошибка", "Не удалось сбалансировать уравнение. Проверьте правильность написания формул.")
+            
+            if coefficients:
+                result = self.format_balanced_result(reactants, products, coefficients,
+                                                     reactant_elements, product_elements, all_elements)
+                self.result_text.delete('1.0', tk.END)
+                self.result_text.insert('1.0', result)
+            else:
+                messagebox.showerror("Ошибка", "Не удалось сбалансировать уравнение. Проверьте правильность написания формул.")
                 
         except Exception as e:
             messagebox.showerror("Ошибка", f"Ошибка при решении: {str(e)}")
     
+    def format_balanced_result(self, reactants, products, coefficients,
+                               reactant_elements, product_elements, all_elements):
+        """Текст результата: уравнение и проверка баланса по элементам"""
+        coefficients = [int(c) for c in coefficients]
+        num_reactants = len(reactants)
+        
+        result = "✨ Сбалансированное уравнение:\n\n"
+        result += render_equation(reactants, products, coefficients)
+        
+        result += "\n\n✅ Проверка баланса:\n"
+        for element in sorted(all_elements):
+            reactant_count = sum(c * e.get(element, 0) for c, e in zip(coefficients, reactant_elements))
+            product_count = sum(c * e.get(element, 0) for c, e in zip(coefficients[num_reactants:], product_elements))
+            result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
+        return result
+    
     def solve_system_fast(self, matrix, num_vars):
         """Оптимизированное решение системы уравнений"""
         if not matrix or not matrix[0]:
@@ -1216,14 +1147,12 @@ class ChemicalEquationSolver:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
+        # Строки строятся из той же таблицы, что и предсказание реакций
+        colors = {'Р': "#10b981", 'М': "#f59e0b", 'Н': "#ef4444", '-': "#6b7280"}
         solubility_table = [
-            ("Li⁺", "Все анионы", "Растворимо", "#10b981"),
-            ("Na⁺", "Все анионы", "Растворимо", "#10b981"),
-            ("K⁺", "Все анионы", "Растворимо", "#10b981"),
-            ("Ag⁺", "NO₃⁻, ClO₄⁻", "Растворимо", "#10b981"),
-            ("Ag⁺", "Cl⁻, Br⁻, I⁻", "Нерастворимо", "#ef4444"),
-            ("Ba²⁺", "SO₄²⁻", "Нерастворимо", "#ef4444"),
-            ("Ca²⁺", "SO₄²⁻", "Малорастворимо", "#f59e0b"),
+            (cation, ', '.join(groups[mark]), SOLUBILITY_LABELS[mark], colors[mark])
+            for cation, groups in solubility_groups()
+            for mark in SOLUBILITY_LABELS if mark in groups
         ]
         
         header_frame_table = tk.Frame(scrollable_frame, bg=self.colors['primary_dark'])
@@ -1460,6 +1389,15 @@ Li > K > Ba > Ca > Na > Mg > Al > Mn > Zn > Cr > Fe > Cd > Co > Ni
                 ("Универсальная газовая постоянная", "R", "8.314", "Дж/(моль·К)"),
                 ("Молярный объем газа (н.у.)", "Vm", "22.4", "л/моль"),
             ],
+            "Термохимические данные (298 K)": [
+                (f"ΔHf° / S° {formula}", formula, f"{THERMO_DATA[formula][0]} / {THERMO_DATA[formula][1]}",
+                 "кДж/моль / Дж/(моль·К)")
+                for formula in ('H2O', 'CO2', 'CO', 'CH4', 'NH3', 'SO2', 'NaCl', 'CaO', 'CaCO3', 'Fe2O3')
+            ],
+            "Стандартные электродные потенциалы": [
+                (f"{oxidized} + {electrons}e⁻ → {reduced}", f"E°({oxidized}/{reduced})", f"{value:+.2f}", "В")
+                for oxidized, reduced, electrons, value in STANDARD_POTENTIALS
+            ],
         }
         
         y_pos = 15
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Общие химические утилиты: разбор формул, тип соединения и балансировка
+Результаты разбора кэшируются, поэтому повторные формулы не парсятся заново
+"""
+
+import re
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+from chemistry_data import ACIDS, BASES, ELEMENT_SYMBOLS, NONMETALS, NONMETAL_MOLECULES
+from equation_renderer import render_equation
+
+COEFFICIENT_RE = re.compile(r'^\s*(\d+)\s*(.*)$')
+KNOWN_SYMBOLS = frozenset(ELEMENT_SYMBOLS)
+
+
+def split_coefficient(term):
+    """'2H2O' -> (2, 'H2O')"""
+    match = COEFFICIENT_RE.match(term)
+    if match and match.group(2):
+        return int(match.group(1)), match.group(2).strip()
+    return 1, term.strip()
+
+
+@lru_cache(maxsize=4096)
+def _parse_formula_cached(formula):
+    elements = {}
+
+    def parse(f, multiplier):
+        i = 0
+        while i < len(f):
+            if f[i] in '([':
+                depth = 1
+                j = i + 1
+                while j < len(f) and depth > 0:
+                    if f[j] in '([':
+                        depth += 1
+                    elif f[j] in ')]':
+                        depth -= 1
+                    j += 1
+
+                inner = f[i+1:j-1]
+                k = j
+                while k < len(f) and f[k].isdigit():
+                    k += 1
+                bracket_mult = int(f[j:k]) if k > j else 1
+
+                parse(inner, multiplier * bracket_mult)
+                i = k
+            elif f[i].isupper():
+                element = f[i]
+                i += 1
+                while i < len(f) and f[i].islower():
+                    element += f[i]
+                    i += 1
+
+                k = i
+                while k < len(f) and f[k].isdigit():
+                    k += 1
+                count = int(f[i:k]) if k > i else 1
+                i = k
+
+                elements[element] = elements.get(element, 0) + count * multiplier
+            else:
+                i += 1
+
+    parse(formula, 1)
+    return tuple(elements.items())
+
+
+def parse_formula(formula):
+    """Состав формулы: 'Al2(SO4)3' -> {'Al': 2, 'S': 3, 'O': 12}"""
+    return dict(_parse_formula_cached(formula.strip()))
+
+
+def is_valid_formula(formula):
+    """Формула состоит только из настоящих символов элементов"""
+    elements = parse_formula(formula)
+    return bool(elements) and all(element in KNOWN_SYMBOLS for element in elements)
+
+
+@lru_cache(maxsize=4096)
+def compound_type(formula):
+    """Определяет тип химического соединения по составу"""
+    formula = formula.strip()
+    if formula == 'H2O':
+        return 'water'
+    if formula in NONMETAL_MOLECULES:
+        if formula == 'H2':
+            return 'hydrogen'
+        if formula == 'O2':
+            return 'oxygen'
+        return 'nonmetal'
+    if formula in ACIDS:
+        return 'acid'
+    if formula in BASES:
+        return 'base'
+
+    elements = parse_formula(formula)
+    if not elements:
+        return 'unknown'
+
+    metals = [element for element in elements if element not in NONMETALS]
+    if len(elements) == 1:
+        return 'metal' if metals else 'nonmetal'
+
+    if 'C' in elements and 'H' in elements and not metals:
+        return 'organic'
+    if formula.startswith('H') and not metals:
+        return 'acid'
+    if 'OH' in formula and (metals or formula.startswith('NH4')):
+        return 'base'
+    if 'O' in elements and len(elements) == 2:
+        return 'oxide'
+    if metals or formula.startswith('NH4'):
+        return 'salt'
+    return 'unknown'
+
+
+def balance(reactants, products):
+    """
+    Точная балансировка через нуль-пространство матрицы состава (дроби)
+    Возвращает список целых коэффициентов или None, если решение
+    не единственное или содержит неположительные коэффициенты
+    """
+    species = list(reactants) + list(products)
+    compositions = [parse_formula(s) for s in species]
+    elements = sorted({element for composition in compositions for element in composition})
+    num_reactants = len(reactants)
+    n = len(species)
+
+    rows = [
+        [Fraction(composition.get(element, 0) * (1 if j < num_reactants else -1))
+         for j, composition in enumerate(compositions)]
+        for element in elements
+    ]
+
+    # Приведение к ступенчатому виду
+    pivots = []
+    r = 0
+    for col in range(n):
+        if r == len(rows):
+            break
+        pivot = next((i for i in range(r, len(rows)) if rows[i][col] != 0), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        lead = rows[r][col]
+        rows[r] = [x / lead for x in rows[r]]
+        for i in range(len(rows)):
+            if i != r and rows[i][col] != 0:
+                factor = rows[i][col]
+                rows[i] = [a - factor * b for a, b in zip(rows[i], rows[r])]
+        pivots.append(col)
+        r += 1
+
+    free = [col for col in range(n) if col not in pivots]
+    if len(free) != 1:
+        return None
+
+    solution = [Fraction(0)] * n
+    solution[free[0]] = Fraction(1)
+    for i, col in enumerate(pivots):
+        solution[col] = -rows[i][free[0]]
+
+    lcm = 1
+    for x in solution:
+        lcm = lcm * x.denominator // gcd(lcm, x.denominator)
+    coefficients = [int(x * lcm) for x in solution]
+
+    divisor = 0
+    for c in coefficients:
+        divisor = gcd(divisor, c)
+    coefficients = [c // divisor for c in coefficients]
+
+    if all(c < 0 for c in coefficients):
+        coefficients = [-c for c in coefficients]
+    if any(c <= 0 for c in coefficients):
+        return None
+    return coefficients
+
+
+def search_coefficients(reactants, products, max_coefficient=12, limit=500000):
+    """
+    Ограниченный перебор целых коэффициентов 1..max_coefficient, когда
+    точный метод не дает единственного решения. Возвращает решение с
+    наименьшей суммой коэффициентов или None
+    """
+    species = list(reactants) + list(products)
+    compositions = [parse_formula(s) for s in species]
+    elements = sorted({element for composition in compositions for element in composition})
+    n = len(species)
+
+    # Число вариантов не превышает limit
+    while max_coefficient > 1 and max_coefficient ** n > limit:
+        max_coefficient -= 1
+    if max_coefficient ** n > limit:
+        return None
+
+    signs = np.array([1] * len(reactants) + [-1] * len(products))
+    matrix = np.array([[composition.get(element, 0) for composition in compositions]
+                       for element in elements]) * signs
+
+    grid = np.indices((max_coefficient,) * n).reshape(n, -1).T + 1
+    balanced = grid[~(grid @ matrix.T).any(axis=1)]
+    if not len(balanced):
+        return None
+    best = balanced[balanced.sum(axis=1).argmin()]
+
+    divisor = 0
+    for c in best:
+        divisor = gcd(divisor, int(c))
+    return [int(c) // divisor for c in best]
+
+
+def format_equation(reactants, products, coefficients=None, marks=None):
+    """Строка уравнения: '2Na + Cl2 → 2NaCl', marks - {формула: '↓'/'↑'}"""
+    return render_equation(reactants, products, coefficients, marks, 'plain')
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Общие справочные данные по химическим элементам и соединениям
+Таблицы строятся один раз при импорте и используются всеми модулями
+"""
+
+# Символы всех 118 элементов в порядке атомного номера
+ELEMENT_SYMBOLS = (
+    'H', 'He',
+    'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
+    'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar',
+    'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn',
+    'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr',
+    'Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd',
+    'In', 'Sn', 'Sb', 'Te', 'I', 'Xe',
+    'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy',
+    'Ho', 'Er', 'Tm', 'Yb', 'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt',
+    'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn',
+    'Fr', 'Ra', 'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf',
+    'Es', 'Fm', 'Md', 'No', 'Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds',
+    'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og',
+)
+
+# Атомный номер по символу
+ATOMIC_NUMBERS = {symbol: z for z, symbol in enumerate(ELEMENT_SYMBOLS, start=1)}
+
+# Атомные массы элементов
+ATOMIC_MASSES = {
+    'H': 1.008, 'He': 4.003, 'Li': 6.941, 'Be': 9.012, 'B': 10.81,
+    'C': 12.01, 'N': 14.01, 'O': 16.00, 'F': 19.00, 'Ne': 20.18,
+    'Na': 22.99, 'Mg': 24.31, 'Al': 27.00, 'Si': 28.09, 'P': 30.97,
+    'S': 32.07, 'Cl': 35.45, 'Ar': 39.95, 'K': 39.10, 'Ca': 40.08,
+    'Sc': 44.96, 'Ti': 47.87, 'V': 50.94, 'Cr': 52.00, 'Mn': 54.94,
+    'Fe': 55.85, 'Co': 58.93, 'Ni': 58.69, 'Cu': 63.55, 'Zn': 65.38,
+    'Ga': 69.72, 'Ge': 72.64, 'As': 74.92, 'Se': 78.96, 'Br': 79.90,
+    'Kr': 83.80, 'Rb': 85.47, 'Sr': 87.62, 'Y': 88.91, 'Zr': 91.22,
+    'Nb': 92.91, 'Mo': 95.96, 'Tc': 98.00, 'Ru': 101.07, 'Rh': 102.91,
+    'Pd': 106.42, 'Ag': 107.87, 'Cd': 112.41, 'In': 114.82, 'Sn': 118.71,
+    'Sb': 121.76, 'Te': 127.60, 'I': 126.90, 'Xe': 131.29, 'Cs': 132.91,
+    'Ba': 137.33, 'La': 138.91, 'Ce': 140.12, 'Pr': 140.91, 'Nd': 144.24,
+    'Pm': 145.00, 'Sm': 150.36, 'Eu': 151.96, 'Gd': 157.25, 'Tb': 158.93,
+    'Dy': 162.50, 'Ho': 164.93, 'Er': 167.26, 'Tm': 168.93, 'Yb': 173.05,
+    'Lu': 174.97, 'Hf': 178.49, 'Ta': 180.95, 'W': 183.84, 'Re': 186.21,
+    'Os': 190.23, 'Ir': 192.22, 'Pt': 195.08, 'Au': 196.97, 'Hg': 200.59,
+    'Tl': 204.38, 'Pb': 207.2, 'Bi': 208.98, 'Po': 209.00, 'At': 210.00,
+    'Rn': 222.00, 'Fr': 223.00, 'Ra': 226.00, 'Ac': 227.00, 'Th': 232.04,
+    'Pa': 231.04, 'U': 238.03, 'Np': 237.00, 'Pu': 244.00, 'Am': 243.00,
+    'Cm': 247.00, 'Bk': 247.00, 'Cf': 251.00, 'Es': 252.00, 'Fm': 257.00,
+    'Md': 258.00, 'No': 259.00, 'Lr': 266.00, 'Rf': 267.00, 'Db': 268.00,
+    'Sg': 269.00, 'Bh': 270.00, 'Hs': 277.00, 'Mt': 278.00, 'Ds': 281.00,
+    'Rg': 282.00, 'Cn': 285.00, 'Nh': 286.00, 'Fl': 289.00, 'Mc': 290.00,
+    'Lv': 293.00, 'Ts': 294.00, 'Og': 294.00
+}
+
+# Последний атомный номер каждого периода
+PERIOD_ENDS = (2, 10, 18, 36, 54, 86, 118)
+
+
+def _period_and_group(z):
+    """Период и группа (1-18) по атомному номеру; лантаноиды и актиноиды - группа 3"""
+    start = 1
+    for period, end in enumerate(PERIOD_ENDS, start=1):
+        if z <= end:
+            break
+        start = end + 1
+    pos = z - start
+
+    if period == 1:
+        group = 1 if pos == 0 else 18
+    elif period <= 3:
+        group = pos + 1 if pos < 2 else pos + 11
+    elif period <= 5:
+        group = pos + 1
+    else:
+        if pos < 2:
+            group = pos + 1
+        elif pos < 17:
+            group = 3
+        else:
+            group = pos - 13
+    return period, group
+
+
+ELEMENT_PERIODS = {}
+ELEMENT_GROUPS = {}
+for _z, _symbol in enumerate(ELEMENT_SYMBOLS, start=1):
+    ELEMENT_PERIODS[_symbol], ELEMENT_GROUPS[_symbol] = _period_and_group(_z)
+
+# Кислоты
+ACIDS = {
+    'HCl': 'соляная', 'HBr': 'бромоводородная', 'HI': 'иодоводородная',
+    'HNO3': 'азотная', 'H2SO4': 'серная', 'HClO4': 'хлорная',
+    'HF': 'плавиковая', 'H2CO3': 'угольная', 'H2S': 'сероводородная',
+    'H3PO4': 'фосфорная', 'CH3COOH': 'уксусная', 'HCN': 'синильная',
+    'H2SO3': 'сернистая', 'HNO2': 'азотистая', 'H2SiO3': 'кремниевая',
+    'HMnO4': 'марганцовая', 'H2CrO4': 'хромовая', 'H2Cr2O7': 'дихромовая'
+}
+
+# Основания
+BASES = {
+    'LiOH': 'гидроксид лития', 'NaOH': 'гидроксид натрия', 'KOH': 'гидроксид калия',
+    'RbOH': 'гидроксид рубидия', 'CsOH': 'гидроксид цезия', 'Ba(OH)2': 'гидроксид бария',
+    'Ca(OH)2': 'гидроксид кальция', 'Sr(OH)2': 'гидроксид стронция',
+    'NH3': 'аммиак', 'NH4OH': 'гидроксид аммония',
+    'Al(OH)3': 'гидроксид алюминия', 'Fe(OH)2': 'гидроксид железа(II)',
+    'Fe(OH)3': 'гидроксид железа(III)', 'Cu(OH)2': 'гидроксид меди(II)',
+    'Zn(OH)2': 'гидроксид цинка', 'Mg(OH)2': 'гидроксид магния',
+    'Mn(OH)2': 'гидроксид марганца(II)', 'Cr(OH)3': 'гидроксид хрома(III)'
+}
+
+# Металлы с валентностями
+METALS = {
+    'Li': 1, 'Na': 1, 'K': 1, 'Rb': 1, 'Cs': 1, 'Fr': 1,
+    'Be': 2, 'Mg': 2, 'Ca': 2, 'Sr': 2, 'Ba': 2, 'Ra': 2,
+    'Al': 3, 'Zn': 2, 'Cd': 2, 'Fe': [2, 3], 'Cu': [1, 2],
+    'Ag': 1, 'Au': [1, 3], 'Sn': [2, 4], 'Pb': [2, 4],
+    'Hg': [1, 2], 'Cr': [2, 3, 6], 'Mn': [2, 3, 4, 6, 7],
+    'Co': [2, 3], 'Ni': [2, 3], 'Ti': [2, 3, 4], 'V': [2, 3, 4, 5]
+}
+
+# Ряд активности металлов
+METAL_ACTIVITY_SERIES = [
+    'Li', 'Cs', 'Rb', 'K', 'Ra', 'Ba', 'Sr', 'Ca', 'Na', 'Mg', 'Be', 'Al', 'Ti',
+    'Mn', 'V', 'Zn', 'Cr', 'Ga', 'Fe', 'Cd', 'In', 'Tl', 'Co', 'Ni', 'Sn', 'Pb',
+    'H', 'Bi', 'Cu', 'Hg', 'Ag', 'Pd', 'Pt', 'Au'
+]
+
+# Место в ряду активности: чем меньше, тем активнее металл
+ACTIVITY_RANK = {metal: rank for rank, metal in enumerate(METAL_ACTIVITY_SERIES)}
+
+# Заряд иона, который металл образует при вытеснении (Fe -> Fe2+, а не Fe3+)
+DISPLACEMENT_CHARGES = {
+    'Li': 1, 'Cs': 1, 'Rb': 1, 'K': 1, 'Ra': 2, 'Ba': 2, 'Sr': 2, 'Ca': 2, 'Na': 1,
+    'Mg': 2, 'Be': 2, 'Al': 3, 'Ti': 3, 'Mn': 2, 'V': 2, 'Zn': 2, 'Cr': 2, 'Ga': 3,
+    'Fe': 2, 'Cd': 2, 'In': 3, 'Tl': 1, 'Co': 2, 'Ni': 2, 'Sn': 2, 'Pb': 2,
+    'Bi': 3, 'Cu': 2, 'Hg': 2, 'Ag': 1, 'Pd': 2, 'Pt': 2, 'Au': 3
+}
+
+# Анионы
+ANIONS = {
+    'Cl': 'хлорид', 'Br': 'бромид', 'I': 'иодид', 'F': 'фторид',
+    'NO3': 'нитрат', 'SO4': 'сульфат', 'CO3': 'карбонат',
+    'PO4': 'фосфат', 'S': 'сульфид', 'OH': 'гидроксид',
+    'CH3COO': 'ацетат', 'ClO4': 'перхлорат', 'SO3': 'сульфит',
+    'MnO4': 'перманганат', 'CrO4': 'хромат', 'Cr2O7': 'дихромат'
+}
+
+# Простые вещества-неметаллы
+NONMETAL_MOLECULES = ('H2', 'O2', 'N2', 'Cl2', 'F2', 'Br2', 'I2')
+
+# Элементы-неметаллы (остальные считаются металлами)
+NONMETALS = frozenset([
+    'H', 'He', 'B', 'C', 'N', 'O', 'F', 'Ne', 'Si', 'P', 'S', 'Cl', 'Ar',
+    'As', 'Se', 'Br', 'Kr', 'Te', 'I', 'Xe', 'At', 'Rn', 'Ts', 'Og'
+])
+
+# Катионы таблицы растворимости: (символ, заряд)
+SOLUBILITY_CATIONS = (
+    ('H', 1), ('Li', 1), ('K', 1), ('Na', 1), ('NH4', 1),
+    ('Ba', 2), ('Ca', 2), ('Mg', 2), ('Sr', 2), ('Al', 3), ('Cr', 3),
+    ('Fe', 2), ('Fe', 3), ('Ni', 2), ('Co', 2), ('Mn', 2), ('Zn', 2),
+    ('Ag', 1), ('Hg', 2), ('Pb', 2), ('Sn', 2), ('Cu', 2),
+)
+
+# Анионы таблицы растворимости с зарядами
+SOLUBILITY_ANIONS = (
+    ('OH', 1), ('F', 1), ('Cl', 1), ('Br', 1), ('I', 1), ('S', 2), ('SO3', 2),
+    ('SO4', 2), ('NO3', 1), ('PO4', 3), ('CO3', 2), ('SiO3', 2), ('CH3COO', 1),
+)
+
+# Таблица растворимости: строка на катион, символ на анион в порядке SOLUBILITY_ANIONS
+# Р - растворимо, М - малорастворимо, Н - нерастворимо, - - разлагается водой / не существует
+SOLUBILITY_ROWS = (
+    'РРРРРРРРРРРНР',  # H+
+    'РМРРРРРРРМРРР',  # Li+
+    'РРРРРРРРРРРРР',  # K+
+    'РРРРРРРРРРРРР',  # Na+
+    'РРРРРРРРРРРРР',  # NH4+
+    'РМРРРРННРНННР',  # Ba2+
+    'МНРРРМНМРНННР',  # Ca2+
+    'НМРРР-МРРНННР',  # Mg2+
+    'МНРРРРННРНННР',  # Sr2+
+    'НМРРР--РРН-НМ',  # Al3+
+    'НРРРР--РРН-НР',  # Cr3+
+    'ННРРРННРРНННР',  # Fe2+
+    'ННРР---РРН-НР',  # Fe3+
+    'НРРРРННРРНННР',  # Ni2+
+    'НРРРРННРРНННР',  # Co2+
+    'НРРРРННРРНННР',  # Mn2+
+    'НМРРРННРРНННР',  # Zn2+
+    '-РНННННМРНННР',  # Ag+
+    '--РМННН-РНН-Р',  # Hg2+
+    'ННММННННРНННР',  # Pb2+
+    'НРРРМН-Р-Н--Р',  # Sn2+
+    'ННРР-ННРРН-НР',  # Cu2+
+)
+
+CATION_INDEX = {cation: i for i, cation in enumerate(SOLUBILITY_CATIONS)}
+ANION_INDEX = {anion: i for i, (anion, _) in enumerate(SOLUBILITY_ANIONS)}
+ANION_CHARGES = dict(SOLUBILITY_ANIONS)
+SOLUBILITY_MATRIX = tuple(tuple(row) for row in SOLUBILITY_ROWS)
+
+# Названия элементов: символ -> (русские формы, английское название)
+# Формы с беглой гласной (свинец - свинца) перечислены явно
+ELEMENT_NAMES = {
+    'H': (('водород',), 'hydrogen'), 'O': (('кислород',), 'oxygen'),
+    'N': (('азот',), 'nitrogen'), 'C': (('углерод',), 'carbon'),
+    'S': (('сера',), 'sulfur'), 'P': (('фосфор',), 'phosphorus'),
+    'Si': (('кремний',), 'silicon'), 'F': (('фтор',), 'fluorine'),
+    'Cl': (('хлор',), 'chlorine'), 'Br': (('бром',), 'bromine'),
+    'I': (('иод', 'йод'), 'iodine'), 'Li': (('литий',), 'lithium'),
+    'Na': (('натрий',), 'sodium'), 'K': (('калий',), 'potassium'),
+    'Rb': (('рубидий',), 'rubidium'), 'Cs': (('цезий',), 'cesium'),
+    'Be': (('бериллий',), 'beryllium'), 'Mg': (('магний',), 'magnesium'),
+    'Ca': (('кальций',), 'calcium'), 'Sr': (('стронций',), 'strontium'),
+    'Ba': (('барий',), 'barium'), 'Al': (('алюминий',), 'aluminium'),
+    'Zn': (('цинк',), 'zinc'), 'Fe': (('железо',), 'iron'),
+    'Cu': (('медь',), 'copper'), 'Ag': (('серебро',), 'silver'),
+    'Au': (('золото',), 'gold'), 'Pt': (('платина',), 'platinum'),
+    'Hg': (('ртуть',), 'mercury'), 'Pb': (('свинец', 'свинца'), 'lead'),
+    'Sn': (('олово',), 'tin'), 'Cr': (('хром',), 'chromium'),
+    'Mn': (('марганец', 'марганца'), 'manganese'), 'Ni': (('никель',), 'nickel'),
+    'Co': (('кобальт',), 'cobalt'), 'Cd': (('кадмий',), 'cadmium'),
+    'Ti': (('титан',), 'titanium'),
+}
+
+# Простые вещества из двухатомных молекул
+DIATOMIC_ELEMENTS = {'H': 'H2', 'O': 'O2', 'N': 'N2', 'F': 'F2', 'Cl': 'Cl2', 'Br': 'Br2', 'I': 'I2'}
+
+# Английские названия кислот
+ACID_NAMES_EN = {
+    'HCl': 'hydrochloric acid', 'HBr': 'hydrobromic acid', 'HI': 'hydroiodic acid',
+    'HNO3': 'nitric acid', 'H2SO4': 'sulfuric acid', 'HClO4': 'perchloric acid',
+    'HF': 'hydrofluoric acid', 'H2CO3': 'carbonic acid', 'H2S': 'hydrosulfuric acid',
+    'H3PO4': 'phosphoric acid', 'CH3COOH': 'acetic acid', 'HCN': 'hydrocyanic acid',
+    'H2SO3': 'sulfurous acid', 'HNO2': 'nitrous acid', 'H2SiO3': 'silicic acid',
+    'HMnO4': 'permanganic acid', 'H2CrO4': 'chromic acid', 'H2Cr2O7': 'dichromic acid'
+}
+
+# Названия анионов солей: анион -> (русское, английское)
+ANION_NAMES = {
+    'OH': ('гидроксид', 'hydroxide'), 'F': ('фторид', 'fluoride'),
+    'Cl': ('хлорид', 'chloride'), 'Br': ('бромид', 'bromide'),
+    'I': ('иодид', 'iodide'), 'S': ('сульфид', 'sulfide'),
+    'SO3': ('сульфит', 'sulfite'), 'SO4': ('сульфат', 'sulfate'),
+    'NO3': ('нитрат', 'nitrate'), 'PO4': ('фосфат', 'phosphate'),
+    'CO3': ('карбонат', 'carbonate'), 'SiO3': ('силикат', 'silicate'),
+    'CH3COO': ('ацетат', 'acetate')
+}
+
+# Тривиальные названия веществ: формула -> (русские, английские)
+SUBSTANCE_NAMES = {
+    'H2O': (('вода',), ('water',)),
+    'CO2': (('углекислый газ', 'диоксид углерода'), ('carbon dioxide',)),
+    'CO': (('угарный газ', 'монооксид углерода'), ('carbon monoxide',)),
+    'NH3': (('аммиак',), ('ammonia',)),
+    'H2O2': (('пероксид водорода', 'перекись водорода'), ('hydrogen peroxide',)),
+    'CH4': (('метан',), ('methane',)),
+    'C2H6': (('этан',), ('ethane',)),
+    'C3H8': (('пропан',), ('propane',)),
+    'C2H5OH': (('этанол', 'этиловый спирт'), ('ethanol',)),
+    'KMnO4': (('перманганат калия', 'марганцовка'), ('potassium permanganate',)),
+    'MnO2': (('оксид марганца(IV)', 'диоксид марганца'), ('manganese dioxide',)),
+    'SO2': (('сернистый газ', 'оксид серы(IV)'), ('sulfur dioxide',)),
+    'SO3': (('серный ангидрид', 'оксид серы(VI)'), ('sulfur trioxide',)),
+    'CaCO3': (('мел', 'известняк'), ('limestone', 'chalk')),
+    'NaCl': (('поваренная соль',), ('table salt',)),
+}
+
+# Электроотрицательность по Полингу
+ELECTRONEGATIVITY = {
+    'H': 2.20, 'Li': 0.98, 'Be': 1.57, 'B': 2.04, 'C': 2.55, 'N': 3.04, 'O': 3.44, 'F': 3.98,
+    'Na': 0.93, 'Mg': 1.31, 'Al': 1.61, 'Si': 1.90, 'P': 2.19, 'S': 2.58, 'Cl': 3.16,
+    'K': 0.82, 'Ca': 1.00, 'Sc': 1.36, 'Ti': 1.54, 'V': 1.63, 'Cr': 1.66, 'Mn': 1.55,
+    'Fe': 1.83, 'Co': 1.88, 'Ni': 1.91, 'Cu': 1.90, 'Zn': 1.65, 'Ga': 1.81, 'Ge': 2.01,
+    'As': 2.18, 'Se': 2.55, 'Br': 2.96, 'Kr': 3.00, 'Rb': 0.82, 'Sr': 0.95, 'Y': 1.22,
+    'Zr': 1.33, 'Nb': 1.6, 'Mo': 2.16, 'Tc': 1.9, 'Ru': 2.2, 'Rh': 2.28, 'Pd': 2.20,
+    'Ag': 1.93, 'Cd': 1.69, 'In': 1.78, 'Sn': 1.96, 'Sb': 2.05, 'Te': 2.1, 'I': 2.66,
+    'Xe': 2.6, 'Cs': 0.79, 'Ba': 0.89, 'La': 1.10, 'Hf': 1.3, 'Ta': 1.5, 'W': 2.36,
+    'Re': 1.9, 'Os': 2.2, 'Ir': 2.20, 'Pt': 2.28, 'Au': 2.54, 'Hg': 2.00, 'Tl': 1.62,
+    'Pb': 2.33, 'Bi': 2.02, 'Po': 2.0, 'At': 2.2, 'Fr': 0.7, 'Ra': 0.9, 'U': 1.38
+}
+
+# Стандартные энтальпии образования ΔHf° (кДж/моль) и энтропии S° (Дж/(моль·К))
+# при 298.15 K; вещества в стандартном состоянии (H2O - жидкость)
+THERMO_DATA = {
+    'H2': (0.0, 130.7), 'O2': (0.0, 205.2), 'N2': (0.0, 191.6), 'Cl2': (0.0, 223.1),
+    'F2': (0.0, 202.8), 'Br2': (0.0, 152.2), 'I2': (0.0, 116.1), 'O3': (142.7, 238.9),
+    'C': (0.0, 5.7), 'S': (0.0, 32.1), 'P': (0.0, 41.1),
+    'Li': (0.0, 29.1), 'Na': (0.0, 51.3), 'K': (0.0, 64.7), 'Ca': (0.0, 41.6),
+    'Mg': (0.0, 32.7), 'Al': (0.0, 28.3), 'Fe': (0.0, 27.3), 'Cu': (0.0, 33.2),
+    'Zn': (0.0, 41.6), 'Ag': (0.0, 42.6),
+    'H2O': (-285.8, 70.0), 'H2O2': (-187.8, 109.6),
+    'CO': (-110.5, 197.7), 'CO2': (-393.5, 213.8),
+    'CH4': (-74.6, 186.3), 'C2H6': (-84.0, 229.2), 'C2H4': (52.4, 219.3),
+    'C2H2': (227.4, 200.9), 'C3H8': (-103.8, 270.3), 'C4H10': (-125.6, 310.0),
+    'C6H6': (49.1, 173.4), 'CH3OH': (-239.2, 126.8), 'C2H5OH': (-277.6, 160.7),
+    'C6H12O6': (-1273.3, 212.1), 'CH3COOH': (-484.3, 159.8),
+    'NH3': (-45.9, 192.8), 'NO': (91.3, 210.8), 'NO2': (33.2, 240.1),
+    'N2O': (81.6, 220.0), 'N2O4': (11.1, 304.4), 'HNO3': (-174.1, 155.6),
+    'SO2': (-296.8, 248.2), 'SO3': (-395.7, 256.8), 'H2S': (-20.6, 205.8),
+    'H2SO4': (-814.0, 156.9), 'HCl': (-92.3, 186.9), 'HF': (-273.3, 173.8),
+    'HBr': (-36.3, 198.7), 'HI': (26.5, 206.6),
+    'Li2O': (-597.9, 37.6), 'Na2O': (-414.2, 75.1), 'NaCl': (-411.2, 72.1),
+    'NaOH': (-425.8, 64.4), 'Na2CO3': (-1130.7, 135.0), 'NaHCO3': (-950.8, 101.7),
+    'KCl': (-436.5, 82.6), 'KClO3': (-397.7, 143.1), 'KOH': (-424.6, 81.2),
+    'CaO': (-634.9, 38.1), 'CaCO3': (-1207.6, 91.7), 'Ca(OH)2': (-985.2, 83.4),
+    'CaCl2': (-795.4, 108.4), 'MgO': (-601.6, 27.0), 'Al2O3': (-1675.7, 50.9),
+    'FeO': (-272.0, 60.8), 'Fe2O3': (-824.2, 87.4), 'Fe3O4': (-1118.4, 146.4),
+    'CuO': (-157.3, 42.6), 'Cu2O': (-168.6, 93.1), 'CuSO4': (-771.4, 109.2),
+    'ZnO': (-350.5, 43.7), 'ZnCl2': (-415.1, 111.5), 'ZnSO4': (-982.8, 110.5),
+    'AgCl': (-127.0, 96.3), 'BaSO4': (-1473.2, 132.2), 'SiO2': (-910.7, 41.5),
+    'MnO2': (-520.0, 53.1), 'MnCl2': (-481.3, 118.2),
+    'NH4Cl': (-314.4, 94.6), 'NH4NO3': (-365.6, 151.1),
+}
+
+# Константы диссоциации кислот по ступеням (25°C); сильные кислоты - условно большие Ka
+ACID_CONSTANTS = {
+    'HCl': (1e7,), 'HBr': (1e9,), 'HI': (1e10,), 'HNO3': (2.4e1,),
+    'H2SO4': (1e3, 1.2e-2), 'HClO4': (1e10,), 'HF': (6.8e-4,),
+    'H2CO3': (4.5e-7, 4.7e-11), 'H2S': (8.9e-8, 1e-19),
+    'H3PO4': (7.1e-3, 6.3e-8, 4.2e-13), 'CH3COOH': (1.8e-5,), 'HCN': (6.2e-10,),
+    'H2SO3': (1.4e-2, 6.3e-8), 'HNO2': (5.6e-4,), 'H2SiO3': (1.6e-10, 2e-12),
+    'HMnO4': (2e2,), 'H2CrO4': (1.8e-1, 3.2e-7), 'H2Cr2O7': (1e3, 8.5e-1)
+}
+
+# Константы основности слабых оснований (25°C)
+BASE_CONSTANTS = {'NH3': 1.8e-5, 'NH4OH': 1.8e-5}
+
+# Растворимые сильные основания (щелочи)
+STRONG_BASES = frozenset(['LiOH', 'NaOH', 'KOH', 'RbOH', 'CsOH', 'Ba(OH)2', 'Ca(OH)2', 'Sr(OH)2'])
+
+# Ионное произведение воды при 25°C
+KW = 1e-14
+
+# Стандартные электродные потенциалы при 25°C:
+# (окисленная форма, восстановленная форма, число электронов, E°, В)
+STANDARD_POTENTIALS = [
+    ('Li+', 'Li', 1, -3.04), ('Cs+', 'Cs', 1, -3.03), ('Rb+', 'Rb', 1, -2.98),
+    ('K+', 'K', 1, -2.93), ('Ra2+', 'Ra', 2, -2.92), ('Ba2+', 'Ba', 2, -2.91),
+    ('Sr2+', 'Sr', 2, -2.89), ('Ca2+', 'Ca', 2, -2.87), ('Na+', 'Na', 1, -2.71),
+    ('Mg2+', 'Mg', 2, -2.37), ('Be2+', 'Be', 2, -1.85), ('Al3+', 'Al', 3, -1.66),
+    ('Ti3+', 'Ti', 3, -1.37), ('Mn2+', 'Mn', 2, -1.18), ('V2+', 'V', 2, -1.13),
+    ('Cr2+', 'Cr', 2, -0.91), ('H2O', 'H2', 2, -0.83), ('Zn2+', 'Zn', 2, -0.76),
+    ('Cr3+', 'Cr', 3, -0.74), ('Ga3+', 'Ga', 3, -0.53), ('Fe2+', 'Fe', 2, -0.44),
+    ('Cd2+', 'Cd', 2, -0.40), ('In3+', 'In', 3, -0.34), ('Tl+', 'Tl', 1, -0.34),
+    ('Co2+', 'Co', 2, -0.28), ('Ni2+', 'Ni', 2, -0.25), ('Sn2+', 'Sn', 2, -0.14),
+    ('Pb2+', 'Pb', 2, -0.13), ('Fe3+', 'Fe', 3, -0.04), ('H+', 'H2', 2, 0.00),
+    ('S', 'H2S', 2, 0.14), ('Sn4+', 'Sn2+', 2, 0.15), ('Bi3+', 'Bi', 3, 0.31),
+    ('Cu2+', 'Cu', 2, 0.34), ('O2', 'OH-', 4, 0.40), ('Cu+', 'Cu', 1, 0.52),
+    ('I2', 'I-', 2, 0.54), ('O2', 'H2O2', 2, 0.70), ('Fe3+', 'Fe2+', 1, 0.77),
+    ('Ag+', 'Ag', 1, 0.80), ('Hg2+', 'Hg', 2, 0.85), ('Pd2+', 'Pd', 2, 0.95),
+    ('NO3-', 'NO', 3, 0.96), ('Br2', 'Br-', 2, 1.07), ('Pt2+', 'Pt', 2, 1.18),
+    ('O2', 'H2O', 4, 1.23), ('MnO2', 'Mn2+', 2, 1.23), ('Cr2O72-', 'Cr3+', 6, 1.33),
+    ('Cl2', 'Cl-', 2, 1.36), ('Au3+', 'Au', 3, 1.50), ('MnO4-', 'Mn2+', 5, 1.51),
+    ('H2O2', 'H2O', 2, 1.78), ('F2', 'F-', 2, 2.87),
+]
+
+# Постоянная Фарадея, Кл/моль
+FARADAY = 96485
+
+# Произведения растворимости малорастворимых веществ при 25°C
+KSP_DATA = {
+    'AgCl': 1.8e-10, 'AgBr': 5.0e-13, 'AgI': 8.3e-17, 'Ag2CO3': 8.1e-12,
+    'Ag2SO4': 1.2e-5, 'Ag3PO4': 1.3e-20, 'Ag2S': 6.3e-50,
+    'BaSO4': 1.1e-10, 'BaCO3': 5.1e-9, 'CaSO4': 9.1e-6, 'CaCO3': 4.8e-9,
+    'CaF2': 3.9e-11, 'Ca3(PO4)2': 2.0e-29, 'Ca(OH)2': 5.5e-6,
+    'MgCO3': 3.5e-8, 'Mg(OH)2': 5.6e-12, 'PbSO4': 1.6e-8, 'PbCl2': 1.6e-5,
+    'PbI2': 7.1e-9, 'PbS': 8.0e-28, 'Fe(OH)2': 4.8e-16, 'Fe(OH)3': 2.6e-39,
+    'FeS': 5.0e-18, 'Al(OH)3': 1.3e-33, 'Cu(OH)2': 2.2e-20, 'CuS': 6.3e-36,
+    'Zn(OH)2': 1.2e-17, 'ZnS': 1.6e-24,
+}
+
+# Природные изотопы: элемент -> ((точная масса, доля), ...)
+ISOTOPES = {
+    'H': ((1.007825, 0.999885), (2.014102, 0.000115)),
+    'Li': ((6.015123, 0.0759), (7.016004, 0.9241)),
+    'B': ((10.012937, 0.199), (11.009305, 0.801)),
+    'C': ((12.0, 0.9893), (13.003355, 0.0107)),
+    'N': ((14.003074, 0.99636), (15.000109, 0.00364)),
+    'O': ((15.994915, 0.99757), (16.999132, 0.00038), (17.99916, 0.00205)),
+    'F': ((18.998403, 1.0),),
+    'Na': ((22.98977, 1.0),),
+    'Mg': ((23.985042, 0.7899), (24.985837, 0.1), (25.982593, 0.1101)),
+    'Al': ((26.981538, 1.0),),
+    'Si': ((27.976927, 0.922297), (28.976495, 0.046832), (29.97377, 0.030871)),
+    'P': ((30.973762, 1.0),),
+    'S': ((31.972071, 0.9493), (32.971458, 0.0076), (33.967867, 0.0429), (35.967081, 0.0002)),
+    'Cl': ((34.968853, 0.7578), (36.965903, 0.2422)),
+    'K': ((38.963707, 0.932581), (39.963999, 0.000117), (40.961826, 0.067302)),
+    'Ca': ((39.962591, 0.96941), (41.958618, 0.00647), (42.958767, 0.00135),
+           (43.955481, 0.02086), (45.953693, 0.00004), (47.952534, 0.00187)),
+    'Fe': ((53.939615, 0.05845), (55.934942, 0.91754), (56.935399, 0.02119), (57.93328, 0.00282)),
+    'Cu': ((62.929601, 0.6917), (64.927794, 0.3083)),
+    'Zn': ((63.929147, 0.4863), (65.926037, 0.279), (66.927131, 0.041),
+           (67.924848, 0.1875), (69.925325, 0.0062)),
+    'Br': ((78.918338, 0.5069), (80.916291, 0.4931)),
+    'Ag': ((106.905093, 0.51839), (108.904756, 0.48161)),
+    'I': ((126.904468, 1.0),),
+}
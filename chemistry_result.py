@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Структурированный результат решения запроса
+Движок возвращает вещества, коэффициенты, тип реакции, уверенность и
+ступень конвейера; текст для Telegram, HTML или JSON строят рендереры
+"""
+
+from equation_renderer import render_equation
+
+# Виды результатов
+RESULT_KINDS = ('prediction', 'balancing', 'unmatched', 'explanation', 'calculation', 'help')
+
+
+class ChemistryResult:
+    """Ответ на запрос без форматирования"""
+
+    def __init__(self, kind, query, reactants=None, products=None, coefficients=None,
+                 marks=None, proceeds=True, reason='', reaction_type=None,
+                 confidence=0.0, tier=None, components=None, neighbours=None, analogy=None):
+        self.kind = kind
+        self.query = query
+        self.reactants = reactants or []
+        self.products = products or []
+        self.coefficients = coefficients
+        self.marks = marks or {}
+        self.proceeds = proceeds
+        self.reason = reason
+        self.reaction_type = reaction_type
+        self.confidence = confidence
+        self.tier = tier
+        self.components = components or []
+        self.neighbours = neighbours or []
+        self.analogy = analogy
+
+    @classmethod
+    def from_pipeline(cls, kind, query, result, reaction_type=None):
+        """Результат из словаря конвейера решения"""
+        return cls(kind, query,
+                   reactants=result['reactants'],
+                   products=result['products'],
+                   coefficients=result['coefficients'],
+                   marks=result['marks'],
+                   proceeds=result['proceeds'],
+                   reason=result['reason'],
+                   reaction_type=reaction_type or result['reaction_type'],
+                   confidence=result['confidence'],
+                   tier=result['tier'])
+
+    @property
+    def equation(self):
+        """Уравнение реакции ('' если продуктов нет)"""
+        return self.formatted('plain')
+
+    def formatted(self, fmt):
+        """Уравнение в формате equation_renderer (plain, unicode, html, latex, markdown_v2)"""
+        if not self.proceeds:
+            return render_equation(self.reactants, [], fmt=fmt)
+        if not self.products:
+            return ''
+        return render_equation(self.reactants, self.products, self.coefficients, self.marks, fmt)
+
+    def to_dict(self):
+        """Компактный словарь: пустые поля не передаются"""
+        data = {
+            'kind': self.kind,
+            'query': self.query,
+            'reactants': self.reactants,
+            'products': self.products,
+            'coefficients': self.coefficients,
+            'marks': self.marks,
+            'proceeds': self.proceeds,
+            'reason': self.reason,
+            'reaction_type': self.reaction_type,
+            'confidence': round(self.confidence, 2),
+            'tier': self.tier,
+            'components': self.components,
+            'neighbours': self.neighbours,
+            'analogy': self.analogy,
+        }
+        if self.products or not self.proceeds:
+            data['equation'] = self.equation
+        return {key: value for key, value in data.items()
+                if value not in (None, '', [], {}) and not (key == 'proceeds' and value)}
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Горение веществ состава CxHyOzNwSv
+Продукты и коэффициенты считаются по формулам из состава топлива,
+без решения общей системы уравнений
+"""
+
+from math import gcd
+
+from chemistry_core import format_equation, is_valid_formula, parse_formula
+
+FUEL_ELEMENTS = frozenset(['C', 'H', 'O', 'N', 'S'])
+
+
+def combustion(fuel, complete=True):
+    """
+    Горение топлива в кислороде. При неполном горении углерод дает CO.
+    Результат: {'reactants', 'products', 'coefficients', 'complete', 'equation'}
+    или None, если вещество не горит по этой схеме
+    """
+    fuel = fuel.strip()
+    if fuel == 'O2' or not is_valid_formula(fuel):
+        return None
+    elements = parse_formula(fuel)
+    if not elements.keys() <= FUEL_ELEMENTS:
+        return None
+
+    x, y, z, w, v = (elements.get(e, 0) for e in ('C', 'H', 'O', 'N', 'S'))
+
+    # Коэффициенты на 4 молекулы топлива - все они целые
+    products = []
+    if x:
+        products.append(('CO2', 4 * x) if complete else ('CO', 4 * x))
+    if y:
+        products.append(('H2O', 2 * y))
+    if w:
+        products.append(('N2', 2 * w))
+    if v:
+        products.append(('SO2', 4 * v))
+    oxygen = (4 if complete else 2) * x + y + 4 * v - 2 * z
+    if not products or oxygen <= 0:
+        return None
+
+    coefficients = [4, oxygen] + [n for _, n in products]
+    divisor = 0
+    for n in coefficients:
+        divisor = gcd(divisor, n)
+    coefficients = [n // divisor for n in coefficients]
+
+    reactants = [fuel, 'O2']
+    products = [formula for formula, _ in products]
+    return {
+        'reactants': reactants,
+        'products': products,
+        'coefficients': coefficients,
+        'complete': complete,
+        'equation': format_equation(reactants, products, coefficients),
+    }
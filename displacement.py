@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Реакции замещения по электродным потенциалам металлов
+Металл + кислота и металл + соль: реакция идет, если ЭДС пары
+"вытесняемый ион / металл" положительна. Потенциалы берутся из готового
+словаря, продукты собираются из ионов и сразу уравниваются
+"""
+
+from chemistry_core import balance, format_equation
+from chemistry_data import DISPLACEMENT_CHARGES
+from electrochemistry import METAL_POTENTIALS, displacement_cell
+from ion_exchange import GAS, make_compound, solubility, split_ions
+
+# Кислоты-окислители: металл восстанавливает анион, а не водород
+OXIDIZING_ANIONS = frozenset(['NO3'])
+
+# Металлы активнее магния реагируют с водой раствора, а не с солью
+WATER_REACTIVE_POTENTIAL = METAL_POTENTIALS['Mg']
+
+
+class DisplacementPredictor:
+    """Предсказание вытеснения водорода и металлов"""
+
+    def predict(self, metal, other):
+        """
+        Результат: {'reactants', 'products', 'coefficients', 'marks',
+                    'proceeds', 'reason', 'equation'} или None, если
+        пара не относится к реакциям замещения
+        """
+        metal, other = metal.strip(), other.strip()
+        if metal not in METAL_POTENTIALS or metal == 'H':
+            return None
+
+        ions = split_ions(other)
+        if not ions:
+            return None
+        cation, _, anion, _ = ions
+        if anion == 'OH':
+            return None
+
+        if cation[0] == 'H':
+            return self._metal_acid(metal, other, anion)
+        return self._metal_salt(metal, other, cation, anion)
+
+    def _metal_acid(self, metal, acid, anion):
+        """Металл + кислота -> соль + водород"""
+        if anion in OXIDIZING_ANIONS:
+            return None
+
+        reactants = [metal, acid]
+        cell = displacement_cell(metal, 'H')
+        if not cell['spontaneous']:
+            return self._result(reactants, [], {}, False,
+                                f"{metal} стоит в ряду активности правее водорода: {_emf(cell)}")
+
+        cation = (metal, DISPLACEMENT_CHARGES[metal])
+        salt = make_compound(cation, anion)
+        if solubility(cation, anion) == 'Н':
+            return self._result(reactants, [], {}, False,
+                                f"нерастворимая соль {salt} покрывает металл пленкой")
+
+        return self._result(reactants, [salt, 'H2'], {'H2': GAS}, True,
+                            f"{metal} стоит в ряду активности левее водорода: {_emf(cell)}")
+
+    def _metal_salt(self, metal, salt, cation, anion):
+        """Металл + соль -> новая соль + менее активный металл"""
+        salt_metal = cation[0]
+        if salt_metal == metal:
+            return None
+        # Пара строится по настоящему заряду катиона соли: Cr3+/Cr для CrCl3
+        cell = displacement_cell(metal, salt_metal, cation[1])
+        if cell is None:
+            return None
+
+        reactants = [metal, salt]
+        if not cell['spontaneous']:
+            return self._result(reactants, [], {}, False,
+                                f"{metal} не активнее, чем {salt_metal}: {_emf(cell)}")
+        if METAL_POTENTIALS[metal] < WATER_REACTIVE_POTENTIAL:
+            return self._result(reactants, [], {}, False,
+                                f"{metal} реагирует с водой раствора, а не с солью")
+        if solubility(cation, anion) != 'Р':
+            return self._result(reactants, [], {}, False,
+                                f"{salt} нерастворима - вытеснение в растворе невозможно")
+
+        new_salt = make_compound((metal, DISPLACEMENT_CHARGES[metal]), anion)
+        return self._result(reactants, [new_salt, salt_metal], {}, True,
+                            f"{metal} активнее, чем {salt_metal}: {_emf(cell)}")
+
+    def _result(self, reactants, products, marks, proceeds, reason):
+        coefficients = balance(reactants, products) if proceeds else None
+        if proceeds:
+            equation = format_equation(reactants, products, coefficients, marks)
+        else:
+            equation = f"{' + '.join(reactants)} ≠"
+        return {
+            'reactants': reactants,
+            'products': products,
+            'coefficients': coefficients,
+            'marks': marks,
+            'proceeds': proceeds,
+            'reason': reason,
+            'equation': equation,
+        }
+
+
+def _emf(cell):
+    return f"ЭДС {cell['E_cell']:+.2f} В"
+
+
+# Общий экземпляр предсказателя
+displacement_predictor = DisplacementPredictor()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Электродные потенциалы и ЭДС окислительно-восстановительных пар
+Таблица STANDARD_POTENTIALS один раз раскладывается по словарям:
+потенциал полуреакции, металла или все пары с данной частицей находятся
+одним обращением по ключу. ЭДС E = E°(катод) - E°(анод), реакция идет
+самопроизвольно при E > 0 (ΔG° = -nFE < 0)
+"""
+
+import re
+from math import lcm
+
+from chemistry_core import parse_formula, split_coefficient
+from chemistry_data import ANION_CHARGES, DISPLACEMENT_CHARGES, FARADAY, STANDARD_POTENTIALS
+from ion_exchange import split_ions
+
+# Анионы-окислители, которых нет в таблице растворимости: KMnO4, K2Cr2O7
+OXIDIZER_SALT_RE = re.compile(r'^(Li|Na|K)(\d*)(MnO4|Cr2O7)$')
+OXIDIZER_ANION_CHARGES = {'MnO4': 1, 'Cr2O7': 2}
+
+# (окисленная форма, восстановленная форма) -> (число электронов, E°)
+POTENTIALS = {(oxidized, reduced): (electrons, value)
+              for oxidized, reduced, electrons, value in STANDARD_POTENTIALS}
+
+# Пары, где частица - окисленная или восстановленная форма
+COUPLES_BY_OXIDIZED = {}
+COUPLES_BY_REDUCED = {}
+for _oxidized, _reduced, _, _ in STANDARD_POTENTIALS:
+    COUPLES_BY_OXIDIZED.setdefault(_oxidized, []).append((_oxidized, _reduced))
+    COUPLES_BY_REDUCED.setdefault(_reduced, []).append((_oxidized, _reduced))
+
+
+def ion_label(group, charge):
+    """('Zn', 2) -> 'Zn2+', ('Cl', -1) -> 'Cl-'"""
+    size = '' if abs(charge) == 1 else str(abs(charge))
+    return f"{group}{size}{'+' if charge > 0 else '-'}"
+
+
+def metal_couple(metal):
+    """Пара M(n+)/M с зарядом иона, который металл дает при вытеснении; H - 2H+/H2"""
+    if metal == 'H':
+        return 'H+', 'H2'
+    charge = DISPLACEMENT_CHARGES.get(metal)
+    if charge is None:
+        return None
+    couple = (ion_label(metal, charge), metal)
+    return couple if couple in POTENTIALS else None
+
+
+# E° металлов для вытеснения
+METAL_POTENTIALS = {metal: POTENTIALS[metal_couple(metal)][1]
+                    for metal in list(DISPLACEMENT_CHARGES) + ['H'] if metal_couple(metal)}
+
+
+def cell_potential(cathode, anode):
+    """
+    ЭДС пары: на катоде восстанавливается окисленная форма cathode,
+    на аноде окисляется восстановленная форма anode.
+    {'cathode', 'anode', 'E_cell', 'electrons', 'dG', 'spontaneous'} или None
+    """
+    if cathode not in POTENTIALS or anode not in POTENTIALS:
+        return None
+    cathode_electrons, cathode_value = POTENTIALS[cathode]
+    anode_electrons, anode_value = POTENTIALS[anode]
+    value = round(cathode_value - anode_value, 2)
+    electrons = lcm(cathode_electrons, anode_electrons)
+    return {
+        'cathode': cathode,
+        'anode': anode,
+        'E_cell': value,
+        'electrons': electrons,
+        'dG': round(-electrons * FARADAY * value / 1000, 1),
+        'spontaneous': value > 0,
+    }
+
+
+def displacement_cell(metal, displaced, charge=None):
+    """
+    ЭДС вытеснения: metal окисляется, ион displaced (металл или 'H') восстанавливается
+    charge - заряд вытесняемого иона в соли (Cr3+ в CrCl3); по умолчанию - из DISPLACEMENT_CHARGES
+    """
+    anode = metal_couple(metal)
+    if charge is None:
+        cathode = metal_couple(displaced)
+    else:
+        cathode = (ion_label(displaced, charge), displaced)
+    if anode is None or cathode is None:
+        return None
+    return cell_potential(cathode, anode)
+
+
+def species_labels(formula):
+    """Частицы вещества в обозначениях таблицы: 'KMnO4' -> {'KMnO4', 'K+', 'MnO4-'}"""
+    formula = split_coefficient(formula)[1]
+    labels = {formula}
+    if len(parse_formula(formula)) > 1:
+        ions = split_ions(formula)
+        if ions:
+            (cation, charge), _, anion, _ = ions
+            labels.add(ion_label(cation, charge))
+            labels.add(ion_label(anion, -ANION_CHARGES[anion]))
+        match = OXIDIZER_SALT_RE.match(formula)
+        if match:
+            labels.add(ion_label(match.group(1), 1))
+            labels.add(ion_label(match.group(3), -OXIDIZER_ANION_CHARGES[match.group(3)]))
+    return labels
+
+
+def reaction_cell(reactants, products):
+    """
+    ЭДС окислительно-восстановительной реакции по парам из таблицы:
+    окислитель - окисленная форма слева, восстановленная справа; восстановитель - наоборот
+    """
+    left = set().union(*(species_labels(f) for f in reactants))
+    right = set().union(*(species_labels(f) for f in products))
+
+    cathode = next((couple for label in sorted(left - right)
+                    for couple in COUPLES_BY_OXIDIZED.get(label, []) if couple[1] in right), None)
+    anode = next((couple for label in sorted(left)
+                  for couple in COUPLES_BY_REDUCED.get(label, [])
+                  if couple[0] in right and couple[0] not in left and couple != cathode), None)
+    if cathode is None or anode is None:
+        return None
+    return cell_potential(cathode, anode)
+
+
+def format_cell(cell):
+    """Строка для ответа: полуреакции, ЭДС и ΔG°"""
+    (cathode_ox, cathode_red), (anode_ox, anode_red) = cell['cathode'], cell['anode']
+    sign = "✅ идет самопроизвольно" if cell['spontaneous'] else "❌ самопроизвольно не идет"
+    return (f"🔋 Катод: {cathode_ox}/{cathode_red} (E° = {POTENTIALS[cell['cathode']][1]:+.2f} В), "
+            f"анод: {anode_ox}/{anode_red} (E° = {POTENTIALS[cell['anode']][1]:+.2f} В)\n"
+            f"⚡ ЭДС = {cell['E_cell']:+.2f} В, ΔG° = {cell['dG']:.1f} кДж - {sign}")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Электронные конфигурации элементов
+Подуровни заполняются по правилу Клечковского (n + l, затем n), после
+чего применяются известные исключения (Cr, Cu, Pd, лантаноиды и актиноиды).
+Заселенности всех 118 элементов хранятся одной таблицей NumPy, а
+конфигурации, валентные электроны и орбитальные диаграммы считаются один
+раз при импорте - запросы сводятся к поиску в словаре
+"""
+
+import re
+
+import numpy as np
+
+from chemistry_data import ATOMIC_NUMBERS, ELEMENT_GROUPS, ELEMENT_SYMBOLS
+from empirical_formula import element_symbol
+
+SUBSHELL_LETTERS = 'spdf'
+SUPERSCRIPTS = str.maketrans('0123456789', '⁰¹²³⁴⁵⁶⁷⁸⁹')
+NOBLE_GASES = ('He', 'Ne', 'Ar', 'Kr', 'Xe', 'Rn')
+
+# Подуровни в порядке заполнения: 1s 2s 2p 3s 3p 4s 3d ...
+SUBSHELLS = tuple(sorted(((n, l) for n in range(1, 8) for l in range(min(n, 4))),
+                         key=lambda shell: (shell[0] + shell[1], shell[0])))
+SUBSHELLS = SUBSHELLS[:SUBSHELLS.index((7, 1)) + 1]
+SUBSHELL_INDEX = {f"{n}{SUBSHELL_LETTERS[l]}": i for i, (n, l) in enumerate(SUBSHELLS)}
+
+# Отклонения от правила Клечковского: подуровни, заселенность которых другая
+AUFBAU_EXCEPTIONS = {
+    'Cr': {'4s': 1, '3d': 5}, 'Cu': {'4s': 1, '3d': 10},
+    'Nb': {'5s': 1, '4d': 4}, 'Mo': {'5s': 1, '4d': 5}, 'Ru': {'5s': 1, '4d': 7},
+    'Rh': {'5s': 1, '4d': 8}, 'Pd': {'5s': 0, '4d': 10}, 'Ag': {'5s': 1, '4d': 10},
+    'La': {'4f': 0, '5d': 1}, 'Ce': {'4f': 1, '5d': 1}, 'Gd': {'4f': 7, '5d': 1},
+    'Pt': {'6s': 1, '5d': 9}, 'Au': {'6s': 1, '5d': 10},
+    'Ac': {'5f': 0, '6d': 1}, 'Th': {'5f': 0, '6d': 2}, 'Pa': {'5f': 2, '6d': 1},
+    'U': {'5f': 3, '6d': 1}, 'Np': {'5f': 4, '6d': 1}, 'Cm': {'5f': 7, '6d': 1},
+    'Lr': {'6d': 0, '7p': 1},
+}
+
+
+def _build_occupancies():
+    """Таблица (элементы x подуровни) с числом электронов на каждом подуровне"""
+    table = np.zeros((len(ELEMENT_SYMBOLS), len(SUBSHELLS)), dtype=np.uint8)
+    for z, symbol in enumerate(ELEMENT_SYMBOLS, start=1):
+        left = z
+        for i, (_, l) in enumerate(SUBSHELLS):
+            table[z - 1, i] = min(left, 4 * l + 2)
+            left -= table[z - 1, i]
+        for subshell, electrons in AUFBAU_EXCEPTIONS.get(symbol, {}).items():
+            table[z - 1, SUBSHELL_INDEX[subshell]] = electrons
+    return table
+
+
+OCCUPANCIES = _build_occupancies()
+
+
+def _subshell_name(i):
+    n, l = SUBSHELLS[i]
+    return f"{n}{SUBSHELL_LETTERS[l]}"
+
+
+def _write(subshells, row):
+    """'1s2 2s2 2p6' - подуровни по порядку n, затем l"""
+    return ' '.join(f"{_subshell_name(i)}{row[i]}" for i in sorted(subshells, key=lambda i: SUBSHELLS[i]))
+
+
+def _diagram(subshells, row):
+    """Ячейки подуровней по правилу Хунда: сначала по одному ↑, затем ↓"""
+    diagram = []
+    for i in sorted(subshells, key=lambda i: SUBSHELLS[i]):
+        orbitals = 2 * SUBSHELLS[i][1] + 1
+        electrons = int(row[i])
+        boxes = ['↑↓' if k < electrons - orbitals else '↑' if k < electrons else ''
+                 for k in range(orbitals)]
+        diagram.append({'subshell': _subshell_name(i), 'boxes': boxes})
+    return diagram
+
+
+def _describe(z):
+    """Все сведения об элементе: считается один раз при импорте"""
+    symbol = ELEMENT_SYMBOLS[z - 1]
+    row = OCCUPANCIES[z - 1]
+    occupied = [i for i in range(len(SUBSHELLS)) if row[i]]
+
+    core = None
+    for gas in NOBLE_GASES:
+        if ATOMIC_NUMBERS[gas] < z:
+            core = gas
+    core_row = OCCUPANCIES[ATOMIC_NUMBERS[core] - 1] if core else np.zeros_like(row)
+    outer = [i for i in occupied if row[i] > core_row[i]]
+
+    # Валентные - электроны вне ядра благородного газа, кроме заполненных
+    # f-подуровней и d-подуровней у элементов p-блока
+    valence = [i for i in outer
+               if not (SUBSHELLS[i][1] == 3 and row[i] == 14)
+               and not (SUBSHELLS[i][1] == 2 and row[i] == 10 and ELEMENT_GROUPS[symbol] >= 13)]
+
+    diagram = _diagram(outer, row)
+    return {
+        'symbol': symbol,
+        'z': z,
+        'configuration': _write(occupied, row),
+        'short': (f"[{core}] " if core else '') + _write(outer, row),
+        'valence_electrons': int(sum(row[i] for i in valence)),
+        'valence_subshells': [_subshell_name(i) for i in sorted(valence, key=lambda i: SUBSHELLS[i])],
+        'unpaired': sum(box == '↑' for shell in diagram for box in shell['boxes']),
+        'diagram': diagram,
+        'exception': symbol in AUFBAU_EXCEPTIONS,
+    }
+
+
+ELECTRON_CONFIGURATIONS = {symbol: _describe(z) for z, symbol in enumerate(ELEMENT_SYMBOLS, start=1)}
+
+
+def electron_configuration(element):
+    """Конфигурация по символу, названию ('железо', 'iron') или атомному номеру; None, если не найден"""
+    if isinstance(element, int) or str(element).isdecimal():
+        z = int(element)
+        return ELECTRON_CONFIGURATIONS[ELEMENT_SYMBOLS[z - 1]] if 1 <= z <= len(ELEMENT_SYMBOLS) else None
+    symbol = element_symbol(element.strip().capitalize() if len(element.strip()) <= 2 else element.strip())
+    return ELECTRON_CONFIGURATIONS.get(symbol)
+
+
+def superscript(configuration):
+    """'[Ne] 3s2 3p1' -> '[Ne] 3s² 3p¹'"""
+    return re.sub(r'(?<=[spdf])\d+', lambda m: m.group().translate(SUPERSCRIPTS), configuration)
+
+
+def format_diagram(diagram):
+    """Орбитальная диаграмма строками: '3d: [↑↓][↑ ][↑ ][↑ ][↑ ]'"""
+    return '\n'.join(f"{shell['subshell']}: " + ''.join(f"[{box:2}]" for box in shell['boxes'])
+                     for shell in diagram)
+
+
+def format_configuration(info):
+    """Текст для бота: полная и краткая конфигурация, валентные электроны, диаграмма"""
+    response = f"⚛️ {info['symbol']} (Z = {info['z']})\n\n"
+    response += f"🔬 {superscript(info['configuration'])}\n"
+    response += f"📝 Кратко: {superscript(info['short'])}\n"
+    if info['exception']:
+        response += "⚠️ Исключение из правила Клечковского\n"
+    response += f"⚡ Валентные электроны: {info['valence_electrons']} ({', '.join(info['valence_subshells'])})\n"
+    response += f"🧲 Неспаренные электроны: {info['unpaired']}\n\n"
+    response += format_diagram(info['diagram'])
+    return response
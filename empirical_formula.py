@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Простейшая и молекулярная формула по массовым долям элементов
+Доли делятся на атомные массы, мольные отношения нормируются на
+наименьшее, затем перебираются множители 1..MAX_MULTIPLIER, пока все
+отношения не станут целыми с точностью TOLERANCE. Задачи листа решаются
+вместе: отношения всех задач умножаются на все множители одним
+выражением NumPy
+"""
+
+import re
+
+import numpy as np
+
+from chemistry_data import ATOMIC_MASSES, ELECTRONEGATIVITY, ELEMENT_NAMES, ELEMENT_SYMBOLS
+from name_resolver import stem
+
+MAX_MULTIPLIER = 12
+TOLERANCE = 0.1
+
+# Допустимое расхождение молярной массы с кратной простейшей формуле
+MASS_TOLERANCE = 0.03
+
+PERCENT = r'(\d+(?:[.,]\d+)?)\s*%'
+WORD = r'([A-Za-zА-Яа-яЁё]+)'
+COMPONENT_RE = re.compile(rf'{PERCENT}\s*{WORD}|{WORD}\s*[:\-–—]?\s*{PERCENT}')
+MOLAR_MASS_RE = re.compile(r'(?:\bMr?|молярн\w*\s+масс\w*|molar\s+mass)\s*[=:]?\s*(\d+(?:[.,]\d+)?)',
+                           re.IGNORECASE)
+
+# Основы названий элементов: 'углерода' -> 'углерод' -> 'C'
+ELEMENT_STEMS = {}
+for _symbol, (_ru_forms, _en) in ELEMENT_NAMES.items():
+    for _name in _ru_forms + (_en,):
+        ELEMENT_STEMS[stem(_name)] = _symbol
+
+
+def element_symbol(word):
+    """Символ элемента по символу или названию ('C', 'углерода', 'carbon') или None"""
+    if word in ELEMENT_SYMBOLS:
+        return word
+    return ELEMENT_STEMS.get(stem(word))
+
+
+def element_order(elements):
+    """
+    Порядок элементов в формуле: органические вещества (есть C и H) - по
+    Хиллу (C, H, остальные по алфавиту), остальные - по росту
+    электроотрицательности: CaCO3, а не CCaO3
+    """
+    if 'C' in elements and 'H' in elements:
+        return sorted(elements, key=lambda e: (e != 'C', e != 'H', e))
+    return sorted(elements, key=lambda e: (ELECTRONEGATIVITY.get(e, 0), e))
+
+
+def format_counts(counts):
+    """{'Na': 2, 'S': 1, 'O': 4} -> 'Na2SO4'"""
+    return ''.join(f"{e}{counts[e] if counts[e] > 1 else ''}" for e in element_order(counts))
+
+
+def parse_composition(text):
+    """
+    '40% C, 6.7% H, 53.3% O; M = 180' -> ({'C': 40.0, 'H': 6.7, 'O': 53.3}, 180.0)
+    Возвращает None, если в тексте меньше двух элементов или сумма долей не ~100%
+    """
+    composition = {}
+    for match in COMPONENT_RE.finditer(text):
+        percent = match.group(1) or match.group(4)
+        symbol = element_symbol(match.group(2) or match.group(3))
+        if symbol is None:
+            return None
+        composition[symbol] = composition.get(symbol, 0) + float(percent.replace(',', '.'))
+
+    if len(composition) < 2 or abs(sum(composition.values()) - 100) > 2:
+        return None
+    molar_mass = MOLAR_MASS_RE.search(text)
+    return composition, float(molar_mass.group(1).replace(',', '.')) if molar_mass else None
+
+
+def empirical_formulas(compositions, molar_masses=None):
+    """
+    Формулы для листа задач: compositions - [{элемент: %}], molar_masses - [M или None]
+    Результат на задачу: {'ratios', 'counts', 'empirical', 'empirical_mass', 'molecular'}
+    """
+    elements = sorted({element for composition in compositions for element in composition})
+    masses = np.array([ATOMIC_MASSES[element] for element in elements])
+    percents = np.array([[composition.get(element, 0.0) for element in elements]
+                         for composition in compositions])
+
+    # Мольные отношения, нормированные на наименьшее в каждой задаче
+    moles = percents / masses
+    present = percents > 0
+    smallest = np.where(present, moles, np.inf).min(axis=1, keepdims=True)
+    ratios = moles / smallest
+
+    # (задачи x множители x элементы): первый множитель, дающий целые отношения
+    multipliers = np.arange(1, MAX_MULTIPLIER + 1)
+    scaled = ratios[:, np.newaxis, :] * multipliers[np.newaxis, :, np.newaxis]
+    deviation = np.abs(scaled - np.round(scaled)).max(axis=2)
+    fits = deviation <= TOLERANCE
+    choice = np.where(fits.any(axis=1), fits.argmax(axis=1), deviation.argmin(axis=1))
+    counts = np.round(scaled[np.arange(len(compositions)), choice]).astype(int)
+
+    results = []
+    for i, composition in enumerate(compositions):
+        order = element_order([e for e, p in zip(elements, present[i]) if p])
+        formula_counts = {e: int(counts[i, elements.index(e)]) for e in order}
+        empirical_mass = float(sum(ATOMIC_MASSES[e] * c for e, c in formula_counts.items()))
+        result = {
+            'ratios': {e: round(float(ratios[i, elements.index(e)]), 3) for e in order},
+            'counts': formula_counts,
+            'empirical': format_counts(formula_counts),
+            'empirical_mass': round(empirical_mass, 2),
+            'molecular': None,
+        }
+        molar_mass = molar_masses[i] if molar_masses else None
+        if molar_mass:
+            factor = round(molar_mass / empirical_mass)
+            if factor >= 1 and abs(factor * empirical_mass - molar_mass) <= MASS_TOLERANCE * molar_mass:
+                result['molecular'] = format_counts({e: c * factor for e, c in formula_counts.items()})
+        results.append(result)
+    return results
+
+
+def empirical_formula(composition, molar_mass=None):
+    """Формула одной задачи: empirical_formula({'C': 40, 'H': 6.7, 'O': 53.3}, 180)"""
+    return empirical_formulas([composition], [molar_mass])[0]
+
+
+def solve_worksheet(texts):
+    """Лист задач текстом: результат или None для каждой строки"""
+    parsed = [parse_composition(text) for text in texts]
+    valid = [p for p in parsed if p]
+    solved = iter(empirical_formulas([c for c, _ in valid], [m for _, m in valid]) if valid else [])
+    return [next(solved) if p else None for p in parsed]
+
+
+def format_formula_result(composition, result):
+    """Текст для бота: мольные отношения и формулы"""
+    response = "🔬 " + ', '.join(f"{element} {percent:g}%" for element, percent in composition.items())
+    response += "\n\n📊 Мольные отношения: "
+    response += ' : '.join(f"{element} {ratio:g}" for element, ratio in result['ratios'].items())
+    response += f"\n🧪 Простейшая формула: {result['empirical']} (M = {result['empirical_mass']:g} г/моль)"
+    if result['molecular']:
+        response += f"\n⚗️ Молекулярная формула: {result['molecular']}"
+    return response
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Вывод уравнений в разных форматах
+plain - '2H2 + O2 → 2H2O', unicode - '2H₂ + O₂ → 2H₂O', html - H<sub>2</sub>,
+latex - \\mathrm{H_{2}}, markdown_v2 - Unicode с экранированием для Telegram.
+Таблицы замены готовятся один раз, результат запоминается для каждого
+уравнения и формата
+"""
+
+import re
+from functools import lru_cache
+
+FORMATS = ('plain', 'unicode', 'html', 'latex', 'markdown_v2')
+
+SUBSCRIPTS = str.maketrans('0123456789', '₀₁₂₃₄₅₆₇₈₉')
+MARKDOWN_V2_ESCAPES = str.maketrans({c: '\\' + c for c in '_*[]()~`>#+-=|{}.!\\'})
+DIGITS_RE = re.compile(r'(\d+)')
+
+ARROWS = {
+    'plain': ' → ', 'unicode': ' → ', 'html': ' → ',
+    'latex': r' \rightarrow ', 'markdown_v2': ' → ',
+}
+NO_REACTION = {
+    'plain': ' ≠', 'unicode': ' ≠', 'html': ' ≠',
+    'latex': r' \nrightarrow', 'markdown_v2': ' ≠',
+}
+LATEX_MARKS = {'↓': r'\downarrow', '↑': r'\uparrow'}
+
+
+def _formula(formula, fmt):
+    if fmt == 'plain':
+        return formula
+    if fmt in ('unicode', 'markdown_v2'):
+        return formula.translate(SUBSCRIPTS)
+    if fmt == 'html':
+        return DIGITS_RE.sub(r'<sub>\1</sub>', formula)
+    return r'\mathrm{' + DIGITS_RE.sub(r'_{\1}', formula) + '}'
+
+
+def _term(formula, coefficient, mark, fmt):
+    prefix = str(coefficient) if coefficient and coefficient > 1 else ''
+    if fmt == 'latex':
+        prefix = prefix + r'\,' if prefix else ''
+        mark = LATEX_MARKS.get(mark, mark)
+    return f"{prefix}{_formula(formula, fmt)}{mark}"
+
+
+@lru_cache(maxsize=2048)
+def _render(reactants, products, coefficients, marks, fmt):
+    marks = dict(marks)
+    coefficients = coefficients or (None,) * (len(reactants) + len(products))
+    left = " + ".join(_term(f, coefficients[i], marks.get(f, ''), fmt)
+                      for i, f in enumerate(reactants))
+    if not products:
+        text = left + NO_REACTION[fmt]
+    else:
+        offset = len(reactants)
+        right = " + ".join(_term(f, coefficients[offset + i], marks.get(f, ''), fmt)
+                           for i, f in enumerate(products))
+        text = left + ARROWS[fmt] + right
+
+    if fmt == 'markdown_v2':
+        text = text.translate(MARKDOWN_V2_ESCAPES)
+    return text
+
+
+def render_equation(reactants, products, coefficients=None, marks=None, fmt='plain'):
+    """
+    Уравнение в формате fmt. Без продуктов выводится 'A + B ≠'.
+    marks - {формула: '↓'/'↑'}
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат: {fmt}")
+    coefficients = tuple(int(c) for c in coefficients) if coefficients else None
+    return _render(tuple(reactants), tuple(products), coefficients,
+                   tuple(sorted((marks or {}).items())), fmt)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Равновесный состав (таблица ICE) для уравненных реакций
+Для одной реакции ищется степень превращения x: функция
+Σν·ln(c0 + νx) - ln K монотонно растет по x, поэтому корень находится
+бисекцией на отрезке допустимых x. Для системы реакций применяется метод
+Ньютона с аналитическим якобианем Nᵀ·diag(1/c)·N из матрицы
+коэффициентов N. Начальные концентрации могут быть массивами - весь
+набор условий решается одним векторным вызовом
+"""
+
+import numpy as np
+
+from chemistry_core import balance
+
+BISECTION_STEPS = 100
+NEWTON_STEPS = 50
+NEWTON_TOLERANCE = 1e-10
+
+# Доля шага до границы, чтобы концентрации оставались положительными
+BOUNDARY_FRACTION = 0.99
+
+
+def stoichiometry(reactions):
+    """
+    Матрица коэффициентов N (вещества x реакции), реагенты со знаком минус
+    reactions - [(реагенты, продукты, коэффициенты или None)]
+    Возвращает (вещества, N) или None, если уравнение не уравнивается
+    """
+    species = []
+    columns = []
+    for reactants, products, coefficients in reactions:
+        if coefficients is None:
+            coefficients = balance(reactants, products)
+            if coefficients is None:
+                return None
+        column = {}
+        for i, formula in enumerate(list(reactants) + list(products)):
+            if formula not in species:
+                species.append(formula)
+            sign = -1 if i < len(reactants) else 1
+            column[formula] = column.get(formula, 0) + sign * coefficients[i]
+        columns.append(column)
+
+    matrix = np.array([[column.get(formula, 0) for column in columns] for formula in species], dtype=float)
+    return species, matrix
+
+
+def _initial_matrix(species, initial):
+    """Начальные концентрации как массив (условия x вещества)"""
+    columns = [np.asarray(initial.get(formula, 0.0), dtype=float) for formula in species]
+    shape = np.broadcast_shapes(*(c.shape for c in columns))
+    return np.stack([np.broadcast_to(c, shape) for c in columns], axis=-1).reshape(-1, len(species)), shape
+
+
+def _log(concentrations):
+    with np.errstate(divide='ignore'):
+        return np.log(concentrations)
+
+
+def _extent_bisection(nu, c0, log_k):
+    """Степень превращения одной реакции для всех условий сразу (бисекция)"""
+    # Вещества, не участвующие в реакции, в расчет не входят
+    active = nu != 0
+    nu, c0_active = nu[active], c0[:, active]
+    limits = -c0_active / nu
+    low = np.where(nu > 0, limits, -np.inf).max(axis=1)
+    high = np.where(nu < 0, limits, np.inf).min(axis=1)
+
+    # Реакция без продуктов или реагентов в растворе не ограничена с одной стороны
+    span = np.abs(c0_active).sum(axis=1) + 1.0
+    low = np.where(np.isfinite(low), low, -span)
+    high = np.where(np.isfinite(high), high, span)
+
+    for _ in range(BISECTION_STEPS):
+        middle = (low + high) / 2
+        concentrations = np.maximum(c0_active + middle[:, np.newaxis] * nu, 0.0)
+        # Q > K - реакция ушла слишком далеко вправо
+        positive = _log(concentrations) @ nu > log_k
+        high = np.where(positive, middle, high)
+        low = np.where(positive, low, middle)
+    return (low + high) / 2
+
+
+def _newton(matrix, c0, log_k, extents):
+    """Уточнение степеней превращения методом Ньютона для всех условий сразу"""
+    for _ in range(NEWTON_STEPS):
+        concentrations = c0 + extents @ matrix.T
+        safe = np.maximum(concentrations, np.finfo(float).tiny)
+        residual = np.log(safe) @ matrix - log_k
+        if np.max(np.abs(residual)) < NEWTON_TOLERANCE:
+            break
+
+        # J = Nᵀ·diag(1/c)·N для каждого набора условий
+        jacobian = np.einsum('ij,bi,ik->bjk', matrix, 1 / safe, matrix)
+        step = -np.linalg.solve(jacobian, residual[:, :, np.newaxis])[:, :, 0]
+
+        # Шаг укорачивается так, чтобы концентрации остались положительными
+        change = step @ matrix.T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(change < 0, -concentrations / change, np.inf)
+        scale = np.minimum(1.0, BOUNDARY_FRACTION * ratios.min(axis=1))
+        extents = extents + scale[:, np.newaxis] * step
+    return extents
+
+
+def solve_equilibria(reactions, constants, initial):
+    """
+    Равновесный состав системы реакций
+    constants - константы равновесия (по концентрациям), initial - {формула: c0};
+    c0 может быть массивом. Возвращает {'species', 'extents', 'concentrations'}
+    или None, если уравнение не уравнивается
+    """
+    prepared = stoichiometry(reactions)
+    if prepared is None:
+        return None
+    species, matrix = prepared
+    c0, shape = _initial_matrix(species, initial)
+    log_k = np.log(np.asarray(constants, dtype=float))
+
+    # Начальное приближение - реакции по очереди, каждая своей бисекцией
+    extents = np.zeros((len(c0), len(reactions)))
+    current = c0.copy()
+    for j in range(len(reactions)):
+        extents[:, j] = _extent_bisection(matrix[:, j], current, log_k[j])
+        current = c0 + extents @ matrix.T
+    if len(reactions) > 1:
+        extents = _newton(matrix, c0, log_k, extents)
+
+    concentrations = np.maximum(c0 + extents @ matrix.T, 0.0)
+
+    def unpack(values):
+        values = values.reshape(shape)
+        return float(values) if values.ndim == 0 else values
+
+    return {
+        'species': species,
+        'extents': [unpack(extents[:, j]) for j in range(len(reactions))],
+        'concentrations': {formula: unpack(concentrations[:, i]) for i, formula in enumerate(species)},
+    }
+
+
+def equilibrium(reactants, products, constant, initial, coefficients=None):
+    """
+    Равновесие одной реакции:
+    equilibrium(['N2O4'], ['NO2'], 4.6e-3, {'N2O4': 0.1}) -> {'extent': ..., 'concentrations': {...}}
+    """
+    result = solve_equilibria([(reactants, products, coefficients)], [constant], initial)
+    if result is None:
+        return None
+    return {'extent': result['extents'][0], 'concentrations': result['concentrations']}
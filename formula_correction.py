@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Исправление регистра и опечаток в формулах: 'hcl' -> 'HCl', 'Nacl' -> 'NaCl'
+Формула разбивается на символы элементов автоматом по всем 118 символам
+(сначала самый длинный символ, при тупике - откат). Если разбиение не
+дает известного вещества, ищется ближайшее известное вещество
+с ограниченным расстоянием редактирования. Слова строчными буквами без
+цифр исправляются только при точном совпадении с веществом ('hcl')
+"""
+
+import re
+from functools import lru_cache
+
+from chemistry_core import is_valid_formula, split_coefficient
+from chemistry_data import DIATOMIC_ELEMENTS, ELEMENT_NAMES, ELEMENT_SYMBOLS, NONMETAL_MOLECULES
+from ion_exchange import supported_compounds
+from name_resolver import known_names
+
+# Слово из латиницы, похожее на формулу (с коэффициентом и скобками)
+FORMULA_TOKEN_RE = re.compile(r'(?<![\w(])\d*[A-Za-z][A-Za-z0-9()]*')
+
+# Формула записана по правилам: каждая буква входит в символ элемента
+WELL_FORMED_RE = re.compile(r'(?:(?:[A-Z][a-z]?|[()])(?:[1-9]\d*)?)+')
+
+# Сколько разбиений перебирать для одного слова
+MAX_SEGMENTATIONS = 64
+
+_END = '$'
+
+
+def _symbol_trie():
+    root = {}
+    for symbol in ELEMENT_SYMBOLS:
+        node = root
+        for char in symbol.lower():
+            node = node.setdefault(char, {})
+        node[_END] = symbol
+    return root
+
+
+SYMBOL_TRIE = _symbol_trie()
+
+
+def _known_species():
+    species = set(known_names().values())
+    species.update(ELEMENT_NAMES)
+    species.update(DIATOMIC_ELEMENTS.values())
+    species.update(NONMETAL_MOLECULES)
+    for group in supported_compounds():
+        species.update(group)
+    return species
+
+
+KNOWN_SPECIES = frozenset(_known_species())
+
+# Поиск без учета регистра; при совпадении (CO и Co) остается вещество
+# с большим числом символов
+SPECIES_BY_LOWER = {}
+for _formula in sorted(KNOWN_SPECIES, key=lambda f: sum(c.isupper() for c in f)):
+    SPECIES_BY_LOWER[_formula.lower()] = _formula
+
+
+def segmentations(text, limit=MAX_SEGMENTATIONS):
+    """Разбиения слова на символы элементов, длинные символы первыми: 'co' -> ['Co', 'CO']"""
+    text = text.lower()
+    results = []
+
+    def walk(position, parts):
+        if len(results) >= limit:
+            return
+        if position == len(text):
+            results.append(''.join(parts))
+            return
+        char = text[position]
+        if not char.isalpha():
+            walk(position + 1, parts + [char])
+            return
+
+        # Все символы, которые начинаются в этой позиции
+        matches = []
+        node = SYMBOL_TRIE
+        end = position
+        while end < len(text) and text[end] in node:
+            node = node[text[end]]
+            end += 1
+            if _END in node:
+                matches.append((end, node[_END]))
+
+        for end, symbol in reversed(matches):
+            walk(end, parts + [symbol])
+
+    walk(0, [])
+    return results
+
+
+def edit_distance(first, second, bound):
+    """Расстояние Левенштейна или bound + 1, если оно больше bound"""
+    if abs(len(first) - len(second)) > bound:
+        return bound + 1
+    previous = list(range(len(second) + 1))
+    for i, a in enumerate(first, start=1):
+        current = [i]
+        for j, b in enumerate(second, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != b)))
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return previous[-1]
+
+
+def closest_species(text):
+    """Единственное ближайшее известное вещество или None"""
+    if len(text) < 3:
+        return None
+    bound = 1 if len(text) < 6 else 2
+    lowered = text.lower()
+    best, best_distance = [], bound + 1
+    for lower, formula in SPECIES_BY_LOWER.items():
+        distance = edit_distance(lowered, lower, bound)
+        if distance < best_distance:
+            best, best_distance = [formula], distance
+        elif distance == best_distance and distance <= bound:
+            best.append(formula)
+    return best[0] if len(best) == 1 else None
+
+
+@lru_cache(maxsize=4096)
+def correct_formula(term):
+    """Исправленная формула или исходная строка, если исправить нечего"""
+    _, body = split_coefficient(term)
+    prefix = term[:len(term) - len(body)]
+
+    if body in KNOWN_SPECIES:
+        return term
+
+    corrected = SPECIES_BY_LOWER.get(body.lower())
+    # Правильно записанные неизвестные формулы не трогаем ('AgNo3' - опечатка, 'C6H6' - нет)
+    if corrected is None and WELL_FORMED_RE.fullmatch(body) and is_valid_formula(body):
+        return term
+    # Строчное слово без цифр и скобок ('base') - обычное слово, а не формула:
+    # разбиение и поиск опечаток только при подсказке регистром или цифрой
+    if corrected is None and body.isalpha() and body.islower():
+        return term
+    if corrected is None:
+        options = [option for option in segmentations(body) if WELL_FORMED_RE.fullmatch(option)]
+        corrected = next((option for option in options if option in KNOWN_SPECIES), None)
+        # Неизвестное вещество с индексами ('c6h6') - первое разбиение
+        if corrected is None and options and any(char.isdigit() for char in body):
+            corrected = options[0]
+        if corrected is None:
+            corrected = closest_species(body)
+
+    return prefix + corrected if corrected else term
+
+
+def correct_query(query):
+    """Исправление всех похожих на формулы слов запроса"""
+    return FORMULA_TOKEN_RE.sub(lambda match: correct_formula(match.group()), query)
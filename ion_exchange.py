@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Предсказание реакций ионного обмена по таблице растворимости
+Соли, кислоты, основания и оксиды раскладываются на ионы, ионы меняются
+партнерами, а таблица растворимости решает, идет ли реакция
+"""
+
+import itertools
+import json
+import os
+import re
+
+from chemistry_core import balance, format_equation, parse_formula
+from chemistry_data import (ANION_CHARGES, ANION_INDEX, CATION_INDEX, NONMETALS, SOLUBILITY_ANIONS,
+                            SOLUBILITY_CATIONS, SOLUBILITY_MATRIX)
+from equation_renderer import SUBSCRIPTS
+
+# Неустойчивые или малодиссоциирующие продукты: (катион, анион) -> продукты
+DECOMPOSING_PRODUCTS = {
+    ('H', 'OH'): ['H2O'],
+    ('H', 'CO3'): ['H2O', 'CO2'],
+    ('H', 'SO3'): ['H2O', 'SO2'],
+    ('NH4', 'OH'): ['NH3', 'H2O'],
+    ('Ag', 'OH'): ['Ag2O', 'H2O'],
+    ('Hg', 'OH'): ['HgO', 'H2O'],
+}
+
+# Газы, которые уходят из раствора
+GASES = frozenset(['CO2', 'SO2', 'H2S', 'NH3'])
+
+# Слабые кислоты, образование которых тоже сдвигает обмен
+WEAK_ACIDS = frozenset(['CH3COOH', 'HF'])
+
+# Газ, который выделяется при гидролизе соли слабой кислоты ("-" в таблице)
+HYDROLYSIS_GASES = {'S': 'H2S', 'SO3': 'SO2', 'CO3': 'CO2'}
+
+# Кислотные оксиды и соответствующие им анионы
+ACIDIC_OXIDES = {
+    'CO2': 'CO3', 'SO2': 'SO3', 'SO3': 'SO4', 'N2O5': 'NO3',
+    'P2O5': 'PO4', 'SiO2': 'SiO3',
+}
+
+ANION_PATTERN = '|'.join(sorted((re.escape(a) for a in ANION_CHARGES), key=len, reverse=True))
+ION_RE = re.compile(rf'(\(NH4\)|NH4|[A-Z][a-z]?)(\d*)(?:\(({ANION_PATTERN})\)(\d+)|({ANION_PATTERN})(\d*))')
+ACETATE_RE = re.compile(r'\(?CH3COO\)?(\d*)(NH4|[A-Z][a-z]?)')
+
+PRECIPITATE = '↓'
+SUPERSCRIPTS = str.maketrans('0123456789+-', '⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻')
+
+# Обозначения таблицы растворимости во множественном числе
+SOLUBILITY_LABELS = {
+    'Н': 'Нерастворимы', 'М': 'Малорастворимы', 'Р': 'Растворимы',
+    '-': 'Не существуют или разлагаются водой',
+}
+GAS = '↑'
+
+# Заранее рассчитанные реакции обмена (python ion_exchange.py пересоздает файл)
+EXCHANGE_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'exchange_reactions.json')
+
+
+def solubility(cation, anion):
+    """Растворимость из таблицы за O(1): 'Р', 'М', 'Н', '-' или None"""
+    row = CATION_INDEX.get(cation)
+    column = ANION_INDEX.get(anion)
+    if row is None or column is None:
+        return None
+    return SOLUBILITY_MATRIX[row][column]
+
+
+def ion_text(group, charge):
+    """('SO4', -2) -> 'SO₄²⁻'"""
+    size = '' if abs(charge) == 1 else str(abs(charge))
+    return group.translate(SUBSCRIPTS) + (size + ('+' if charge > 0 else '-')).translate(SUPERSCRIPTS)
+
+
+def solubility_groups():
+    """
+    Таблица растворимости по катионам: [(катион, {'Н': [анионы], 'М': [...], ...})]
+    Ионы подписаны с зарядами: 'Ba²⁺', 'SO₄²⁻'
+    """
+    rows = []
+    for cation in SOLUBILITY_CATIONS:
+        groups = {}
+        for anion, charge in SOLUBILITY_ANIONS:
+            groups.setdefault(solubility(cation, anion), []).append(ion_text(anion, -charge))
+        rows.append((ion_text(*cation), groups))
+    return rows
+
+
+def format_solubility_table():
+    """Текст таблицы растворимости для бота: по катионам, затем по анионам"""
+    response = "💧 Таблица растворимости солей в воде:\n\nКАТИОНЫ:\n"
+    for cation, groups in solubility_groups():
+        if set(groups) == {'Р'}:
+            response += f"• {cation} - Все соли растворимы\n"
+            continue
+        parts = [f"{SOLUBILITY_LABELS[mark]}: {', '.join(groups[mark])}" for mark in SOLUBILITY_LABELS
+                 if mark in groups and mark != 'Р']
+        response += f"• {cation} - {'; '.join(parts)}\n"
+
+    response += "\nАНИОНЫ:\n"
+    for column, (anion, charge) in enumerate(SOLUBILITY_ANIONS):
+        insoluble = [ion_text(*cation) for cation, row in zip(SOLUBILITY_CATIONS, SOLUBILITY_MATRIX)
+                     if row[column] == 'Н']
+        text = f"Нерастворимы с {', '.join(insoluble)}" if insoluble else "Нерастворимых солей нет"
+        response += f"• {ion_text(anion, -charge)} - {text}\n"
+    return response.rstrip()
+
+
+def split_ions(formula):
+    """
+    Разложение на ионы: 'Al2(SO4)3' -> (('Al', 3), 2, 'SO4', 3)
+    Возвращает None, если вещество не состоит из известных ионов
+    """
+    formula = formula.strip()
+    if formula == 'CH3COOH':
+        return ('H', 1), 1, 'CH3COO', 1
+
+    match = ACETATE_RE.fullmatch(formula)
+    if match:
+        symbol, cation_count = match.group(2), 1
+        anion, anion_count = 'CH3COO', int(match.group(1) or 1)
+    else:
+        match = ION_RE.fullmatch(formula)
+        if not match:
+            return None
+        symbol = match.group(1).strip('()')
+        cation_count = int(match.group(2) or 1)
+        if match.group(3):
+            anion, anion_count = match.group(3), int(match.group(4))
+        else:
+            anion, anion_count = match.group(5), int(match.group(6) or 1)
+
+    total_charge = ANION_CHARGES[anion] * anion_count
+    if total_charge % cation_count:
+        return None
+    cation = (symbol, total_charge // cation_count)
+    if cation not in CATION_INDEX:
+        return None
+    return cation, cation_count, anion, anion_count
+
+
+def split_basic_oxide(formula):
+    """Основный оксид: 'Fe2O3' -> ('Fe', 3)"""
+    elements = parse_formula(formula)
+    if len(elements) != 2 or 'O' not in elements:
+        return None
+    metal = next(e for e in elements if e != 'O')
+    if metal in NONMETALS:
+        return None
+    charge, remainder = divmod(2 * elements['O'], elements[metal])
+    if remainder or (metal, charge) not in CATION_INDEX:
+        return None
+    return metal, charge
+
+
+def make_compound(cation, anion):
+    """Формула соединения из ионов с учетом зарядов: ('Al', 3) + 'SO4' -> 'Al2(SO4)3'"""
+    symbol, charge = cation
+    anion_charge = ANION_CHARGES[anion]
+    lcm = charge * anion_charge
+    for k in range(max(charge, anion_charge), lcm + 1):
+        if k % charge == 0 and k % anion_charge == 0:
+            lcm = k
+            break
+    cation_count = lcm // charge
+    anion_count = lcm // anion_charge
+
+    if anion == 'CH3COO':
+        if symbol == 'H':
+            return 'CH3COOH'
+        return f"CH3COO{symbol}" if anion_count == 1 else f"(CH3COO){anion_count}{symbol}"
+
+    if cation_count == 1:
+        cation_part = symbol
+    elif symbol == 'NH4':
+        cation_part = f"(NH4){cation_count}"
+    else:
+        cation_part = f"{symbol}{cation_count}"
+
+    if anion_count == 1:
+        anion_part = anion
+    elif len(parse_formula(anion)) == 1 and anion[-1].isalpha():
+        anion_part = f"{anion}{anion_count}"
+    else:
+        anion_part = f"({anion}){anion_count}"
+
+    return cation_part + anion_part
+
+
+def pair_key(first, second):
+    """Ключ пары веществ, не зависящий от порядка"""
+    return '+'.join(sorted((first, second)))
+
+
+def supported_compounds():
+    """Соли, кислоты и основания из таблицы растворимости, которые существуют"""
+    salts, acids, bases = [], [], []
+    for cation in SOLUBILITY_CATIONS:
+        for anion in ANION_CHARGES:
+            if solubility(cation, anion) == '-' or (cation[0], anion) in DECOMPOSING_PRODUCTS:
+                continue
+            formula = make_compound(cation, anion)
+            if cation[0] == 'H':
+                acids.append(formula)
+            elif anion == 'OH':
+                bases.append(formula)
+            else:
+                salts.append(formula)
+    return salts, acids, bases
+
+
+def generate_exchange_table(predictor=None):
+    """
+    Перебор всех пар соль+соль, соль+кислота и соль+основание.
+    В таблицу попадают только идущие реакции, уже уравненные
+    """
+    predictor = predictor or IonExchangePredictor(table={})
+    salts, acids, bases = supported_compounds()
+    pairs = itertools.chain(itertools.combinations(salts, 2),
+                            itertools.product(salts, acids + bases))
+
+    table = {}
+    for first, second in pairs:
+        result = predictor.derive(first, second)
+        if result and result['proceeds']:
+            # Запись: [реагенты, продукты, коэффициенты, отметки, причина]
+            table[pair_key(first, second)] = [result['reactants'], result['products'],
+                                              result['coefficients'], result['marks'],
+                                              result['reason']]
+    return table
+
+
+def save_exchange_table(table, path=EXCHANGE_TABLE_PATH):
+    """Сохранение таблицы: по записи на строку, чтобы изменения были видны в diff"""
+    lines = [f"{json.dumps(key, ensure_ascii=False)}:{json.dumps(table[key], ensure_ascii=False, separators=(',', ':'))}"
+             for key in sorted(table)]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n' + ',\n'.join(lines) + '\n}\n')
+
+
+def load_exchange_table(path=EXCHANGE_TABLE_PATH):
+    """Загрузка таблицы реакций (пустая, если файл не создан)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class IonExchangePredictor:
+    """Предсказание реакций обмена: соль/кислота/основание/оксид в любых парах"""
+
+    def __init__(self, table=None):
+        self.table = load_exchange_table() if table is None else table
+
+    def predict(self, first, second):
+        """
+        Результат: {'reactants', 'products', 'coefficients', 'marks',
+                    'proceeds', 'reason', 'equation'} или None, если
+        вещества не раскладываются на известные ионы
+        """
+        first, second = first.strip(), second.strip()
+
+        # Готовая реакция из таблицы
+        record = self.table.get(pair_key(first, second))
+        if record:
+            return self._from_record(record, first)
+
+        return self.derive(first, second)
+
+    def _from_record(self, record, first):
+        """Результат из записи таблицы в порядке реагентов запроса"""
+        reactants, products, coefficients, marks, reason = record
+        reactants, coefficients = list(reactants), list(coefficients)
+        if reactants[0] != first:
+            reactants[0], reactants[1] = reactants[1], reactants[0]
+            coefficients[0], coefficients[1] = coefficients[1], coefficients[0]
+        return {
+            'reactants': reactants,
+            'products': list(products),
+            'coefficients': coefficients,
+            'marks': dict(marks),
+            'proceeds': True,
+            'reason': reason,
+            'equation': format_equation(reactants, products, coefficients, marks),
+        }
+
+    def derive(self, first, second):
+        """Вывод продуктов по ионам и таблице растворимости"""
+
+        oxide_result = self._predict_with_oxide(first, second)
+        if oxide_result is not None:
+            return oxide_result
+
+        first_ions = split_ions(first)
+        second_ions = split_ions(second)
+        if not first_ions or not second_ions:
+            return None
+
+        (cation_a, _, anion_a, _), (cation_b, _, anion_b, _) = first_ions, second_ions
+        if cation_a == cation_b or anion_a == anion_b:
+            return self._result([first, second], [], {}, False,
+                                "нет обмена: у веществ общий ион")
+
+        # Кислота + кислота и т.п. не обмениваются
+        if cation_a[0] == 'H' and cation_b[0] == 'H':
+            return self._result([first, second], [], {}, False, "две кислоты не реагируют")
+
+        # Соль + соль и соль + основание идут только между растворимыми веществами
+        has_acid = 'H' in (cation_a[0], cation_b[0])
+        if not has_acid:
+            for formula, (cation, _, anion, _) in ((first, first_ions), (second, second_ions)):
+                if solubility(cation, anion) != 'Р':
+                    return self._result([first, second], [], {}, False,
+                                        f"{formula} нерастворимо - обмен в растворе невозможен")
+
+        reactants = [first, second]
+        products, marks, driving = [], {}, []
+        for cation, anion in ((cation_a, anion_b), (cation_b, anion_a)):
+            self._add_product(cation, anion, reactants, products, marks, driving)
+
+        if not driving:
+            return self._result(reactants, products, marks, False,
+                                "все продукты растворимы")
+        return self._result(reactants, products, marks, True, ", ".join(sorted(driving)))
+
+    def _predict_with_oxide(self, first, second):
+        """Основный оксид + кислота, кислотный оксид + основание"""
+        for oxide, other in ((first, second), (second, first)):
+            ions = split_ions(other)
+            if not ions:
+                continue
+            cation, _, anion, _ = ions
+
+            basic = split_basic_oxide(oxide)
+            if basic and cation[0] == 'H':
+                products, marks, driving = [], {}, ['образуется вода']
+                reactants = [first, second]
+                self._add_product(basic, anion, reactants, products, marks, driving)
+                products.append('H2O')
+                return self._result(reactants, products, marks, True, driving[0])
+
+            if oxide in ACIDIC_OXIDES and anion == 'OH':
+                salt_anion = ACIDIC_OXIDES[oxide]
+                products = [make_compound(cation, salt_anion), 'H2O']
+                marks = {}
+                if solubility(cation, salt_anion) in ('Н', 'М'):
+                    marks[products[0]] = PRECIPITATE
+                return self._result([first, second], products, marks, True, 'образуется вода')
+        return None
+
+    def _add_product(self, cation, anion, reactants, products, marks, driving):
+        """Добавляет продукт пары ионов и отмечает осадок/газ/воду"""
+        decomposed = DECOMPOSING_PRODUCTS.get((cation[0], anion))
+        if decomposed:
+            for formula in decomposed:
+                if formula not in products:
+                    products.append(formula)
+                if formula in GASES:
+                    marks[formula] = GAS
+                    driving.append(f"выделяется газ {formula}")
+                elif formula == 'H2O':
+                    driving.append("образуется вода")
+                else:
+                    marks[formula] = PRECIPITATE
+                    driving.append(f"выпадает осадок {formula}")
+            return
+
+        mark = solubility(cation, anion)
+        if mark == '-' and anion in HYDROLYSIS_GASES:
+            # Соль слабой кислоты полностью гидролизуется
+            hydroxide = make_compound(cation, 'OH')
+            gas = HYDROLYSIS_GASES[anion]
+            products.extend([hydroxide, gas])
+            marks[hydroxide] = PRECIPITATE
+            marks[gas] = GAS
+            if 'H2O' not in reactants:
+                reactants.append('H2O')
+            driving.append(f"гидролиз: осадок {hydroxide} и газ {gas}")
+            return
+
+        formula = make_compound(cation, anion)
+        products.append(formula)
+        if formula == 'H2S':
+            marks[formula] = GAS
+            driving.append("выделяется газ H2S")
+        elif formula in WEAK_ACIDS:
+            driving.append(f"образуется слабая кислота {formula}")
+        elif mark in ('Н', 'М'):
+            marks[formula] = PRECIPITATE
+            driving.append(f"выпадает осадок {formula}")
+
+    def _result(self, reactants, products, marks, proceeds, reason):
+        # Соли и осадки первыми, затем вода и газы; порядок не зависит от порядка реагентов
+        products = sorted(products, key=lambda f: (2 if f in GASES else 1 if f == 'H2O' else 0, f))
+        coefficients = balance(reactants, products) if proceeds else None
+        if proceeds:
+            equation = format_equation(reactants, products, coefficients, marks)
+        else:
+            equation = f"{' + '.join(reactants)} ≠"
+        return {
+            'reactants': reactants,
+            'products': products,
+            'coefficients': coefficients,
+            'marks': marks,
+            'proceeds': proceeds,
+            'reason': reason,
+            'equation': equation,
+        }
+
+
+# Общий экземпляр предсказателя
+ion_exchange_predictor = IonExchangePredictor()
+
+
+if __name__ == "__main__":
+    exchange_table = generate_exchange_table()
+    save_exchange_table(exchange_table)
+    print(f"✅ Сохранено реакций: {len(exchange_table)} -> {EXCHANGE_TABLE_PATH}")
+
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Изотопное распределение молекулы
+Распределение элемента - многочлен по номинальной массе: коэффициент при
+степени k - вероятность изотопа с массой k. Распределение n атомов -
+n-я степень многочлена, она считается возведением в квадрат (log n
+сверток NumPy), а распределение вещества - свертка распределений
+элементов. После каждой свертки отбрасываются пики ниже PRUNE_LIMIT.
+Вместе с вероятностями сворачиваются вероятности, умноженные на точную
+массу, поэтому каждый пик получает средневзвешенную точную массу.
+Степени элементов и готовые распределения кэшируются по составу
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from chemistry_core import parse_formula, split_coefficient
+from chemistry_data import ISOTOPES
+
+# Пики с вероятностью ниже этой доли от наибольшего отбрасываются при свертке
+PRUNE_LIMIT = 1e-10
+
+# Порог показа пиков, % от наибольшего
+DEFAULT_THRESHOLD = 0.1
+
+
+def _element_distribution(element):
+    """(номинальная масса первого пика, вероятности, вероятность x точная масса)"""
+    isotopes = ISOTOPES[element]
+    start = round(isotopes[0][0])
+    size = round(isotopes[-1][0]) - start + 1
+    probabilities = np.zeros(size)
+    weighted = np.zeros(size)
+    for mass, abundance in isotopes:
+        probabilities[round(mass) - start] += abundance
+        weighted[round(mass) - start] += abundance * mass
+    return start, probabilities, weighted
+
+
+def _convolve(first, second):
+    """Распределение суммы двух независимых частей с отсечением малых пиков"""
+    start = first[0] + second[0]
+    probabilities = np.convolve(first[1], second[1])
+    weighted = np.convolve(first[2], second[1]) + np.convolve(first[1], second[2])
+
+    keep = np.nonzero(probabilities >= probabilities.max() * PRUNE_LIMIT)[0]
+    low, high = keep[0], keep[-1] + 1
+    return start + low, probabilities[low:high], weighted[low:high]
+
+
+@lru_cache(maxsize=1024)
+def _element_power(element, count):
+    """Распределение count атомов элемента возведением в квадрат"""
+    result = None
+    square = _element_distribution(element)
+    while count:
+        if count & 1:
+            result = square if result is None else _convolve(result, square)
+        count >>= 1
+        if count:
+            square = _convolve(square, square)
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _pattern_cached(composition):
+    result = None
+    for element, count in composition:
+        power = _element_power(element, count)
+        result = power if result is None else _convolve(result, power)
+    return result
+
+
+def isotope_pattern(formula, threshold=DEFAULT_THRESHOLD):
+    """
+    Пики изотопного распределения: [{'mass', 'nominal', 'abundance' (% от наибольшего),
+    'probability'}] или None, если для элемента нет данных об изотопах
+    """
+    composition = parse_formula(split_coefficient(formula)[1])
+    if not composition or any(element not in ISOTOPES for element in composition):
+        return None
+
+    start, probabilities, weighted = _pattern_cached(tuple(sorted(composition.items())))
+    relative = probabilities / probabilities.max() * 100
+    peaks = []
+    for index in np.nonzero(relative >= threshold)[0]:
+        peaks.append({
+            'mass': round(float(weighted[index] / probabilities[index]), 4),
+            'nominal': int(start + index),
+            'abundance': round(float(relative[index]), 2),
+            'probability': float(probabilities[index]),
+        })
+    return peaks
+
+
+def monoisotopic_mass(formula):
+    """Масса молекулы из самых распространенных изотопов"""
+    composition = parse_formula(split_coefficient(formula)[1])
+    if any(element not in ISOTOPES for element in composition):
+        return None
+    return round(sum(max(ISOTOPES[element], key=lambda isotope: isotope[1])[0] * count
+                     for element, count in composition.items()), 4)
+
+
+def format_pattern(formula, peaks, limit=12):
+    """Текст для бота: пики со столбиками"""
+    response = f"📊 Изотопное распределение {formula}:\n\n"
+    for peak in sorted(peaks, key=lambda p: -p['abundance'])[:limit]:
+        bar = '█' * max(1, round(peak['abundance'] / 10))
+        response += f"• {peak['mass']:.4f}: {peak['abundance']:6.2f}% {bar}\n"
+    return response
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Кинетика элементарных механизмов
+Каждая стадия - элементарная реакция со своей константой скорости, ее
+скорость по закону действующих масс k·Πc^ν. Матрица коэффициентов
+собирается разбором уравнений стадий, скорости всех стадий и производные
+всех веществ считаются векторно. Система ОДУ интегрируется методом
+Дормана-Принса 5(4) с адаптивным шагом, точки кривой отдаются
+генератором по мере расчета
+"""
+
+import numpy as np
+
+from chemistry_core import split_coefficient
+from equilibrium import stoichiometry
+from solving_pipeline import normalize_query
+
+RTOL = 1e-6
+ATOL = 1e-10
+MAX_STEPS = 100000
+
+# Наибольшее время моделирования, которое принимают бот и веб-приложение
+MAX_TIME = 1e6
+
+# Таблица Бутчера Дормана-Принса
+DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+DP_B_LOW = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def parse_step(equation):
+    """'2NO + O2 -> 2NO2' -> (['NO', 'O2'], ['NO2'], [2, 1, 2]) или None"""
+    sides = normalize_query(equation).split(' -> ')
+    if len(sides) != 2 or not all(sides):
+        return None
+    terms = [[split_coefficient(term) for term in side.split(' + ')] for side in sides]
+    reactants, products = ([formula for _, formula in side] for side in terms)
+    coefficients = [coefficient for side in terms for coefficient, _ in side]
+    return reactants, products, coefficients
+
+
+class Mechanism:
+    """Набор элементарных стадий с константами скорости"""
+
+    def __init__(self, steps):
+        """steps - [('2NO + O2 -> 2NO2', k), ...]"""
+        if not steps:
+            raise ValueError("Механизм без стадий")
+        reactions = []
+        for equation, _ in steps:
+            step = parse_step(equation)
+            if step is None:
+                raise ValueError(f"Неверная стадия механизма: {equation}")
+            reactions.append(step)
+
+        self.species, self.matrix = stoichiometry(reactions)
+        self.constants = np.array([float(k) for _, k in steps])
+        if not np.all(np.isfinite(self.constants) & (self.constants >= 0)):
+            raise ValueError("Константы скорости должны быть неотрицательными числами")
+
+        # Порядки по веществам - коэффициенты реагентов стадии
+        self.orders = np.zeros_like(self.matrix)
+        index = {formula: i for i, formula in enumerate(self.species)}
+        for j, (reactants, _, coefficients) in enumerate(reactions):
+            for formula, coefficient in zip(reactants, coefficients):
+                self.orders[index[formula], j] += coefficient
+
+    def rates(self, concentrations):
+        """Скорости всех стадий: k·Πc^ν"""
+        return self.constants * np.prod(concentrations[:, np.newaxis] ** self.orders, axis=0)
+
+    def derivatives(self, concentrations):
+        """dc/dt для всех веществ: N·r"""
+        return self.matrix @ self.rates(np.maximum(concentrations, 0.0))
+
+    def initial_vector(self, initial):
+        return np.array([float(initial.get(formula, 0.0)) for formula in self.species])
+
+    def simulate(self, initial, t_end, rtol=RTOL, atol=ATOL, max_step=None):
+        """
+        Генератор точек (t, концентрации) для каждого принятого шага
+        initial - {вещество: c0}; концентрации - массив в порядке self.species
+        """
+        c = self.initial_vector(initial)
+        t = 0.0
+        max_step = max_step or t_end / 10
+        derivative = self.derivatives(c)
+        step = min(max_step, _initial_step(c, derivative, rtol, atol, t_end))
+        yield t, c
+
+        for _ in range(MAX_STEPS):
+            if t >= t_end:
+                return
+            step = min(step, t_end - t)
+            stages = [derivative]
+            for i in range(1, 7):
+                stages.append(self.derivatives(c + step * np.dot(DP_A[i], stages[:i])))
+
+            stages = np.array(stages)
+            proposal = c + step * (DP_B @ stages)
+            error = step * ((DP_B - DP_B_LOW) @ stages)
+            scale = atol + rtol * np.maximum(np.abs(c), np.abs(proposal))
+            norm = np.sqrt(np.mean((error / scale) ** 2))
+
+            if norm <= 1:
+                t += step
+                c = np.maximum(proposal, 0.0)
+                # Последняя стадия схемы - производная в новой точке (FSAL),
+                # если отрицательные концентрации не пришлось обрезать
+                derivative = stages[-1] if np.all(proposal >= 0) else self.derivatives(c)
+                yield t, c
+
+            factor = 5.0 if norm == 0 else min(5.0, max(0.2, 0.9 * norm ** -0.2))
+            step = min(max_step, step * factor)
+
+        raise RuntimeError("Превышено число шагов интегрирования")
+
+
+def _initial_step(c, derivative, rtol, atol, t_end):
+    """Начальный шаг по масштабу концентраций и скоростей"""
+    scale = atol + rtol * np.abs(c)
+    d0 = np.sqrt(np.mean((c / scale) ** 2))
+    d1 = np.sqrt(np.mean((derivative / scale) ** 2))
+    if d0 < 1e-5 or d1 < 1e-5:
+        return 1e-6 * t_end
+    return min(0.01 * d0 / d1, t_end)
+
+
+def simulate(steps, initial, t_end, **options):
+    """Генератор точек для механизма [('A -> B', k), ...]: (t, {вещество: c})"""
+    mechanism = Mechanism(steps)
+    for t, c in mechanism.simulate(initial, t_end, **options):
+        yield float(t), dict(zip(mechanism.species, c.tolist()))
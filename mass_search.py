@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Поиск формул по молярной массе
+Перебор числа атомов идет от тяжелых элементов к легким (метод ветвей и
+границ): ветвь отсекается, если оставшуюся массу нельзя набрать
+оставшимися элементами в их границах или если степень ненасыщенности
+(RDBE) уже не может стать неотрицательной. Число атомов последнего,
+самого легкого элемента не перебирается, а вычисляется из остатка массы
+сразу для всех вариантов предпоследнего элемента
+"""
+
+import re
+from math import floor, isfinite, prod
+
+import numpy as np
+
+from chemistry_data import ATOMIC_MASSES
+from empirical_formula import element_order, format_counts
+
+DEFAULT_ELEMENTS = ('C', 'H', 'N', 'O')
+DEFAULT_TOLERANCE = 0.05
+MAX_RESULTS = 100
+
+# Пределы запроса: перебор не должен занимать больше ~1 с
+MAX_MASS = 2000
+MAX_TOLERANCE = 0.5
+MAX_ELEMENTS = 8
+# Наибольшее число вариантов по всем элементам: перебираемые числа атомов
+# и кандидаты последнего элемента, число атомов которого вычисляется
+MAX_BRANCHES = 3_000_000
+
+# Валентности для RDBE = 1 + Σn(v - 2)/2
+VALENCES = {
+    'C': 4, 'Si': 4, 'N': 3, 'P': 3, 'B': 3, 'O': 2, 'S': 2,
+    'H': 1, 'F': 1, 'Cl': 1, 'Br': 1, 'I': 1, 'Na': 1, 'K': 1,
+}
+
+
+def parse_elements(text):
+    """'CHNOCl' или 'C,H,N,O' -> ('C', 'H', 'N', 'O', 'Cl')"""
+    return tuple(dict.fromkeys(re.findall(r'[A-Z][a-z]?', text)))
+
+
+def rdbe(counts):
+    """Степень ненасыщенности (кольца + двойные связи): C6H6 -> 4"""
+    return 1 + sum(count * (VALENCES[element] - 2) for element, count in counts.items()) / 2
+
+
+def element_bounds(element, bound, most):
+    """
+    Границы (min, max) числа атомов элемента, max не больше most - сколько
+    атомов помещается в массу; ValueError для неверной границы
+    """
+    try:
+        low, high = bound
+        low, high = int(low), most if high is None else int(high)
+    except (TypeError, ValueError):
+        raise ValueError(f"Неверная граница для {element}: {bound!r}") from None
+    if not 0 <= low <= high:
+        raise ValueError(f"Граница для {element} должна быть 0 <= min <= max: {bound!r}")
+    return low, min(high, most)
+
+
+def formulas_for_mass(mass, tolerance=DEFAULT_TOLERANCE, elements=DEFAULT_ELEMENTS, bounds=None,
+                      limit=MAX_RESULTS):
+    """
+    Формулы с молярной массой mass ± tolerance из элементов elements
+    bounds - {элемент: (min, max)}; число атомов в любом случае ограничено массой.
+    Нецелые и отрицательные RDBE отбрасываются.
+    Результат: [{'formula', 'counts', 'mass', 'error', 'rdbe'}] по росту ошибки
+    """
+    if not isfinite(mass) or not 0 < mass <= MAX_MASS:
+        raise ValueError(f"Масса должна быть в пределах (0, {MAX_MASS}] г/моль")
+    if not isfinite(tolerance) or not 0 <= tolerance <= MAX_TOLERANCE:
+        raise ValueError(f"Допуск должен быть в пределах [0, {MAX_TOLERANCE}] г/моль")
+    if not elements or len(elements) > MAX_ELEMENTS:
+        raise ValueError(f"Укажите от 1 до {MAX_ELEMENTS} элементов")
+
+    bounds = bounds or {}
+    # Массы на границе допуска не должны теряться из-за ошибок округления
+    tolerance += 1e-9
+    unknown = [e for e in elements if e not in ATOMIC_MASSES or e not in VALENCES]
+    if unknown:
+        raise ValueError(f"Нет данных для элементов: {', '.join(unknown)}")
+
+    # Тяжелые элементы первыми - у них меньше вариантов
+    order = sorted(elements, key=lambda e: -ATOMIC_MASSES[e])
+    masses = [ATOMIC_MASSES[e] for e in order]
+    halves = [(VALENCES[e] - 2) / 2 for e in order]
+    limits = [element_bounds(e, bounds.get(e, (0, None)), floor((mass + tolerance) / m))
+              for e, m in zip(order, masses)]
+    low = [l for l, _ in limits]
+    high = [h for _, h in limits]
+    # Нижняя граница не помещается в массу - формул нет
+    if any(l > h for l, h in limits):
+        return []
+
+    count = len(order)
+    sizes = [h - l + 1 for l, h in limits]
+    sizes[-1] = min(sizes[-1], floor(2 * tolerance / masses[-1]) + 1)
+    if prod(sizes) > MAX_BRANCHES:
+        raise ValueError("Слишком большой перебор: уменьшите массу или число элементов либо задайте границы")
+
+    # Границы массы и вклада в RDBE для всех элементов начиная с i
+    rest_min = [0.0] * (count + 1)
+    rest_max = [0.0] * (count + 1)
+    rest_rdbe = [0.0] * (count + 1)
+    for i in range(count - 1, -1, -1):
+        rest_min[i] = rest_min[i + 1] + low[i] * masses[i]
+        rest_max[i] = rest_max[i + 1] + high[i] * masses[i]
+        rest_rdbe[i] = rest_rdbe[i + 1] + (high[i] if halves[i] > 0 else low[i]) * halves[i]
+
+    # Ветви, дошедшие до двух последних элементов: (числа атомов, остаток массы, RDBE)
+    leaves = []
+    counts = [0] * count
+
+    def branch(i, remaining, unsaturation):
+        # Остаток массы недостижим или RDBE уже не станет >= 0
+        if remaining < rest_min[i] - tolerance or remaining > rest_max[i] + tolerance:
+            return
+        if unsaturation + rest_rdbe[i] < 0:
+            return
+        if i == count - 2:
+            leaves.append((tuple(counts[:i]), remaining, unsaturation))
+            return
+
+        last = min(high[i], floor((remaining - rest_min[i + 1] + tolerance) / masses[i]))
+        for n in range(low[i], last + 1):
+            counts[i] = n
+            branch(i + 1, remaining - n * masses[i], unsaturation + n * halves[i])
+        counts[i] = 0
+
+    if count == 1:
+        # Простое вещество: число атомов - из массы
+        n = round(mass / masses[0])
+        results = [{order[0]: n}] if low[0] <= n <= high[0] and abs(n * masses[0] - mass) <= tolerance else []
+    else:
+        branch(0, mass, 1.0)
+        results = _close_leaves(leaves, order, masses, halves, low, high, tolerance)
+
+    found = []
+    for formula_counts in results:
+        total = sum(ATOMIC_MASSES[e] * n for e, n in formula_counts.items())
+        formula_counts = {e: formula_counts[e] for e in element_order(formula_counts) if formula_counts[e]}
+        if not formula_counts:
+            continue
+        found.append({
+            'formula': format_counts(formula_counts),
+            'counts': formula_counts,
+            'mass': round(total, 4),
+            'error': round(total - mass, 4),
+            'rdbe': int(rdbe(formula_counts)),
+        })
+    found.sort(key=lambda r: (abs(r['error']), r['formula']))
+    return found[:limit]
+
+
+def _close_leaves(leaves, order, masses, halves, low, high, tolerance):
+    """
+    Два последних элемента для всех ветвей сразу: предпоследний перебирается
+    сеткой, число атомов последнего берется из остатка массы
+    """
+    if not leaves:
+        return []
+    first, second = len(order) - 2, len(order) - 1
+    remaining = np.array([leaf[1] for leaf in leaves])[:, np.newaxis, np.newaxis]
+    unsaturation = np.array([leaf[2] for leaf in leaves])[:, np.newaxis, np.newaxis]
+
+    # (ветви x число атомов предпоследнего x кандидаты последнего)
+    options = np.arange(low[first], high[first] + 1)[np.newaxis, :, np.newaxis]
+    rest = remaining - options * masses[first]
+    shifts = np.arange(floor(2 * tolerance / masses[second]) + 1)[np.newaxis, np.newaxis, :]
+    last = np.ceil((rest - tolerance) / masses[second]) + shifts
+
+    value = unsaturation + options * halves[first] + last * halves[second]
+    valid = ((np.abs(rest - last * masses[second]) <= tolerance)
+             & (last >= low[second]) & (last <= high[second])
+             & (value >= 0) & (value == np.round(value)))
+
+    results = []
+    for leaf, option, shift in zip(*np.nonzero(valid)):
+        numbers = leaves[leaf][0] + (int(options[0, option, 0]), int(last[leaf, option, shift]))
+        results.append(dict(zip(order, numbers)))
+    return results
+
+
+def format_mass_search(mass, results, tolerance=DEFAULT_TOLERANCE):
+    """Текст для бота: найденные формулы"""
+    if not results:
+        return f"❌ Нет формул с M = {mass:g} ± {tolerance:g} г/моль"
+    response = f"🔎 Формулы с M = {mass:g} ± {tolerance:g} г/моль:\n\n"
+    for result in results[:15]:
+        response += f"• {result['formula']}: {result['mass']:.3f} (RDBE = {result['rdbe']})\n"
+    if len(results) > 15:
+        response += f"\n...и еще {len(results) - 15}"
+    return response
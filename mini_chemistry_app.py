@@ -48,8 +48,8 @@ class MiniChemistryApp:
                     print(f"📥 Реагенты: {reactants}")
                     print(f"📤 Продукты: {prediction}")
 
-                    # Предлагаем сбалансировать уравнение
-                    full_equation = f"{reactants} -> {prediction}"
+                    # Уравненная реакция, если коэффициенты находятся однозначно
+                    full_equation = self.predictor.predict_equation(reactants) or f"{reactants} -> {prediction}"
                     print(f"📊 Полное уравнение: {full_equation}")
 
                 else:
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Распознавание названий веществ в запросе (русский и английский)
+Все известные названия хранятся в префиксном дереве по основам слов,
+поэтому падежные формы ("соляной кислотой", "гидроксида натрия")
+совпадают с исходным названием, а многословные названия находятся
+за один проход по запросу слева направо
+"""
+
+import re
+
+from chemistry_data import (ACID_NAMES_EN, ACIDS, ANION_NAMES, BASES, DIATOMIC_ELEMENTS,
+                            ELEMENT_NAMES, METALS, SOLUBILITY_CATIONS, SUBSTANCE_NAMES)
+from ion_exchange import make_compound
+
+# Слово с необязательной валентностью: "железа(II)", "iron (III)"
+WORD_RE = re.compile(r'[a-zа-яё]+(?:\s*\([ivx]+\))?', re.IGNORECASE)
+CYRILLIC_RE = re.compile(r'[а-я]')
+
+# Падежные окончания существительных и прилагательных (длинные первыми)
+ENDINGS = sorted([
+    'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ием', 'ией',
+    'ая', 'яя', 'ой', 'ей', 'ую', 'юю', 'ые', 'ие', 'ый', 'ий', 'ых', 'их', 'ым', 'им',
+    'ом', 'ем', 'ам', 'ям', 'ах', 'ях', 'ия', 'ии', 'ию', 'ью',
+    'ь', 'а', 'я', 'о', 'е', 'у', 'ю', 'ы', 'и', 'й',
+], key=len, reverse=True)
+
+# Связки между веществами, которые заменяются на '+'
+JOINERS = frozenset(['и', 'с', 'со', 'плюс', 'and', 'with', 'plus'])
+
+ROMAN = {1: 'I', 2: 'II', 3: 'III', 4: 'IV', 5: 'V', 6: 'VI', 7: 'VII'}
+
+# Ключ конца названия в узле дерева (основы состоят только из букв)
+_END = '$'
+
+
+def stem(word):
+    """Основа слова: 'кислотой' -> 'кислот', 'железа(II)' -> 'желез(ii)'"""
+    word = word.lower().replace('ё', 'е')
+    base, _, valence = word.partition('(')
+    base = base.strip()
+    if CYRILLIC_RE.search(base):
+        for ending in ENDINGS:
+            if base.endswith(ending) and len(base) - len(ending) >= 2:
+                base = base[:-len(ending)]
+                break
+    return f"{base}({valence}" if valence else base
+
+
+# Существительные женского рода на -ь: родительный падеж на -и
+FEMININE_SOFT = frozenset(['медь', 'ртуть'])
+
+
+def genitive(name):
+    """Родительный падеж названия металла: 'медь' -> 'меди', 'барий' -> 'бария'"""
+    if name.endswith('ий'):
+        return name[:-1] + 'я'
+    if name.endswith('ец'):
+        return name[:-2] + 'ца'
+    if name in FEMININE_SOFT:
+        return name[:-1] + 'и'
+    if name.endswith('ь'):
+        return name[:-1] + 'я'
+    if name.endswith('о'):
+        return name[:-1] + 'а'
+    if name.endswith('а'):
+        return name[:-1] + 'ы'
+    return name + 'а'
+
+
+def oxide(symbol, charge):
+    """Формула оксида металла: ('Al', 3) -> 'Al2O3'"""
+    if charge % 2 == 0:
+        count = charge // 2
+        return f"{symbol}O{count if count > 1 else ''}"
+    return f"{symbol}2O{charge}"
+
+
+def known_names():
+    """Все известные названия: {название: формула}"""
+    names = {}
+
+    for symbol, (forms, english) in ELEMENT_NAMES.items():
+        formula = DIATOMIC_ELEMENTS.get(symbol, symbol)
+        for form in forms:
+            names[form] = formula
+        names[english] = formula
+
+    for formula, adjective in ACIDS.items():
+        names[f"{adjective} кислота"] = formula
+    for formula, english in ACID_NAMES_EN.items():
+        names[english] = formula
+    for formula, name in BASES.items():
+        names[name] = formula
+
+    # Соли и оксиды из катионов таблицы растворимости
+    cation_counts = {}
+    for symbol, _ in SOLUBILITY_CATIONS:
+        cation_counts[symbol] = cation_counts.get(symbol, 0) + 1
+
+    for symbol, charge in SOLUBILITY_CATIONS:
+        if symbol == 'H':
+            continue
+        # Катион в названии соли стоит в родительном падеже: "хлорид меди(II)"
+        if symbol == 'NH4':
+            variants = [(genitive('аммоний'), 'ammonium')]
+        else:
+            forms, english = ELEMENT_NAMES[symbol]
+            name = genitive(forms[0])
+            variants = []
+            if isinstance(METALS.get(symbol), list):
+                variants.append((f"{name}({ROMAN[charge]})", f"{english}({ROMAN[charge]})"))
+            # Без валентности, только если она однозначна
+            if cation_counts[symbol] == 1:
+                variants.append((name, english))
+
+        for cation_ru, cation_en in variants:
+            for anion, (anion_ru, anion_en) in ANION_NAMES.items():
+                formula = make_compound((symbol, charge), anion)
+                names[f"{anion_ru} {cation_ru}"] = formula
+                names[f"{cation_en} {anion_en}"] = formula
+            if symbol != 'NH4':
+                names[f"оксид {cation_ru}"] = oxide(symbol, charge)
+                names[f"{cation_en} oxide"] = oxide(symbol, charge)
+
+    for formula, (russian, english) in SUBSTANCE_NAMES.items():
+        for name in russian + english:
+            names[name] = formula
+
+    return names
+
+
+class NameResolver:
+    """Префиксное дерево по основам слов: название -> формула"""
+
+    def __init__(self, names=None):
+        self.root = {}
+        self.size = 0
+        for name, formula in (known_names() if names is None else names).items():
+            self.add(name, formula)
+
+    def add(self, name, formula):
+        node = self.root
+        for word in WORD_RE.findall(name):
+            node = node.setdefault(stem(word), {})
+        if _END not in node:
+            self.size += 1
+        node[_END] = formula
+
+    def scan(self, text):
+        """Самые длинные названия слева направо: [(начало, конец, формула)]"""
+        tokens = list(WORD_RE.finditer(text))
+        stems = [stem(token.group()) for token in tokens]
+        matches = []
+
+        i = 0
+        while i < len(tokens):
+            node = self.root
+            best = None
+            j = i
+            while j < len(tokens):
+                # Слова одного названия разделены только пробелами
+                if j > i and text[tokens[j - 1].end():tokens[j].start()].strip():
+                    break
+                node = node.get(stems[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    best = (j, node[_END])
+
+            if best:
+                end, formula = best
+                matches.append((tokens[i].start(), tokens[end - 1].end(), formula))
+                i = end
+            else:
+                i += 1
+
+        return matches
+
+    def resolve(self, text):
+        """Названия заменяются формулами: 'цинк и соляная кислота' -> 'Zn + HCl'"""
+        matches = self.scan(text)
+        if not matches:
+            return text
+
+        parts = []
+        position = 0
+        for index, (start, end, formula) in enumerate(matches):
+            gap = text[position:start]
+            if index and gap.strip().lower() in JOINERS:
+                gap = ' + '
+            parts.append(gap)
+            parts.append(formula)
+            position = end
+        parts.append(text[position:])
+        return ''.join(parts)
+
+
+# Общий экземпляр
+name_resolver = NameResolver()
+
+
+def resolve_names(text):
+    """Запрос с формулами вместо названий веществ"""
+    return name_resolver.resolve(text)
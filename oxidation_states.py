@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Степени окисления элементов в веществе
+Правила по приоритету: простое вещество - 0, фтор -1, металлы IA/IIA и
+Al, Zn, Ag, Cd - постоянная степень, водород +1 (-1 только в гидридах
+металлов), далее самый электроотрицательный элемент получает низшую
+степень, последний элемент находится из электронейтральности. Если в
+бинарном соединении металла с O или S металл получает степень выше
+возможной, кислород или сера связаны в пары: пероксид O2(2-) или
+персульфид S2(2-), как в FeS2. Соли разбираются по ионам: в Fe2(SO4)3
+заряд железа берется из катиона, а степень серы считается внутри SO4
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+from chemistry_core import parse_formula, split_coefficient
+from chemistry_data import ANION_CHARGES, ELECTRONEGATIVITY, ELEMENT_GROUPS, NONMETALS
+from ion_exchange import split_ions
+
+# Металлы с постоянной степенью окисления, кроме IA и IIA групп
+FIXED_STATES = {'Al': 3, 'Zn': 2, 'Ag': 1, 'Cd': 2}
+
+# Высшие степени окисления металлов в бинарных соединениях с O и S
+HIGHEST_STATES = {
+    'Fe': 3, 'Co': 3, 'Ni': 3, 'Cu': 2, 'Hg': 2, 'Mn': 7, 'Cr': 6, 'Pb': 4,
+    'Sn': 4, 'Ti': 4, 'V': 5, 'Mo': 6, 'W': 6, 'Au': 3, 'Pt': 4,
+}
+
+# Элементы, образующие пероксидные пары X2(2-)
+PAIRED_ANIONS = ('O', 'S')
+
+
+def _fixed_state(element, composition):
+    if element == 'F':
+        return -1
+    if element == 'H':
+        # -1 только в гидридах металлов: NaH, CaH2; с неметаллами (PH3, SiH4) +1
+        others = [e for e in composition if e != 'H']
+        if others and all(e not in NONMETALS for e in others):
+            return -1
+        return 1
+    if ELEMENT_GROUPS.get(element) in (1, 2):
+        return ELEMENT_GROUPS[element]
+    return FIXED_STATES.get(element)
+
+
+def _lowest_state(element):
+    """Низшая степень окисления неметалла: N -3, S -2, Cl -1; металлы - 0"""
+    group = ELEMENT_GROUPS.get(element)
+    if group and 14 <= group <= 17:
+        return group - 18
+    return 0
+
+
+def _assign(composition, charge):
+    """Степени окисления для частицы с зарядом charge: {элемент: Fraction}"""
+    if len(composition) == 1:
+        element, count = next(iter(composition.items()))
+        return {element: Fraction(charge, count)}
+
+    states = {}
+    for element in composition:
+        state = _fixed_state(element, composition)
+        if state is not None:
+            states[element] = Fraction(state)
+
+    unknown = [element for element in composition if element not in states]
+    while len(unknown) > 1:
+        element = max(unknown, key=lambda e: ELECTRONEGATIVITY.get(e, 0))
+        states[element] = Fraction(_lowest_state(element))
+        unknown.remove(element)
+
+    if unknown:
+        element = unknown[0]
+        known = sum(states[e] * count for e, count in composition.items() if e in states)
+        states[element] = (charge - known) / composition[element]
+
+    return _paired_anion(composition, charge, states)
+
+
+def _paired_anion(composition, charge, states):
+    """FeS2: Fe +4 невозможно, значит сера - персульфид S2(2-): Fe +2, S -1"""
+    if len(composition) != 2:
+        return states
+    metal, anion = sorted(composition, key=lambda e: ELECTRONEGATIVITY.get(e, 0))
+    highest = HIGHEST_STATES.get(metal)
+    if (anion not in PAIRED_ANIONS or highest is None or states[metal] <= highest
+            or composition[anion] % 2):
+        return states
+
+    state = Fraction(charge + composition[anion], composition[metal])
+    if state > highest:
+        return states
+    return {metal: state, anion: Fraction(-1)}
+
+
+@lru_cache(maxsize=4096)
+def _oxidation_states_cached(formula, charge):
+    ions = split_ions(formula) if charge == 0 else None
+    if not ions:
+        return tuple(_assign(parse_formula(formula), charge).items())
+
+    # Катион и анион отдельно; общий элемент получает среднюю степень
+    (cation, cation_charge), cation_count, anion, anion_count = ions
+    totals = {}
+    for group, group_charge, count in ((cation, cation_charge, cation_count),
+                                       (anion, -ANION_CHARGES[anion], anion_count)):
+        composition = parse_formula(group)
+        for element, state in _assign(composition, group_charge).items():
+            atoms = composition[element] * count
+            total, seen = totals.get(element, (0, 0))
+            totals[element] = (total + state * atoms, seen + atoms)
+    return tuple((element, total / atoms) for element, (total, atoms) in totals.items())
+
+
+def oxidation_states(formula, charge=0):
+    """Степени окисления: 'KMnO4' -> {'K': 1, 'Mn': 7, 'O': -2}; Fe3O4 дает Fraction(8, 3)"""
+    states = _oxidation_states_cached(split_coefficient(formula)[1], charge)
+    return {element: int(state) if state.denominator == 1 else state for element, state in states}
+
+
+def state_changes(reactants, products):
+    """
+    Элементы, которые меняют степень окисления, за один проход по обеим частям:
+    {элемент: (степени слева, степени справа)}
+    """
+    sides = ({}, {})
+    for side, species in zip(sides, (reactants, products)):
+        for formula in species:
+            for element, state in oxidation_states(formula).items():
+                side.setdefault(element, set()).add(state)
+
+    left, right = sides
+    return {element: (sorted(before), sorted(right[element]))
+            for element, before in left.items()
+            if element in right and before != right[element]}
+
+
+def is_redox(reactants, products):
+    """ОВР - хотя бы один элемент меняет степень окисления"""
+    return bool(state_changes(reactants, products))
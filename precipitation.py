@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Растворимость и осаждение по произведению растворимости
+Для соли MmAn: Ksp = [M]^m·[A]^n. Растворимость в присутствии
+одноименного иона - корень монотонного уравнения
+m·ln(m·s + [M]0) + n·ln(n·s + [A]0) = ln Ksp, который находится
+бисекцией сразу для целой сетки концентраций
+"""
+
+import numpy as np
+
+from chemistry_core import parse_formula
+from chemistry_data import ANION_CHARGES, ATOMIC_MASSES, KSP_DATA
+from electrochemistry import ion_label
+from ion_exchange import split_ions
+
+BISECTION_STEPS = 100
+
+
+def ksp_ions(salt):
+    """'Ag2CO3' -> (('Ag', 1), 2, 'CO3', 1) или None, если для соли нет Ksp"""
+    if salt not in KSP_DATA:
+        return None
+    return split_ions(salt)
+
+
+def molar_mass(formula):
+    """Молярная масса, г/моль"""
+    return sum(ATOMIC_MASSES[element] * count for element, count in parse_formula(formula).items())
+
+
+def molar_solubility(salt, cation=0.0, anion=0.0):
+    """
+    Растворимость s (моль/л) в растворе, где уже есть cation моль/л катиона
+    и anion моль/л аниона; концентрации могут быть массивами
+    """
+    ions = ksp_ions(salt)
+    if ions is None:
+        return None
+    _, m, _, n = ions
+    ksp = KSP_DATA[salt]
+    cation, anion = np.broadcast_arrays(np.asarray(cation, dtype=float), np.asarray(anion, dtype=float))
+
+    # Одноименный ион только уменьшает растворимость
+    low = np.zeros(cation.shape)
+    high = np.full(cation.shape, (ksp / (m ** m * n ** n)) ** (1 / (m + n)))
+    log_ksp = np.log(ksp)
+    with np.errstate(divide='ignore'):
+        for _ in range(BISECTION_STEPS):
+            middle = (low + high) / 2
+            excess = m * np.log(m * middle + cation) + n * np.log(n * middle + anion) > log_ksp
+            high = np.where(excess, middle, high)
+            low = np.where(excess, low, middle)
+
+        # Раствор уже пересыщен - соль не растворяется
+        saturated = m * np.log(cation) + n * np.log(anion) >= log_ksp
+    result = np.where(saturated, 0.0, (low + high) / 2)
+    return float(result) if result.ndim == 0 else result
+
+
+def will_precipitate(salt, cation, anion):
+    """
+    Выпадет ли осадок при концентрациях ионов cation и anion (моль/л)
+    {'Q', 'Ksp', 'precipitates'}; массивы концентраций дают массивы ответов
+    """
+    ions = ksp_ions(salt)
+    if ions is None:
+        return None
+    _, m, _, n = ions
+    product = np.asarray(cation, dtype=float) ** m * np.asarray(anion, dtype=float) ** n
+    return {
+        'Q': float(product) if product.ndim == 0 else product,
+        'Ksp': KSP_DATA[salt],
+        'precipitates': bool(product > KSP_DATA[salt]) if product.ndim == 0 else product > KSP_DATA[salt],
+    }
+
+
+def precipitation_grid(salt, cations, anions):
+    """Таблица 'выпадет ли осадок' для всех сочетаний концентраций (строки - катион)"""
+    return will_precipitate(salt, np.asarray(cations, dtype=float)[:, np.newaxis],
+                            np.asarray(anions, dtype=float)[np.newaxis, :])
+
+
+def format_ksp(salt, cation=0.0, anion=0.0):
+    """Текст для бота: Ksp, растворимость в моль/л и г/л"""
+    (metal, charge), m, anion_group, n = ksp_ions(salt)
+    s = molar_solubility(salt, cation, anion)
+    cation_ion = ion_label(metal, charge)
+    anion_ion = ion_label(anion_group, -ANION_CHARGES[anion_group])
+
+    response = f"🧂 {salt} ⇌ {m if m > 1 else ''}{cation_ion} + {n if n > 1 else ''}{anion_ion}\n\n"
+    response += f"📊 Ksp = {KSP_DATA[salt]:.1e}\n"
+    if cation or anion:
+        response += f"🧪 В растворе: [{cation_ion}] = {cation:g} M, [{anion_ion}] = {anion:g} M\n"
+    response += f"💧 Растворимость: {s:.2e} моль/л ({s * molar_mass(salt):.2e} г/л)"
+    return response
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Многошаблонный поиск по запросу пользователя
+Все индикаторы и ключевые слова собираются в одно регулярное выражение,
+поэтому запрос просматривается один раз, а не по разу на каждое слово
+"""
+
+import re
+
+
+class ChemicalQueryMatcher:
+    """Скомпилированный автомат для анализа запроса за один проход"""
+
+    def __init__(self, categories):
+        """
+        categories: {категория: (список шаблонов, учитывать_регистр)}
+
+        Шаблоны без учета регистра (ключевые слова) совпадают в любом
+        написании, шаблоны с учетом регистра (формулы) - только точно.
+        """
+        self.categories = categories
+
+        # шаблон в нижнем регистре -> [(категория, исходный шаблон, учитывать_регистр)]
+        self.entries = {}
+        for category, (patterns, case_sensitive) in categories.items():
+            for pattern in patterns:
+                self.entries.setdefault(pattern.lower(), []).append(
+                    (category, pattern, case_sensitive)
+                )
+
+        # Длинные шаблоны идут первыми, чтобы "MnO2" не разбивался на "O2"
+        keys = sorted(self.entries, key=len, reverse=True)
+        self.regex = re.compile('|'.join(re.escape(k) for k in keys), re.IGNORECASE)
+
+        # Вложенные шаблоны (как выходные ссылки в автомате Ахо-Корасик):
+        # совпадение "MnO2" одновременно означает и совпадение "O2"
+        self.implied = {
+            key: [other for other in keys if other != key and other in key]
+            for key in keys
+        }
+
+    def scan(self, text):
+        """Один проход по тексту: {категория: [найденные шаблоны по порядку]}"""
+        found = {category: [] for category in self.categories}
+        for match in self.regex.finditer(text):
+            matched = match.group()
+            key = matched.lower()
+            self._record(found, key, matched)
+            for inner in self.implied[key]:
+                self._record(found, inner, matched)
+        return found
+
+    def _record(self, found, key, matched):
+        for category, pattern, case_sensitive in self.entries[key]:
+            if case_sensitive and pattern not in matched:
+                continue
+            if pattern not in found[category]:
+                found[category].append(pattern)
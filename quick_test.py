@@ -27,10 +27,10 @@ else:
 prediction = ai.predict_reaction(test_input)
 print(f"Предсказание ИИ: {prediction}")
 
-# Проверяем паттерн
-is_redox = ai._is_redox_reaction(test_input)
+# Проверяем, меняются ли степени окисления
+redox_result = ai.predict_redox_reaction(test_input)
+is_redox = bool(redox_result) and ai._is_redox_reaction(test_input, redox_result)
 print(f"Распознано как ОВР: {is_redox}")
 
 if is_redox:
-    redox_result = ai.predict_redox_reaction(test_input)
     print(f"ОВР предсказание: {redox_result}")
\ No newline at end of file
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Поиск ближайших известных реакций
+Реакции базы знаний переводятся в векторы признаков (состав, группы
+элементов, типы соединений), которые один раз нормируются в матрицу.
+Поиск похожих реакций - одно матричное умножение.
+"""
+
+import re
+
+import numpy as np
+
+from chemistry_core import compound_type, is_valid_formula, parse_formula, split_coefficient
+from chemistry_data import ELEMENT_GROUPS, ELEMENT_PERIODS, ELEMENT_SYMBOLS
+
+COMPOUND_TYPES = ('metal', 'acid', 'base', 'oxide', 'salt', 'organic',
+                  'water', 'hydrogen', 'oxygen', 'nonmetal', 'unknown')
+
+SYMBOL_RE = re.compile(r'[A-Z][a-z]?')
+
+
+class ReactionSimilarityIndex:
+    """Индекс сходства реакций из базы знаний"""
+
+    def __init__(self, knowledge_base):
+        self.element_index = {symbol: i for i, symbol in enumerate(ELEMENT_SYMBOLS)}
+        self.group_offset = len(ELEMENT_SYMBOLS)
+        self.period_offset = self.group_offset + 18
+        self.type_offset = self.period_offset + 7
+        self.dimension = self.type_offset + len(COMPOUND_TYPES)
+        self.type_index = {name: i for i, name in enumerate(COMPOUND_TYPES)}
+
+        self.reactions = []
+        rows = []
+        for reactants_key, products in knowledge_base.items():
+            reactants = [split_coefficient(r)[1] for r in reactants_key.split('+')]
+            vector = self.vectorize(reactants)
+            if vector is None:
+                continue
+            self.reactions.append((reactants, products))
+            rows.append(vector)
+
+        self.matrix = np.array(rows) if rows else np.zeros((0, self.dimension))
+
+    def vectorize(self, reactants):
+        """Нормированный вектор признаков набора реагентов (None, если формулы неверны)"""
+        if not reactants or not all(is_valid_formula(r) for r in reactants):
+            return None
+
+        vector = np.zeros(self.dimension)
+        for reactant in reactants:
+            for element, count in parse_formula(reactant).items():
+                vector[self.element_index[element]] += count
+                vector[self.group_offset + ELEMENT_GROUPS[element] - 1] += count
+                vector[self.period_offset + ELEMENT_PERIODS[element] - 1] += count
+            # Тип соединения - постоянный вес 2 на реагент, от состава не зависит
+            vector[self.type_offset + self.type_index[compound_type(reactant)]] += 2.0
+
+        return vector / np.linalg.norm(vector)
+
+    def nearest(self, reactants, k=3):
+        """k ближайших реакций: [{'reactants', 'products', 'similarity', 'analogy'}]"""
+        reactants = [split_coefficient(r)[1] for r in reactants]
+        query = self.vectorize(reactants)
+        if query is None or not self.reactions:
+            return []
+
+        scores = self.matrix @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        results = []
+        for i in top:
+            known_reactants, products = self.reactions[i]
+            results.append({
+                'reactants': known_reactants,
+                'products': products,
+                'similarity': float(scores[i]),
+                'analogy': self.analogous_products(reactants, known_reactants, products),
+            })
+        return results
+
+    def analogous_products(self, reactants, known_reactants, products):
+        """Продукты по аналогии: замена элемента на соседа по группе"""
+        if len(reactants) != len(known_reactants):
+            return None
+
+        by_type = sorted(reactants, key=compound_type)
+        known_by_type = sorted(known_reactants, key=compound_type)
+
+        mapping = {}
+        for new, old in zip(by_type, known_by_type):
+            if compound_type(new) != compound_type(old):
+                return None
+            if new == old:
+                continue
+            new_elements = parse_formula(new)
+            old_elements = parse_formula(old)
+            added = [e for e in new_elements if e not in old_elements]
+            removed = [e for e in old_elements if e not in new_elements]
+            if len(added) != 1 or len(removed) != 1:
+                return None
+            new_el, old_el = added[0], removed[0]
+            if new_elements[new_el] != old_elements[old_el]:
+                return None
+            if ELEMENT_GROUPS[new_el] != ELEMENT_GROUPS[old_el]:
+                return None
+            if any(new_elements[e] != old_elements[e] for e in new_elements if e != new_el):
+                return None
+            if mapping.get(old_el, new_el) != new_el:
+                return None
+            mapping[old_el] = new_el
+
+        if not mapping:
+            return products
+        return SYMBOL_RE.sub(lambda m: mapping.get(m.group(), m.group()), products)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Рендереры структурированных результатов: Telegram-текст, HTML и JSON
+Форматирование выполняет только тот интерфейс, которому оно нужно
+"""
+
+from html import escape
+
+from electrochemistry import format_cell, reaction_cell
+
+REACTION_TYPE_NAMES = {
+    'metal_acid': 'Металл + кислота',
+    'metal_oxygen': 'Металл + кислород',
+    'acid_base': 'Кислота + основание',
+    'exchange': 'Реакция обмена',
+    'displacement': 'Замещение (ряд активности)',
+    'combustion': 'Горение',
+    'decomposition': 'Разложение',
+    'redox': 'Окислительно-восстановительная',
+    'unknown': 'Неизвестный тип'
+}
+
+EDUCATIONAL_NOTES = {
+    'metal_acid': "Металлы реагируют с кислотами, образуя соль и водород. Активность металла определяет возможность реакции.",
+    'metal_oxygen': "Металлы окисляются кислородом, образуя оксиды. Щелочные металлы дают пероксиды.",
+    'acid_base': "Кислоты реагируют с основаниями в реакции нейтрализации, образуя соль и воду.",
+    'exchange': "Реакция обмена идет до конца, если образуется осадок, газ или вода.",
+    'displacement': "Более активный металл вытесняет менее активный из раствора его соли.",
+    'combustion': "При горении углерод окисляется до CO₂ (при недостатке кислорода - до CO), водород - до H₂O, азот выделяется как N₂, сера - как SO₂.",
+    'redox': "ОВР включают перенос электронов. Один элемент окисляется, другой восстанавливается.",
+    'decomposition': "Разложение - обратный процесс синтеза. Часто требует нагрева или катализаторов."
+}
+
+# Ответы-заглушки для запросов без расчета
+MESSAGES = {
+    'explanation': ("📖 Объяснение для", "Это функция в разработке. Попробуйте предсказать реакцию!"),
+    'calculation': ("🧮 Расчет для", "Функция стехиометрических расчетов в разработке."),
+    'help': ("🧪 По запросу", "Я - ИИ для решения химических реакций. Отправьте формулы веществ через '+' для предсказания реакции!"),
+}
+
+# Типы реакций, для которых показывается ЭДС по электродным потенциалам
+ELECTROCHEMICAL_TYPES = frozenset(['metal_acid', 'displacement', 'redox'])
+
+SEARCH_NOTE = "Уравнение имеет несколько решений - выбрано с наименьшими коэффициентами."
+
+
+def reaction_type_name(reaction_type):
+    """Название типа реакции на русском"""
+    return REACTION_TYPE_NAMES.get(reaction_type, 'Неизвестный тип')
+
+
+def describe(result):
+    """Уравнение результата или причина, по которой реакция не идет"""
+    if not result.proceeds:
+        return f"реакция не идет: {result.reason}"
+    if result.coefficients is None:
+        return ' + '.join(result.products)
+    return result.equation
+
+
+def render_telegram(result):
+    """Текст с эмодзи для бота и текстового режима веб-приложения"""
+    if result.kind == 'prediction':
+        if result.tier == 'knowledge_base':
+            response = f"🧪 На основе моей базы знаний:\n\n"
+            response += f"📥 Реагенты: {result.query}\n"
+            response += f"🤖 Продукты: {describe(result)}\n"
+        else:
+            response = f"🧠 Анализируя по паттернам:\n\n"
+            response += f"📥 Реагенты: {result.query}\n"
+            response += f"🤖 Предполагаемые продукты: {describe(result)}\n"
+        response += f"🎯 Уверенность: {result.confidence*100:.0f}%\n\n"
+
+        if result.reaction_type:
+            response += f"📋 Тип реакции: {reaction_type_name(result.reaction_type)}\n"
+        if result.reaction_type in ELECTROCHEMICAL_TYPES and result.proceeds and result.products:
+            cell = reaction_cell(result.reactants, result.products)
+            if cell:
+                response += f"{format_cell(cell)}\n"
+        if result.tier != 'knowledge_base':
+            response += "⚠️ Это предсказание может требовать проверки!\n"
+        if result.reaction_type in EDUCATIONAL_NOTES:
+            response += f"\n💡 {EDUCATIONAL_NOTES[result.reaction_type]}"
+        return response
+
+    if result.kind == 'balancing':
+        if not result.coefficients:
+            return (f"⚖️ Не удалось уравнять: {result.query}\n\n"
+                    "Проверьте формулы и то, что все элементы есть в обеих частях.")
+        response = f"⚖️ Сбалансированное уравнение:\n\n{result.equation}\n\n"
+        response += f"🎯 Уверенность: {result.confidence*100:.0f}%"
+        if result.tier == 'search':
+            response += f"\n💡 {SEARCH_NOTE}"
+        return response
+
+    if result.kind == 'unmatched':
+        return _render_unmatched(result)
+
+    title, text = MESSAGES[result.kind]
+    return f"{title}: {result.query}\n\n{text}"
+
+
+def _render_unmatched(result):
+    response = f"🤔 Я не смог точно определить реакцию для: {result.query}\n\n"
+
+    if result.components:
+        response += f"📋 Распознанные компоненты: {', '.join(result.components)}\n"
+
+        if result.analogy:
+            response += f"\n🔮 По аналогии с {' + '.join(result.analogy['reactants'])}: {result.analogy['analogy']}\n"
+            response += f"🎯 Уверенность: {result.confidence*100:.0f}%\n"
+
+        if result.neighbours:
+            response += "\n📚 Похожие известные реакции:\n"
+            for neighbour in result.neighbours:
+                response += f"• {' + '.join(neighbour['reactants'])} → {neighbour['products']}"
+                response += f" (сходство {neighbour['similarity']*100:.0f}%)\n"
+
+    response += "\n💡 Попробуйте:\n"
+    response += "• Указать полную реакцию с продуктами (H2 + O2 -> H2O)\n"
+    response += "• Использовать только реагенты (Zn + HCl)\n"
+    response += "• Проверить правильность написания формул\n\n"
+
+    response += "📚 Доступные команды:\n"
+    response += "/start - Мини-приложение\n"
+    response += "/periodic - Периодическая таблица\n"
+    response += "/help - Подробная помощь"
+
+    return response
+
+
+def render_html(result):
+    """HTML-фрагмент для веб-интерфейса"""
+    parts = ['<div class="chem-result">']
+
+    if result.kind in ('prediction', 'balancing') and (result.products or not result.proceeds):
+        equation = result.formatted('html') if result.proceeds else escape(describe(result))
+        parts.append(f'<p class="equation">{equation}</p>')
+        meta = [f"Уверенность: {result.confidence*100:.0f}%"]
+        if result.reaction_type:
+            meta.insert(0, f"Тип реакции: {escape(reaction_type_name(result.reaction_type))}")
+        parts.append(f'<p class="meta">{" · ".join(meta)}</p>')
+        if result.kind == 'prediction' and result.reaction_type in EDUCATIONAL_NOTES:
+            parts.append(f'<p class="note">{escape(EDUCATIONAL_NOTES[result.reaction_type])}</p>')
+        if result.tier == 'search':
+            parts.append(f'<p class="note">{escape(SEARCH_NOTE)}</p>')
+    elif result.kind in ('prediction', 'balancing', 'unmatched'):
+        parts.append(f'<p class="error">Не удалось определить реакцию: {escape(result.query)}</p>')
+        if result.analogy:
+            parts.append(f'<p class="analogy">По аналогии с {escape(" + ".join(result.analogy["reactants"]))}: '
+                         f'{escape(result.analogy["analogy"])}</p>')
+        if result.neighbours:
+            parts.append('<ul class="neighbours">')
+            for neighbour in result.neighbours:
+                parts.append(f'<li>{escape(" + ".join(neighbour["reactants"]))} → {escape(neighbour["products"])} '
+                             f'({neighbour["similarity"]*100:.0f}%)</li>')
+            parts.append('</ul>')
+    else:
+        title, text = MESSAGES[result.kind]
+        parts.append(f'<p>{escape(text)}</p>')
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def render_json(result):
+    """Компактный словарь для JSON API"""
+    return result.to_dict()
+
+
+RENDERERS = {
+    'text': render_telegram,
+    'telegram': render_telegram,
+    'html': render_html,
+    'json': render_json,
+}
+
+
+def render(result, fmt='text'):
+    """Результат в нужном формате ('text', 'telegram', 'html', 'json')"""
+    return RENDERERS.get(fmt, render_telegram)(result)
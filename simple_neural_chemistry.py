@@ -8,6 +8,10 @@ import re
 import json
 import os
 from collections import defaultdict, Counter
+from chemistry_core import balance, format_equation, split_coefficient
+from combustion import combustion
+from displacement import displacement_predictor
+from oxidation_states import is_redox
 
 class SimpleNeuralChemistry:
     """Простая нейронная сеть для предсказания химических реакций"""
@@ -34,9 +38,6 @@ class SimpleNeuralChemistry:
             "Al+HCl": "AlCl3+H2",
             "Sn+HCl": "SnCl2+H2",
             "Pb+HCl": "PbCl2+H2",
-            "Cu+HCl": "CuCl2+H2",
-            "Ag+HCl": "AgCl+H2",
-            "Au+HCl": "AuCl3+H2",
 
             # Металл + H2SO4
             "Na+H2SO4": "Na2SO4+H2",
@@ -95,22 +96,8 @@ class SimpleNeuralChemistry:
             "HBr+NaOH": "NaBr+H2O",
             "HI+NaOH": "NaI+H2O",
 
-            # Горение (расширенная)
-            "C+O2": "CO2",
-            "S+O2": "SO2",
+            # Горение (CxHyOzNwSv считается функцией combustion)
             "P+O2": "P2O5",
-            "CH4+O2": "CO2+H2O",
-            "C2H6+O2": "CO2+H2O",
-            "C3H8+O2": "CO2+H2O",
-            "C4H10+O2": "CO2+H2O",
-            "C2H4+O2": "CO2+H2O",
-            "C2H2+O2": "CO2+H2O",
-            "H2+O2": "H2O",
-            "CO+O2": "CO2",
-            "H2S+O2": "SO2+H2O",
-            "NH3+O2": "N2+H2O",
-            "C6H12O6+O2": "CO2+H2O",
-            "C2H5OH+O2": "CO2+H2O",
 
             # Разложение (расширенная)
             "CaCO3": "CaO+CO2",
@@ -241,8 +228,14 @@ class SimpleNeuralChemistry:
         reactants = reactants.strip()
 
         # Окислительно-восстановительные реакции (проверяем первыми)
-        if self._is_redox_reaction(reactants):
-            return self.predict_redox_reaction(reactants)
+        redox = self.predict_redox_reaction(reactants)
+        if redox and self._is_redox_reaction(reactants, redox):
+            return redox
+
+        # Горение веществ CxHyOzNwSv - продукты по составу топлива
+        burning = self.predict_combustion(reactants)
+        if burning:
+            return burning
 
         # Металл + кислота
         if re.search(r'[A-Z][a-z]?\s*\+\s*H[A-Z]', reactants):
@@ -256,29 +249,17 @@ class SimpleNeuralChemistry:
         elif re.search(r'H[A-Z]+\s*\+\s*[A-Z][a-z]*OH', reactants):
             return self.predict_acid_base(reactants)
 
-        # Горение углеводородов
-        elif re.search(r'C.*H.*\s*\+\s*O2', reactants):
-            return "CO2+H2O"
-
         # Разложение (одиночный реагент)
         elif '+' not in reactants and reactants:
             return self.predict_decomposition(reactants)
 
         return None
 
-    def _is_redox_reaction(self, reactants):
-        """Проверка, является ли реакция окислительно-восстановительной"""
-        redox_indicators = [
-            'MnO2', 'KMnO4', 'K2Cr2O7', 'H2O2', 'Cl2', 'Br2', 'I2',
-            'CuO', 'Fe2O3', 'Al2O3', 'ZnO', 'MgO', 'CaO'
-        ]
-
-        parts = [p.strip() for p in reactants.split('+')]
-        for part in parts:
-            for indicator in redox_indicators:
-                if indicator in part:
-                    return True
-        return False
+    def _is_redox_reaction(self, reactants, products):
+        """ОВР - хотя бы один элемент меняет степень окисления ('A + B', 'C+2D')"""
+        left = [p.strip() for p in reactants.split('+')]
+        right = [split_coefficient(p)[1] for p in products.split('+')]
+        return is_redox(left, right)
 
     def predict_redox_reaction(self, reaction):
         """Предсказание ОВР реакции"""
@@ -300,42 +281,38 @@ class SimpleNeuralChemistry:
         elif 'H2O2' in reaction and 'HCl' in reaction:
             return "Cl2+2H2O"
 
-        # Общий случай - упрощенное предсказание
-        return self.predict_metal_acid(reaction)
+        # Остальные реакции разбираются по другим паттернам
+        return None
+
+    def predict_combustion(self, reaction):
+        """Горение в кислороде через combustion(): 'C8H18 + O2' -> 'CO2+H2O'"""
+        parts = [p.strip() for p in reaction.split('+')]
+        if len(parts) != 2 or 'O2' not in parts:
+            return None
+        fuel = parts[1] if parts[0] == 'O2' else parts[0]
+        result = combustion(fuel)
+        return '+'.join(result['products']) if result else None
+
+    def predict_equation(self, reactants):
+        """Уравненная реакция: 'C8H18 + O2' -> '2C8H18 + 25O2 → 16CO2 + 18H2O' или None"""
+        products = self.predict_reaction(reactants)
+        if not products:
+            return None
+        left = [split_coefficient(p.strip())[1] for p in reactants.split('+')]
+        right = [split_coefficient(p.strip())[1] for p in products.split('+')]
+        coefficients = balance(left, right)
+        return format_equation(left, right, coefficients) if coefficients else None
 
     def predict_metal_acid(self, reaction):
-        """Предсказание реакции металл + кислота"""
+        """Предсказание реакции металл + кислота по электродным потенциалам"""
         parts = [p.strip() for p in reaction.split('+')]
         metal = parts[0]
         acid = parts[1] if len(parts) > 1 else "HCl"
 
-        # Определяем анион кислоты
-        if "HCl" in acid or "HBr" in acid or "HI" in acid:
-            anion = acid.replace("H", "") if len(acid) > 1 else "Cl"
-        elif "H2SO4" in acid:
-            anion = "SO4"
-        elif "HNO3" in acid:
-            anion = "NO3"
-        else:
-            anion = "Cl"
-
-        # Валентность металла (упрощенная)
-        valences = {
-            'Li': 1, 'Na': 1, 'K': 1, 'Rb': 1, 'Cs': 1,
-            'Be': 2, 'Mg': 2, 'Ca': 2, 'Sr': 2, 'Ba': 2, 'Ra': 2,
-            'Al': 3, 'Zn': 2, 'Fe': 2, 'Cu': 2, 'Ag': 1, 'Au': 1
-        }
-
-        valency = valences.get(metal, 2)
-
-        if anion in ['Cl', 'Br', 'I']:
-            salt = f"{metal}{anion}{valency}" if valency > 1 else f"{metal}{anion}"
-        elif anion == 'SO4':
-            salt = f"{metal}{anion}" if valency == 2 else f"{metal}2({anion})"
-        else:
-            salt = f"{metal}{anion}{valency}" if valency > 1 else f"{metal}{anion}"
-
-        return f"{salt}+H2"
+        result = displacement_predictor.predict(metal, acid)
+        if not result or not result['proceeds']:
+            return None
+        return '+'.join(result['products'])
 
     def predict_metal_oxygen(self, reaction):
         """Предсказание реакции металл + кислород"""
@@ -230,7 +230,7 @@ def solve_reaction():
         if not query:
             return jsonify({'success': False, 'error': 'Введите запрос'})
 
-        result = solve_chemistry_chatgpt(query)
+        result = solve_chemistry_chatgpt(query, data.get('format', 'text'))
         return jsonify({'success': True, 'result': result})
 
     except Exception as e:
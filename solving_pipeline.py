@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Конвейер решения химических запросов
+Ступени идут по порядку: нормализация -> разбор -> кэш -> база знаний ->
+правила -> точная балансировка -> ограниченный перебор. Все ступени
+работают с одним общим контекстом; конвейер останавливается на первой
+ступени, которая дала полный ответ, и записывает время каждой ступени
+"""
+
+import re
+import time
+
+from chemistry_core import (balance, format_equation, is_valid_formula, search_coefficients,
+                            split_coefficient)
+from chemistry_data import ACTIVITY_RANK
+from combustion import combustion
+from displacement import displacement_predictor
+from ion_exchange import ion_exchange_predictor
+from oxidation_states import is_redox
+from response_cache import ResponseCache
+
+TIERS = ('normalize', 'parse', 'cache', 'knowledge_base', 'rules', 'balancer', 'search')
+
+ARROW_RE = re.compile(r'\s*(?:->|→|=>|=)\s*')
+INCOMPLETE_RE = re.compile(r'неполн|incomplete', re.IGNORECASE)
+
+
+def normalize_query(query):
+    """Пробелы, стрелки и разделители к одному виду: 'Zn+HCl' -> 'Zn + HCl'"""
+    query = ARROW_RE.sub(' -> ', query.strip())
+    sides = [' + '.join(' '.join(part.split()) for part in side.split('+') if part.strip())
+             for side in query.split(' -> ')]
+    return ' -> '.join(sides)
+
+
+class SolveContext:
+    """Общее состояние запроса, которое заполняют ступени конвейера"""
+
+    def __init__(self, query, analysis=None):
+        self.query = query
+        self.analysis = analysis
+        self.normalized = ''
+        self.reactants = []
+        self.products = None
+        self.coefficients = None
+        self.marks = {}
+        self.proceeds = True
+        self.reason = ''
+        self.words = []
+        self.error = None
+        self.tier = None
+        self.confidence = 0.0
+        self.cached = None
+        self.timings = []
+
+    @property
+    def complete(self):
+        """Ответ полный: реакция уравнена или известно, что она не идет"""
+        return self.cached is not None or not self.proceeds or self.coefficients is not None
+
+    def answer(self, tier, confidence, products, coefficients=None):
+        """Ступень нашла продукты"""
+        self.tier = tier
+        self.confidence = confidence
+        self.products = products
+        self.coefficients = coefficients
+
+    def result(self):
+        """Итог запроса в виде словаря"""
+        if self.proceeds:
+            equation = format_equation(self.reactants, self.products, self.coefficients, self.marks)
+        else:
+            equation = f"{' + '.join(self.reactants)} ≠"
+
+        # Тип не определился по запросу - ОВР видна по изменению степеней окисления
+        reaction_type = self.analysis['reaction_type'] if self.analysis else None
+        if reaction_type in (None, 'unknown') and self.proceeds and self.products \
+                and is_redox(self.reactants, self.products):
+            reaction_type = 'redox'
+
+        return {
+            'query': self.normalized,
+            'reactants': self.reactants,
+            'products': self.products or [],
+            'coefficients': self.coefficients,
+            'marks': self.marks,
+            'proceeds': self.proceeds,
+            'reason': self.reason,
+            'reaction_type': reaction_type,
+            'tier': self.tier,
+            'confidence': self.confidence,
+            'equation': equation,
+            'timings': self.timings,
+        }
+
+
+class SolvingPipeline:
+    """Единый конвейер решения поверх базы знаний и предсказателей движка"""
+
+    def __init__(self, engine, cache_size=512, cache_ttl=3600):
+        self.engine = engine
+        self.cache = ResponseCache(cache_size, cache_ttl)
+        self.tiers = [(name, getattr(self, f"_{name}")) for name in TIERS]
+        self.metrics = {name: {'calls': 0, 'answers': 0, 'total_ms': 0.0} for name in TIERS}
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """Индекс базы знаний по набору реагентов без коэффициентов; сброс кэша"""
+        self.index = {}
+        for reactants_key, products in self.engine.knowledge_base.items():
+            reactants = [split_coefficient(r)[1] for r in reactants_key.split('+')]
+            self.index.setdefault(self._key(reactants), products)
+        self.cache.clear()
+
+    def _key(self, formulas):
+        return '+'.join(sorted(formulas))
+
+    def solve(self, query, analysis=None):
+        """Результат запроса (словарь SolveContext.result) или None"""
+        ctx = SolveContext(query, analysis)
+        for name, tier in self.tiers:
+            start = time.perf_counter()
+            tier(ctx)
+            elapsed = (time.perf_counter() - start) * 1000
+            ctx.timings.append((name, elapsed))
+
+            metrics = self.metrics[name]
+            metrics['calls'] += 1
+            metrics['total_ms'] += elapsed
+            if ctx.error or ctx.complete:
+                break
+
+        if ctx.cached is not None:
+            self.metrics['cache']['answers'] += 1
+            return dict(ctx.cached, timings=ctx.timings, cached=True)
+        if ctx.error or (ctx.products is None and ctx.proceeds):
+            return None
+
+        self.metrics[ctx.tier]['answers'] += 1
+        result = ctx.result()
+        self.cache.put(ctx.normalized, result)
+        return dict(result, cached=False)
+
+    def _normalize(self, ctx):
+        ctx.normalized = normalize_query(ctx.query)
+
+    def _parse(self, ctx):
+        """Формулы реагентов и продуктов; слова вроде 'неполное' отделяются"""
+        sides = ctx.normalized.split(' -> ')
+        if len(sides) > 2 or not sides[0]:
+            ctx.error = "неверный формат запроса"
+            return
+
+        parsed = []
+        for side in sides:
+            formulas = []
+            for part in side.split(' + '):
+                tokens = part.split()
+                formula = split_coefficient(tokens[0])[1] if tokens else ''
+                if not is_valid_formula(formula):
+                    ctx.error = f"не распознана формула: {part}"
+                    return
+                formulas.append(formula)
+                ctx.words.extend(tokens[1:])
+            parsed.append(formulas)
+
+        ctx.reactants = parsed[0]
+        if len(parsed) == 2:
+            # Продукты заданы пользователем - остается уравнять
+            ctx.answer('balancer', self.engine.confidence_scores['exact_match'], parsed[1])
+        if ctx.analysis is None:
+            ctx.analysis = self.engine.analyze_query(' + '.join(ctx.reactants))
+
+    def _cache(self, ctx):
+        ctx.cached = self.cache.get(ctx.normalized)
+
+    def _knowledge_base(self, ctx):
+        # Уточнения вроде 'неполное' меняют ответ - база знаний их не учитывает
+        if ctx.products is not None or ctx.words:
+            return
+        products = self.index.get(self._key(ctx.reactants))
+        if products:
+            ctx.answer('knowledge_base', self.engine.confidence_scores['exact_match'],
+                       [split_coefficient(p)[1] for p in products.split('+')])
+
+    def _rules(self, ctx):
+        """Предсказатели по типу реакции: обмен, замещение, горение, ОВР"""
+        if ctx.products is not None:
+            return
+        reaction_type = ctx.analysis['reaction_type']
+        reactants = ctx.reactants
+        result = None
+
+        if reaction_type == 'combustion':
+            fuels = [r for r in reactants if r != 'O2']
+            complete = not any(INCOMPLETE_RE.search(word) for word in ctx.words)
+            if len(fuels) == 1 and len(reactants) == 2:
+                result = combustion(fuels[0], complete)
+        elif reaction_type == 'redox':
+            products = self.engine.predict_redox_advanced('+'.join(reactants))
+            if products:
+                ctx.answer('rules', self.engine.confidence_scores['pattern_match'],
+                           [split_coefficient(p)[1] for p in products.split('+')])
+            return
+        elif len(reactants) == 2:
+            first, second = reactants
+            if reaction_type in ('metal_acid', 'displacement'):
+                if first not in ACTIVITY_RANK:
+                    first, second = second, first
+                result = displacement_predictor.predict(first, second)
+            else:
+                result = ion_exchange_predictor.predict(first, second)
+
+        if result:
+            ctx.reactants = result['reactants']
+            ctx.marks = result.get('marks', {})
+            ctx.proceeds = result.get('proceeds', True)
+            ctx.reason = result.get('reason', '')
+            ctx.answer('rules', self.engine.confidence_scores['pattern_match'],
+                       result['products'], result['coefficients'])
+
+    def _balancer(self, ctx):
+        """Точная балансировка известных продуктов"""
+        if ctx.products:
+            ctx.coefficients = balance(ctx.reactants, ctx.products)
+
+    def _search(self, ctx):
+        """Ограниченный перебор, если точный метод не дал единственного ответа"""
+        if ctx.products:
+            ctx.coefficients = search_coefficients(ctx.reactants, ctx.products)
+            if ctx.coefficients and ctx.tier == 'balancer':
+                ctx.tier = 'search'
+                ctx.confidence = self.engine.confidence_scores['inferred']
@@ -103,6 +103,42 @@ function handleKeyPress(event) {
     }
 }
 
+// Suggestions while typing
+let suggestTimer = null;
+
+function loadSuggestions(event) {
+    const prefix = event.target.value.trim();
+    clearTimeout(suggestTimer);
+    if (!prefix) {
+        return;
+    }
+
+    suggestTimer = setTimeout(async () => {
+        try {
+            const response = await fetch(`/api/suggest?prefix=${encodeURIComponent(prefix)}`);
+            const data = await response.json();
+            if (!data.success) {
+                return;
+            }
+
+            const list = document.getElementById('reaction-suggestions');
+            list.innerHTML = '';
+            data.suggestions.forEach(item => {
+                const option = document.createElement('option');
+                option.value = item.text;
+                if (item.formula) {
+                    option.label = `${item.text} (${item.formula})`;
+                } else if (item.products) {
+                    option.label = `${item.text} → ${item.products}`;
+                }
+                list.appendChild(option);
+            });
+        } catch (error) {
+            console.error('Suggest error:', error);
+        }
+    }, 150);
+}
+
 // Show result
 function showResult(result) {
     const resultSection = document.getElementById('result-section');
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Подсказки при вводе запроса
+Формулы, названия веществ и реакции базы знаний собираются в префиксное
+дерево, где каждый узел заранее хранит лучшие продолжения. Ответ на
+запрос - проход по символам префикса, без перебора всех записей
+"""
+
+import re
+
+from chemistry_core import split_coefficient
+from formula_correction import KNOWN_SPECIES
+from name_resolver import known_names
+
+# Сколько лучших продолжений хранит каждый узел
+MAX_SUGGESTIONS = 10
+
+# Порядок видов подсказок при равном весе
+KIND_WEIGHTS = {'reaction': 3, 'formula': 2, 'name': 1}
+
+PLUS_RE = re.compile(r'\s*\+\s*')
+SPLIT_RE = re.compile(r'\s*(?:\+|->|→|=)\s*')
+
+
+def suggest_key(text):
+    """Ключ поиска: нижний регистр, без пробелов вокруг '+': 'Zn + HCl' -> 'zn+hcl'"""
+    return ' '.join(PLUS_RE.sub('+', text.lower()).split())
+
+
+class SuggestIndex:
+    """Префиксное дерево с лучшими продолжениями в каждом узле"""
+
+    def __init__(self, knowledge_base):
+        self.entries = []
+        self.root = {'top': []}
+        self._seen = set()
+
+        # Вещества из реакций базы знаний поднимаются выше остальных
+        popular = set()
+        for reactants_key, products in knowledge_base.items():
+            reactants = [split_coefficient(r)[1] for r in reactants_key.split('+')]
+            popular.update(reactants)
+            self.add(' + '.join(reactants), 'reaction', products=products)
+
+        for formula in sorted(KNOWN_SPECIES):
+            self.add(formula, 'formula', bonus=formula in popular)
+        for name, formula in sorted(known_names().items()):
+            self.add(name, 'name', formula=formula)
+
+        self._finalize(self.root)
+
+    def add(self, text, kind, formula=None, products=None, bonus=False):
+        if (text, kind) in self._seen:
+            return
+        self._seen.add((text, kind))
+        entry = {'text': text, 'kind': kind}
+        if formula:
+            entry['formula'] = formula
+        if products:
+            entry['products'] = products
+        rank = (-KIND_WEIGHTS[kind] - bonus, len(text), text)
+        index = len(self.entries)
+        self.entries.append(entry)
+
+        node = self.root
+        for char in suggest_key(text):
+            node = node.setdefault(char, {'top': []})
+            node['top'].append((rank, index))
+
+    def _finalize(self, node):
+        """Оставляет в узлах только лучшие продолжения (один раз при построении)"""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            node['top'] = [index for _, index in sorted(node['top'])[:MAX_SUGGESTIONS]]
+            stack.extend(child for char, child in node.items() if char != 'top')
+
+    def _complete(self, key, limit):
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return []
+        return [self.entries[index] for index in node['top'][:limit]]
+
+    def suggest(self, prefix, limit=MAX_SUGGESTIONS):
+        """
+        До limit продолжений префикса: [{'text', 'kind', 'formula'?, 'products'?}]
+        Если введено несколько веществ ('Zn + со'), дополняется последнее
+        """
+        prefix = prefix.strip()
+        key = suggest_key(prefix)
+        if not key:
+            return []
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        suggestions = self._complete(key, limit)
+
+        parts = SPLIT_RE.split(prefix)
+        if len(parts) > 1 and len(suggestions) < limit and parts[-1]:
+            head = prefix[:len(prefix) - len(parts[-1])]
+            shown = {suggest_key(entry['text']) for entry in suggestions}
+            for entry in self._complete(suggest_key(parts[-1]), MAX_SUGGESTIONS):
+                text = head + entry['text']
+                if entry['kind'] == 'reaction' or suggest_key(text) in shown:
+                    continue
+                suggestions.append(dict(entry, text=text))
+                if len(suggestions) == limit:
+                    break
+
+        return suggestions
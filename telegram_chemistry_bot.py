@@ -1,12 +1,26 @@
 import asyncio
 import logging
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, CallbackQueryHandler, ConversationHandler
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand, InlineQueryResultArticle, InputTextMessageContent
+from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, CallbackQueryHandler, ConversationHandler, InlineQueryHandler
 from fractions import Fraction
 import re
 from collections import defaultdict
 from config import TELEGRAM_TOKEN
 from advanced_neural_chemistry import AdvancedNeuralChemistry
+from chemistry_core import split_coefficient
+from combustion import combustion
+from displacement import displacement_predictor
+from electron_configuration import ELECTRON_CONFIGURATIONS, electron_configuration, format_configuration
+from empirical_formula import empirical_formula, format_formula_result, parse_composition
+from equation_renderer import render_equation
+from ion_exchange import format_solubility_table, ion_exchange_predictor
+from isotope_pattern import format_pattern, isotope_pattern
+from acid_base_equilibrium import format_ph, parse_ph_query, solution_ph
+from mass_search import DEFAULT_TOLERANCE, format_mass_search, formulas_for_mass, parse_elements
+from oxidation_states import is_redox
+from precipitation import format_ksp, ksp_ions
+from thermochemistry import format_thermo
+from titration import curve_svg, format_titration, titration_curve
 
 # States for conversation handler
 MAIN_MENU, PREDICT_REACTION, BROWSE_EXAMPLES, SETTINGS = range(4)
@@ -92,12 +106,6 @@ class ChemistryBot:
             'Co': [2, 3], 'Ni': [2, 3], 'Ti': [2, 3, 4], 'V': [2, 3, 4, 5]
         }
 
-        # Ряд активности металлов
-        self.metal_activity_series = [
-            'Li', 'K', 'Ba', 'Ca', 'Na', 'Mg', 'Al', 'Mn', 'Zn', 'Cr',
-            'Fe', 'Cd', 'Co', 'Ni', 'Sn', 'Pb', 'H', 'Cu', 'Hg', 'Ag', 'Pt', 'Au'
-        ]
-
         # Анионы
         self.anions = {
             'Cl': 'хлорид', 'Br': 'бромид', 'I': 'иодид', 'F': 'фторид',
@@ -230,42 +238,7 @@ class ChemistryBot:
     # Методы предсказания реакций (упрощенные версии)
     def metal_acid_reaction(self, metal, acid):
         """Металл + кислота"""
-        acid_upper = acid.upper()
-        if 'HCL' in acid_upper or (acid_upper.startswith('H') and 'CL' in acid_upper):
-            anion = 'Cl'
-        elif 'H2SO4' in acid_upper or 'SO4' in acid_upper:
-            anion = 'SO4'
-        elif 'HNO3' in acid_upper or 'NO3' in acid_upper:
-            anion = 'NO3'
-        elif 'HBR' in acid_upper:
-            anion = 'Br'
-        elif 'HI' in acid_upper:
-            anion = 'I'
-        else:
-            anion = 'Cl'
-
-        if metal in self.metals:
-            valency = self.metals[metal]
-            if isinstance(valency, list):
-                valency = valency[0]
-        else:
-            valency = 1
-
-        if anion in ['Cl', 'Br', 'I', 'F']:
-            salt = f"{metal}{anion}{valency}" if valency > 1 else f"{metal}{anion}"
-        elif anion == 'SO4':
-            salt = f"{metal}{anion}" if valency == 2 else f"{metal}2({anion})" if valency == 1 else f"{metal}2({anion})3"
-        elif anion == 'NO3':
-            salt = f"{metal}({anion}){valency}" if valency > 1 else f"{metal}{anion}"
-        else:
-            salt = f"{metal}({anion}){valency}" if valency > 1 else f"{metal}{anion}"
-
-        if metal in self.metal_activity_series:
-            metal_pos = self.metal_activity_series.index(metal)
-            h_pos = self.metal_activity_series.index('H')
-            if metal_pos < h_pos:
-                return [salt, "H2"]
-        return [salt]
+        return self.displacement_products(metal, acid)
 
     def acid_base_reaction(self, acid, base):
         """Кислота + основание (нейтрализация)"""
@@ -302,8 +275,9 @@ class ChemistryBot:
         return [salt, "H2O"]
 
     def combustion_reaction(self, organic):
-        """Горение органических соединений"""
-        return ["CO2", "H2O"]
+        """Горение органических соединений: продукты по составу топлива"""
+        result = combustion(organic)
+        return result['products'] if result else None
 
     def predict_reaction_products(self, reactants):
         """Улучшенное предсказание продуктов реакции с использованием нейросети"""
@@ -328,7 +302,9 @@ class ChemistryBot:
         # Реакция соединения
         if len(reactants) == 2:
             if any(t in ['metal', 'hydrogen', 'oxygen', 'oxide'] for t in reactant_types):
-                return self.predict_combination(reactants)
+                combination = self.predict_combination(reactants)
+                if combination:
+                    return combination
 
         # Реакция замещения
         if 'metal' in reactant_types:
@@ -358,9 +334,19 @@ class ChemistryBot:
             if acid and base:
                 return self.acid_base_reaction(acid, base)
 
-        # Окислительно-восстановительные реакции
-        if self._is_redox_reaction(reactants):
-            return self._predict_redox_reaction(reactants)
+        # Реакция ионного обмена по таблице растворимости
+        if len(reactants) == 2:
+            exchange = self.exchange_products(reactants[0], reactants[1])
+            if exchange:
+                return exchange
+
+        # Окислительно-восстановительные реакции: продукты принимаются,
+        # только если степени окисления действительно меняются
+        redox = self.neural_predictor.predict_redox_advanced('+'.join(r.strip() for r in reactants))
+        if redox:
+            products = [split_coefficient(p)[1] for p in redox.split('+')]
+            if is_redox([r.strip() for r in reactants], products):
+                return products
 
         # Горение
         if any('O2' in r.upper() for r in reactants):
@@ -451,33 +437,34 @@ class ChemistryBot:
 
     def metal_salt_reaction(self, metal, salt):
         """Металл + соль (вытеснение)"""
-        salt_metal = salt[0] if salt[0].isupper() else salt[:2]
-        if salt_metal in self.metal_activity_series and metal in self.metal_activity_series:
-            metal_pos = self.metal_activity_series.index(metal)
-            salt_metal_pos = self.metal_activity_series.index(salt_metal)
-            if metal_pos < salt_metal_pos:
-                anion = salt.replace(salt_metal, '').strip()
-                if metal in self.metals:
-                    valency = self.metals[metal]
-                    if isinstance(valency, list):
-                        valency = valency[0]
-                else:
-                    valency = 2
-                new_salt = f"{metal}{anion}" if valency == 1 else f"{metal}{anion}{valency}"
-                return [new_salt, salt_metal]
+        return self.displacement_products(metal, salt)
+
+    def displacement_products(self, metal, other):
+        """Продукты замещения по ряду активности (None, если реакция не идет)"""
+        result = displacement_predictor.predict(metal.strip(), other.strip())
+        if result and result['proceeds']:
+            return result['products']
         return None
 
     def oxide_acid_reaction(self, oxide, acid):
         """Оксид + кислота"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(oxide, acid)
 
     def oxide_base_reaction(self, oxide, base):
         """Оксид + основание"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(oxide, base)
 
     def salt_salt_reaction(self, salt1, salt2):
         """Соль + соль (обмен)"""
-        return ["H2O"]  # Упрощенно
+        return self.exchange_products(salt1, salt2)
+
+    def exchange_products(self, first, second):
+        """Продукты реакции обмена, если она идет (осадок, газ или вода)"""
+        result = ion_exchange_predictor.predict(first.strip(), second.strip())
+        # Гидролиз требует воды среди реагентов - такие случаи оставляем полному уравнению
+        if result and result['proceeds'] and len(result['reactants']) == 2:
+            return result['products']
+        return None
 
     def solve_reaction(self, equation):
         """Универсальная функция решения реакции"""
@@ -559,86 +546,36 @@ class ChemistryBot:
 
             if coefficients and all(c > 0 for c in coefficients):
                 coefficients = self.normalize_coefficients(coefficients)
-
-                if any(c <= 0 for c in coefficients):
-                    coefficients = self.balance_by_trial_optimized(reactant_elements, product_elements, all_elements)
-
-                if coefficients:
-                    result = "✨ Сбалансированное уравнение:\n\n"
-
-                    reactant_parts = []
-                    for i, reactant in enumerate(reactants):
-                        coeff = int(coefficients[i])
-                        if coeff > 1:
-                            reactant_parts.append(f"{coeff}{reactant}")
-                        else:
-                            reactant_parts.append(reactant)
-
-                    result += " + ".join(reactant_parts)
-                    result += " → "
-
-                    product_parts = []
-                    for i, product in enumerate(products):
-                        coeff = int(coefficients[num_reactants + i])
-                        if coeff > 1:
-                            product_parts.append(f"{coeff}{product}")
-                        else:
-                            product_parts.append(product)
-
-                    result += " + ".join(product_parts)
-
-                    result += "\n\n✅ Проверка баланса:\n"
-                    for element in sorted(all_elements):
-                        reactant_count = sum(coefficients[i] * reactant_elements[i].get(element, 0)
-                                           for i in range(num_reactants))
-                        product_count = sum(coefficients[num_reactants + i] * product_elements[i].get(element, 0)
-                                          for i in range(num_products))
-                        result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
-
-                    return result
-                else:
-                    return "❌ Не удалось сбалансировать уравнение."
-            else:
+            # Нулевые и отрицательные коэффициенты - не решение, пробуем подбором
+            if coefficients and any(c <= 0 for c in coefficients):
+                coefficients = None
+            if not coefficients:
                 coefficients = self.balance_by_trial_optimized(reactant_elements, product_elements, all_elements)
-                if coefficients:
-                    result = "✨ Сбалансированное уравнение:\n\n"
-
-                    reactant_parts = []
-                    for i, reactant in enumerate(reactants):
-                        coeff = int(coefficients[i])
-                        if coeff > 1:
-                            reactant_parts.append(f"{coeff}{reactant}")
-                        else:
-                            reactant_parts.append(reactant)
-
-                    result += " + ".join(reactant_parts)
-                    result += " → "
-
-                    product_parts = []
-                    for i, product in enumerate(products):
-                        coeff = int(coefficients[num_reactants + i])
-                        if coeff > 1:
-                            product_parts.append(f"{coeff}{product}")
-                        else:
-                            product_parts.append(product)
-
-                    result += " + ".join(product_parts)
-
-                    result += "\n\n✅ Проверка баланса:\n"
-                    for element in sorted(all_elements):
-                        reactant_count = sum(coefficients[i] * reactant_elements[i].get(element, 0)
-                                           for i in range(num_reactants))
-                        product_count = sum(coefficients[num_reactants + i] * product_elements[i].get(element, 0)
-                                          for i in range(num_products))
-                        result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
 
-                    return result
-                else:
-                    return "❌ Не удалось сбалансировать уравнение. Проверьте правильность написания формул."
+            if not coefficients:
+                return "❌ Не удалось сбалансировать уравнение. Проверьте правильность написания формул."
+            return self.format_balanced_result(reactants, products, coefficients,
+                                               reactant_elements, product_elements, all_elements)
 
         except Exception as e:
             return f"❌ Ошибка при решении: {str(e)}"
 
+    def format_balanced_result(self, reactants, products, coefficients,
+                               reactant_elements, product_elements, all_elements):
+        """Текст результата: уравнение и проверка баланса по элементам"""
+        coefficients = [int(c) for c in coefficients]
+        num_reactants = len(reactants)
+
+        result = "✨ Сбалансированное уравнение:\n\n"
+        result += render_equation(reactants, products, coefficients)
+
+        result += "\n\n✅ Проверка баланса:\n"
+        for element in sorted(all_elements):
+            reactant_count = sum(c * e.get(element, 0) for c, e in zip(coefficients, reactant_elements))
+            product_count = sum(c * e.get(element, 0) for c, e in zip(coefficients[num_reactants:], product_elements))
+            result += f"  {element}: реагенты = {int(reactant_count)}, продукты = {int(product_count)} ✓\n"
+        return result
+
     def solve_system_fast(self, matrix, num_vars):
         """Оптимизированное решение системы уравнений"""
         if not matrix or not matrix[0]:
@@ -867,7 +804,7 @@ class ChemistryBot:
         for period in sorted(periods.keys()):
             result += f"Период {period}:\n"
             for symbol, mass in periods[period]:
-                result += f"  {symbol}: {mass:.2f} а.е.м.\n"
+                result += f"  {symbol}: {mass:.2f} а.е.м., {ELECTRON_CONFIGURATIONS[symbol]['short']}\n"
             result += "\n"
 
         result += "💡 Для просмотра всех элементов используйте GUI версию программы."
@@ -875,31 +812,7 @@ class ChemistryBot:
 
     def get_solubility_info(self):
         """Получить информацию о растворимости"""
-        return """💧 Таблица растворимости солей в воде:
-
-КАТИОНЫ:
-• Li⁺, Na⁺, K⁺, Rb⁺, Cs⁺, Fr⁺ - Все соли растворимы
-• NH₄⁺ - Все соли растворимы
-• Ag⁺ - Растворимы: NO₃⁻, ClO₄⁻, CH₃COO⁻; Нерастворимы: Cl⁻, Br⁻, I⁻, S²⁻, SO₃²⁻, CO₃²⁻, PO₄³⁻, CrO₄²⁻
-• Hg₂²⁺ - Растворимы: NO₃⁻, ClO₄⁻; Нерастворимы: Cl⁻, Br⁻, I⁻, S²⁻
-• Pb²⁺ - Растворимы: NO₃⁻, ClO₄⁻, CH₃COO⁻; Нерастворимы: Cl⁻, Br⁻, I⁻, S²⁻, SO₃²⁻, CO₃²⁻, PO₄³⁻, CrO₄²⁻
-• Hg²⁺ - Растворимы: NO₃⁻, ClO₄⁻; Нерастворимы: Cl⁻, Br⁻, I⁻, S²⁻, SO₃²⁻, CO₃²⁻
-• Ba²⁺ - Нерастворимы: SO₄²⁻, CO₃²⁻, PO₄³⁻, S²⁻, SO₃²⁻, CrO₄²⁻
-• Sr²⁺ - Нерастворимы: SO₄²⁻, CO₃²⁻, PO₄³⁻, S²⁻, SO₃²⁻
-• Ca²⁺ - Нерастворимы: CO₃²⁻, PO₄³⁻, S²⁻, SO₃²⁻; Малорастворимы: SO₄²⁻
-• Mg²⁺ - Нерастворимы: CO₃²⁻, PO₄³⁻, S²⁻, SO₃²⁻
-• Zn²⁺, Cd²⁺, Co²⁺, Ni²⁺ - Нерастворимы: S²⁻, CO₃²⁻, PO₄³⁻
-• Fe²⁺, Fe³⁺, Al³⁺, Cr³⁺ - Нерастворимы: S²⁻, CO₃²⁻, PO₄³⁻
-• Cu²⁺ - Нерастворимы: S²⁻, CO₃²⁻, PO₄³⁻, SO₃²⁻
-• Mn²⁺ - Нерастворимы: S²⁻, CO₃²⁻, PO₄³⁻
-
-АНИОНЫ:
-• NO₃⁻, ClO₄⁻, CH₃COO⁻ - Все соли растворимы
-• Cl⁻, Br⁻, I⁻ - Нерастворимы только с Ag⁺, Pb²⁺, Hg₂²⁺, Cu⁺
-• SO₄²⁻ - Нерастворимы только с Ba²⁺, Sr²⁺, Pb²⁺, Ca²⁺ (малорастворим)
-• CO₃²⁻, PO₄³⁻, S²⁻, SO₃²⁻, CrO₄²⁻ - Нерастворимы с большинством металлов
-
-💡 Правило: "Все нитраты растворимы, все сульфиды нерастворимы" (кроме щелочных металлов)"""
+        return format_solubility_table()
 
     def get_acids_bases_info(self):
         """Получить информацию о кислотах и основаниях"""
@@ -946,7 +859,10 @@ class ChemistryBot:
 АМФОТЕРНЫЕ ГИДРОКСИДЫ:
 • Zn(OH)₂, Al(OH)₃, Pb(OH)₂, Sn(OH)₂, Cr(OH)₃
 
-💡 Амфотерные гидроксиды реагируют и с кислотами, и с щелочами!"""
+💡 Амфотерные гидроксиды реагируют и с кислотами, и с щелочами!
+
+📊 Расчет pH: отправьте "pH 0.1M CH3COOH"
+• Буфер: pH 0.1M CH3COOH + 0.1M CH3COONa"""
 
     def get_reference_info(self):
         """Получить справочную информацию"""
@@ -1022,11 +938,13 @@ pH и pOH:
 • CaCO₃: 4.8 × 10⁻⁹
 • Fe(OH)₂: 4.8 × 10⁻¹⁶
 • Fe(OH)₃: 2.6 × 10⁻³⁹
+• Растворимость с одноименным ионом: /ksp AgCl 0.1 Cl
 
 ТЕРМОХИМИЧЕСКИЕ КОНСТАНТЫ:
 • Стандартная температура: 298 K (25°C)
 • Стандартное давление: 101325 Па = 1 атм
-• Энтальпия образования воды: ΔH = -285.8 кДж/моль"""
+• Энтальпия образования воды: ΔH = -285.8 кДж/моль
+• Расчет ΔH, ΔS и ΔG реакции: /thermo CaCO3 -> CaO + CO2"""
 
     def get_redox_info(self):
         """Получить информацию об ОВР"""
@@ -1158,6 +1076,12 @@ class TelegramChemistryBot:
 • /reference - Справочник
 • /constants - Физические константы
 • /redox - Окислительно-восстановительные реакции
+• /thermo - ΔH, ΔS и ΔG реакции
+• /titration - Кривая титрования
+• /ksp - Растворимость по Ksp
+• /mass - Формулы с заданной молярной массой
+• /isotopes - Изотопное распределение вещества
+• /electrons - Электронная конфигурация элемента
 
 💡 ПРОФЕССИОНАЛЬНЫЕ СОВЕТЫ:
 • Все данные сохраняются между сессиями
@@ -1194,6 +1118,119 @@ class TelegramChemistryBot:
         info = self.chemistry.get_constants_info()
         await update.message.reply_text(info)
 
+    async def thermo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """ΔH°, ΔS° и ΔG° реакции: /thermo CaCO3 -> CaO + CO2"""
+        query = ' '.join(context.args)
+        if not query:
+            await update.message.reply_text("🔥 Укажите реакцию: /thermo CaCO3 -> CaO + CO2 или /thermo CH4 + O2")
+            return
+
+        thermo = self.chemistry.neural_predictor.thermochemistry(query)
+        if thermo is None:
+            await update.message.reply_text(f"❌ Нет термодинамических данных для: {query}")
+            return
+
+        equation = render_equation(thermo['reactants'], thermo['products'], thermo['coefficients'])
+        await update.message.reply_text(f"⚖️ {equation}\n\n{format_thermo(thermo)}")
+
+    async def titration_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Кривая титрования: /titration CH3COOH 0.1 25 NaOH 0.1"""
+        usage = "📈 Укажите: /titration <кислота> <C, M> <V, мл> <титрант> <C, M>\nНапример: /titration CH3COOH 0.1 25 NaOH 0.1"
+        if len(context.args) != 5:
+            await update.message.reply_text(usage)
+            return
+
+        analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration = context.args
+        try:
+            curve = titration_curve(analyte, float(analyte_concentration.replace(',', '.')),
+                                    float(analyte_volume.replace(',', '.')), titrant,
+                                    float(titrant_concentration.replace(',', '.')))
+        except ValueError:
+            await update.message.reply_text(usage)
+            return
+        if curve is None:
+            await update.message.reply_text(f"❌ Нет констант для титрования {analyte} раствором {titrant}")
+            return
+
+        await update.message.reply_text(format_titration(curve))
+        await update.message.reply_document(document=curve_svg(curve).encode(),
+                                            filename=f"titration_{analyte}_{titrant}.svg")
+
+    async def ksp_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Растворимость по Ksp: /ksp AgCl или /ksp AgCl 0.1 Cl"""
+        usage = "🧂 Укажите соль: /ksp AgCl или с одноименным ионом: /ksp AgCl 0.1 Cl"
+        if len(context.args) not in (1, 3):
+            await update.message.reply_text(usage)
+            return
+
+        salt = context.args[0]
+        ions = ksp_ions(salt)
+        if ions is None:
+            await update.message.reply_text(f"❌ Нет произведения растворимости для {salt}")
+            return
+
+        cation = anion = 0.0
+        if len(context.args) == 3:
+            try:
+                concentration = float(context.args[1].replace(',', '.'))
+            except ValueError:
+                await update.message.reply_text(usage)
+                return
+            ion = context.args[2]
+            if ion == ions[0][0]:
+                cation = concentration
+            elif ion == ions[2]:
+                anion = concentration
+            else:
+                await update.message.reply_text(f"❌ {ion} не входит в состав {salt}")
+                return
+
+        await update.message.reply_text(format_ksp(salt, cation, anion))
+
+    async def mass_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Формулы по молярной массе: /mass 180.16 CHNO 0.05"""
+        usage = "🔎 Укажите массу, элементы и допуск: /mass 180.16 CHNO 0.05"
+        if not 1 <= len(context.args) <= 3:
+            await update.message.reply_text(usage)
+            return
+
+        try:
+            mass = float(context.args[0].replace(',', '.'))
+            tolerance = float(context.args[2].replace(',', '.')) if len(context.args) == 3 else DEFAULT_TOLERANCE
+            elements = parse_elements(context.args[1]) if len(context.args) > 1 else ('C', 'H', 'N', 'O')
+            # Перебор идет в отдельном потоке, чтобы не блокировать бота
+            results = await asyncio.to_thread(formulas_for_mass, mass, tolerance, elements)
+        except ValueError as e:
+            await update.message.reply_text(f"❌ {e}\n\n{usage}")
+            return
+
+        await update.message.reply_text(format_mass_search(mass, results, tolerance))
+
+    async def isotopes_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Изотопное распределение: /isotopes CH2Cl2"""
+        if len(context.args) != 1:
+            await update.message.reply_text("📊 Укажите формулу: /isotopes CH2Cl2")
+            return
+
+        formula = context.args[0]
+        peaks = isotope_pattern(formula)
+        if not peaks:
+            await update.message.reply_text(f"❌ Нет данных об изотопах для {formula}")
+            return
+        await update.message.reply_text(format_pattern(formula, peaks))
+
+    async def electrons_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Электронная конфигурация: /electrons Fe, /electrons железо, /electrons 26"""
+        if not context.args:
+            await update.message.reply_text("⚛️ Укажите элемент: /electrons Fe")
+            return
+
+        info = electron_configuration(' '.join(context.args))
+        if info is None:
+            await update.message.reply_text(f"❌ Неизвестный элемент: {' '.join(context.args)}")
+            return
+        await update.message.reply_text(format_configuration(info))
+
     async def redox_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать информацию об ОВР"""
         info = self.chemistry.get_redox_info()
@@ -1397,6 +1434,22 @@ class TelegramChemistryBot:
         if text.startswith('/'):
             return
 
+        # Расчет pH: "pH 0.1M CH3COOH" работает в любом режиме
+        solution = parse_ph_query(text)
+        if solution:
+            value = solution_ph(solution)
+            if value is None:
+                await update.message.reply_text("❌ Нет констант диссоциации для этих веществ")
+            else:
+                await update.message.reply_text(format_ph(solution, value))
+            return
+
+        # Формула по массовым долям: "40% C, 6.7% H, 53.3% O; M = 180"
+        composition = parse_composition(text)
+        if composition:
+            await update.message.reply_text(format_formula_result(composition[0], empirical_formula(*composition)))
+            return
+
         # Проверяем состояние пользователя
         user_state = self.user_states.get(user_id, MAIN_MENU)
 
@@ -1475,6 +1528,29 @@ class TelegramChemistryBot:
             """
             await query.edit_message_text(ai_info)
 
+    async def inline_query(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Подсказки в режиме '@бот запрос': формулы, названия и известные реакции"""
+        prefix = update.inline_query.query.strip()
+        if not prefix:
+            return
+
+        results = []
+        for i, item in enumerate(self.chemistry.neural_predictor.suggest_index.suggest(prefix)):
+            if item.get('products'):
+                description = f"→ {item['products']}"
+            elif item.get('formula'):
+                description = item['formula']
+            else:
+                description = "Формула вещества"
+            results.append(InlineQueryResultArticle(
+                id=str(i),
+                title=item['text'],
+                description=description,
+                input_message_content=InputTextMessageContent(item['text'])
+            ))
+
+        await update.inline_query.answer(results, cache_time=300)
+
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Обработчик ошибок"""
         logger.error(f"Update {update} caused error {context.error}")
@@ -1505,6 +1581,12 @@ def main():
         BotCommand("reference", "📚 Справочник по химии"),
         BotCommand("constants", "🔬 Физические константы"),
         BotCommand("redox", "⚡ Окислительно-восстановительные реакции"),
+        BotCommand("thermo", "🔥 Термохимия реакции (ΔH, ΔS, ΔG)"),
+        BotCommand("titration", "📈 Кривая титрования"),
+        BotCommand("ksp", "🧂 Растворимость по Ksp"),
+        BotCommand("mass", "🔎 Формулы по молярной массе"),
+        BotCommand("isotopes", "📊 Изотопное распределение"),
+        BotCommand("electrons", "⚛️ Электронная конфигурация"),
     ]
     
     # Устанавливаем команды через post_init callback
@@ -1522,6 +1604,12 @@ def main():
     application.add_handler(CommandHandler("reference", bot.reference_command))
     application.add_handler(CommandHandler("constants", bot.constants_command))
     application.add_handler(CommandHandler("redox", bot.redox_command))
+    application.add_handler(CommandHandler("thermo", bot.thermo_command))
+    application.add_handler(CommandHandler("titration", bot.titration_command))
+    application.add_handler(CommandHandler("ksp", bot.ksp_command))
+    application.add_handler(CommandHandler("mass", bot.mass_command))
+    application.add_handler(CommandHandler("isotopes", bot.isotopes_command))
+    application.add_handler(CommandHandler("electrons", bot.electrons_command))
     application.add_handler(CommandHandler("neural", bot.neural_command))
     application.add_handler(CommandHandler("train", bot.train_neural_command))
 
@@ -1531,6 +1619,9 @@ def main():
     # Обработчик callback запросов
     application.add_handler(CallbackQueryHandler(bot.handle_callback))
 
+    # Подсказки в inline-режиме
+    application.add_handler(InlineQueryHandler(bot.inline_query))
+
     # Обработчик текстовых сообщений
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message))
 
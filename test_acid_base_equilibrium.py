@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Тест расчета pH кислот, оснований, солей и буферов
+"""
+
+import numpy as np
+
+from acid_base_equilibrium import buffer_ph, parse_ph_query, ph
+from chemistry_data import ACID_CONSTANTS, ACIDS
+
+
+def test_ph_values():
+    """Сильные и слабые, многоосновные кислоты, основания и гидролиз солей"""
+    cases = [
+        ('HCl', 0.1, 1.00), ('HCl', 1e-8, 6.98), ('CH3COOH', 0.1, 2.88),
+        ('H2SO4', 0.1, 0.96), ('H3PO4', 0.1, 1.63), ('NaOH', 0.01, 12.00),
+        ('Ba(OH)2', 0.01, 12.30), ('NH3', 0.1, 11.12), ('NH4Cl', 0.1, 5.13),
+        ('CH3COONa', 0.1, 8.87), ('Na2CO3', 0.1, 11.65), ('NaCl', 0.1, 7.00),
+    ]
+
+    for formula, concentration, expected in cases:
+        value = ph(formula, concentration)
+        print(f"📊 {concentration} M {formula}: pH = {value:.2f}")
+        assert abs(value - expected) < 0.01
+
+    assert abs(buffer_ph('CH3COOH', 0.1, 'CH3COONa', 0.1) - 4.74) < 0.01
+    assert ph('Mg(OH)2', 0.1) is None
+
+    # Константы заданы только для известных кислот
+    assert set(ACID_CONSTANTS) <= set(ACIDS)
+
+
+def test_vectorized_concentrations():
+    """Ряд концентраций считается за один вызов"""
+    concentrations = np.logspace(-4, 0, 50)
+    values = ph('CH3COOH', concentrations)
+    assert values.shape == (50,)
+    assert np.all(np.diff(values) < 0)
+    assert abs(values[-1] - ph('CH3COOH', 1.0)) < 1e-9
+
+
+def test_parse_ph_query():
+    """Запросы бота: формулы, названия, буферы"""
+    assert parse_ph_query('pH 0.1M CH3COOH') == {'CH3COOH': 0.1}
+    assert parse_ph_query('pH 0,1 М уксусной кислоты') == {'CH3COOH': 0.1}
+    assert parse_ph_query('ph 0.01M naoh') == {'NaOH': 0.01}
+    assert parse_ph_query('pH 0.1M CH3COOH + 0.1M CH3COONa') == {'CH3COOH': 0.1, 'CH3COONa': 0.1}
+    assert parse_ph_query('Zn + HCl') is None
+
+
+if __name__ == "__main__":
+    test_ph_values()
+    test_vectorized_concentrations()
+    test_parse_ph_query()
+    print("✅ УСПЕХ")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Тест горения по составу топлива
+"""
+
+from chemistry_core import balance
+from combustion import combustion
+from simple_neural_chemistry import SimpleNeuralChemistry
+
+
+def test_combustion_equations():
+    """Полное и неполное горение CxHyOzNwSv"""
+    cases = [
+        ('CH4', True, "CH4 + 2O2 → CO2 + 2H2O"),
+        ('C8H18', True, "2C8H18 + 25O2 → 16CO2 + 18H2O"),
+        ('C2H5OH', False, "C2H5OH + 2O2 → 2CO + 3H2O"),
+        ('CH3NH2', True, "4CH3NH2 + 9O2 → 4CO2 + 10H2O + 2N2"),
+        ('C2H5SH', True, "2C2H5SH + 9O2 → 4CO2 + 6H2O + 2SO2"),
+    ]
+
+    for fuel, complete, expected in cases:
+        result = combustion(fuel, complete)
+        print(f"🔥 {result['equation']}")
+        assert result['equation'] == expected
+        # Формулы дают те же коэффициенты, что и общий решатель
+        assert result['coefficients'] == balance(result['reactants'], result['products'])
+
+    assert combustion('CO2') is None
+    assert combustion('NaCl') is None
+
+
+def test_simple_engine_combustion():
+    """Простой движок берет продукты горения из combustion() и уравнивает их"""
+    engine = SimpleNeuralChemistry()
+    assert engine.predict_reaction('C8H18 + O2') == 'CO2+H2O'
+    assert engine.predict_equation('C8H18 + O2') == "2C8H18 + 25O2 → 16CO2 + 18H2O"
+    assert engine.predict_equation('NH3 + O2') == "4NH3 + 3O2 → 6H2O + 2N2"
+    assert engine.predict_reaction('Mg + O2') == 'MgO'
+
+
+if __name__ == "__main__":
+    test_combustion_equations()
+    test_simple_engine_combustion()
+    print("✅ УСПЕХ")
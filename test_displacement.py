@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Тест реакций замещения по ряду активности
+"""
+
+from displacement import displacement_predictor
+from simple_neural_chemistry import SimpleNeuralChemistry
+
+
+def test_displacement_predictions():
+    """Металл + соль, металл + кислота и случаи без реакции"""
+    cases = [
+        ('Zn', 'CuSO4', "Zn + CuSO4 → ZnSO4 + Cu"),
+        ('Al', 'CuSO4', "2Al + 3CuSO4 → Al2(SO4)3 + 3Cu"),
+        ('Cu', 'AgNO3', "Cu + 2AgNO3 → Cu(NO3)2 + 2Ag"),
+        ('Al', 'H2SO4', "2Al + 3H2SO4 → Al2(SO4)3 + 3H2↑"),
+        ('Cu', 'ZnSO4', "Cu + ZnSO4 ≠"),
+        ('Cu', 'HCl', "Cu + HCl ≠"),
+        ('Na', 'CuSO4', "Na + CuSO4 ≠"),
+        ('Sr', 'HCl', "Sr + 2HCl → SrCl2 + H2↑"),
+        ('Cs', 'HCl', "2Cs + 2HCl → 2CsCl + H2↑"),
+        ('Ti', 'HCl', "2Ti + 6HCl → 2TiCl3 + 3H2↑"),
+        ('Bi', 'HCl', "Bi + HCl ≠"),
+        ('Sr', 'CuSO4', "Sr + CuSO4 ≠"),
+    ]
+
+    for metal, other, expected in cases:
+        result = displacement_predictor.predict(metal, other)
+        print(f"🧪 {result['equation']} ({result['reason']})")
+        assert result['equation'] == expected
+
+    # Азотная кислота - окислитель, вытеснением водорода не описывается
+    assert displacement_predictor.predict('Cu', 'HNO3') is None
+    assert displacement_predictor.predict('Zn', 'NaOH') is None
+
+    # Пара берется по заряду катиона соли: Cr3+/Cr (-0.74 В), а не Cr2+/Cr
+    result = displacement_predictor.predict('Zn', 'CrCl3')
+    assert result['proceeds'] and result['reason'].endswith("ЭДС +0.02 В")
+
+
+def test_simple_engine_uses_potentials():
+    """Простой движок не выдает реакции металлов правее водорода с HCl"""
+    engine = SimpleNeuralChemistry()
+    for metal in ('Cu', 'Ag', 'Au'):
+        assert engine.predict_reaction(f'{metal} + HCl') is None
+    assert engine.predict_reaction('Zn + HCl') == 'ZnCl2+H2'
+
+
+if __name__ == "__main__":
+    test_displacement_predictions()
+    test_simple_engine_uses_potentials()
+    print("✅ УСПЕХ")
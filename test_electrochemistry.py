@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Тест электродных потенциалов и ЭДС окислительно-восстановительных пар
+"""
+
+from chemistry_data import METAL_ACTIVITY_SERIES
+from electrochemistry import (METAL_POTENTIALS, POTENTIALS, cell_potential, displacement_cell,
+                              reaction_cell, species_labels)
+
+
+def test_potential_index():
+    """Потенциалы полуреакций и металлов по ключу"""
+    assert POTENTIALS[('Zn2+', 'Zn')] == (2, -0.76)
+    assert POTENTIALS[('MnO4-', 'Mn2+')] == (5, 1.51)
+    assert METAL_POTENTIALS['H'] == 0.0
+    assert METAL_POTENTIALS['Fe'] == -0.44
+
+    # Потенциалы есть для всех металлов ряда активности
+    assert set(METAL_ACTIVITY_SERIES) <= set(METAL_POTENTIALS)
+
+
+def test_cell_potential():
+    """ЭДС, число электронов и ΔG°"""
+    cell = displacement_cell('Zn', 'Cu')
+    print(f"🔋 Zn | Cu: {cell['E_cell']} В, ΔG° = {cell['dG']} кДж")
+    assert cell['E_cell'] == 1.10 and cell['electrons'] == 2 and cell['spontaneous']
+    assert abs(cell['dG'] + 212.3) < 0.1
+
+    assert not displacement_cell('Cu', 'H')['spontaneous']
+    assert displacement_cell('Al', 'Cu')['electrons'] == 6
+    assert cell_potential(('Zn2+', 'Zn'), ('X', 'Y')) is None
+
+
+def test_reaction_cell():
+    """Пары окислителя и восстановителя находятся по веществам уравнения"""
+    assert species_labels('KMnO4') == {'KMnO4', 'K+', 'MnO4-'}
+    assert species_labels('Al2(SO4)3') == {'Al2(SO4)3', 'Al3+', 'SO42-'}
+
+    cell = reaction_cell(['KMnO4', 'HCl'], ['KCl', 'MnCl2', 'Cl2', 'H2O'])
+    assert cell['cathode'] == ('MnO4-', 'Mn2+') and cell['anode'] == ('Cl2', 'Cl-')
+    assert cell['E_cell'] == 0.15 and cell['electrons'] == 10
+
+    cell = reaction_cell(['FeCl3', 'KI'], ['FeCl2', 'KCl', 'I2'])
+    assert cell['cathode'] == ('Fe3+', 'Fe2+') and cell['spontaneous']
+
+    assert reaction_cell(['NaOH', 'HCl'], ['NaCl', 'H2O']) is None
+
+
+if __name__ == "__main__":
+    test_potential_index()
+    test_cell_potential()
+    test_reaction_cell()
+    print("✅ УСПЕХ")
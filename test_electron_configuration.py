@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Тест электронных конфигураций
+"""
+
+from chemistry_data import ELEMENT_SYMBOLS
+from electron_configuration import ELECTRON_CONFIGURATIONS, OCCUPANCIES, electron_configuration
+
+
+def test_configurations():
+    """Правило Клечковского и исключения"""
+    assert electron_configuration('O')['configuration'] == '1s2 2s2 2p4'
+    assert electron_configuration('Fe')['short'] == '[Ar] 3d6 4s2'
+    assert electron_configuration('Cr')['short'] == '[Ar] 3d5 4s1'
+    assert electron_configuration('Cu')['short'] == '[Ar] 3d10 4s1'
+    assert electron_configuration('Pd')['short'] == '[Kr] 4d10'
+    assert electron_configuration('Gd')['short'] == '[Xe] 4f7 5d1 6s2'
+    assert electron_configuration('Lr')['short'] == '[Rn] 5f14 7s2 7p1'
+    assert electron_configuration('Cr')['exception'] and not electron_configuration('Fe')['exception']
+
+    # Сумма электронов равна атомному номеру у всех элементов
+    assert list(OCCUPANCIES.sum(axis=1)) == list(range(1, len(ELEMENT_SYMBOLS) + 1))
+    assert len(ELECTRON_CONFIGURATIONS) == 118
+
+    # Номер и непонятный ввод: '²' - не номер элемента
+    assert electron_configuration('26')['symbol'] == 'Fe'
+    assert electron_configuration('²') is None and electron_configuration('0') is None
+
+
+def test_valence_and_diagram():
+    """Валентные и неспаренные электроны"""
+    expected = {'H': (1, 1), 'C': (4, 2), 'N': (5, 3), 'Cl': (7, 1), 'Ne': (8, 0),
+                'Cr': (6, 6), 'Fe': (8, 4), 'Zn': (12, 0), 'Br': (7, 1)}
+    for symbol, (valence, unpaired) in expected.items():
+        info = electron_configuration(symbol)
+        assert (info['valence_electrons'], info['unpaired']) == (valence, unpaired), symbol
+
+    diagram = electron_configuration('N')['diagram']
+    assert diagram == [{'subshell': '2s', 'boxes': ['↑↓']}, {'subshell': '2p', 'boxes': ['↑', '↑', '↑']}]
+
+
+def test_lookup():
+    """Поиск по названию и атомному номеру"""
+    assert electron_configuration('железо')['symbol'] == 'Fe'
+    assert electron_configuration('copper')['symbol'] == 'Cu'
+    assert electron_configuration(26)['symbol'] == 'Fe'
+    assert electron_configuration('fe')['symbol'] == 'Fe'
+    assert electron_configuration('Xx') is None
+    assert electron_configuration(0) is None
+
+
+if __name__ == "__main__":
+    test_configurations()
+    test_valence_and_diagram()
+    test_lookup()
+    print("✅ УСПЕХ")
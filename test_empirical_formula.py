@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Тест поиска простейшей и молекулярной формулы по массовым долям
+"""
+
+from empirical_formula import empirical_formula, parse_composition, solve_worksheet
+
+
+def test_parse_composition():
+    """Доли символами и названиями, молярная масса"""
+    expected = {'C': 40.0, 'H': 6.7, 'O': 53.3}
+    assert parse_composition('40% C, 6.7% H, 53.3% O; M = 180') == (expected, 180.0)
+    assert parse_composition('C 40%, H 6,7%, O 53,3%') == (expected, None)
+    assert parse_composition('40% углерода, 6.7% водорода, 53.3% кислорода, молярная масса 60') == (expected, 60.0)
+    assert parse_composition('carbon 85.7%, hydrogen 14.3%')[0] == {'C': 85.7, 'H': 14.3}
+
+    # Меньше двух элементов или сумма долей далека от 100%
+    assert parse_composition('Zn + HCl') is None
+    assert parse_composition('C 40%, H 6.7%') is None
+
+
+def test_formulas():
+    """Простейшая формула, множитель для дробных отношений, молекулярная формула"""
+    result = empirical_formula({'C': 40, 'H': 6.7, 'O': 53.3}, 180)
+    print(f"🧪 {result['empirical']} -> {result['molecular']}")
+    assert result['empirical'] == 'CH2O' and result['molecular'] == 'C6H12O6'
+
+    assert empirical_formula({'Fe': 69.9, 'O': 30.1})['empirical'] == 'Fe2O3'
+    assert empirical_formula({'K': 26.6, 'Cr': 35.4, 'O': 38.0})['empirical'] == 'K2Cr2O7'
+    assert empirical_formula({'Na': 32.4, 'S': 22.6, 'O': 45.0})['empirical'] == 'Na2SO4'
+
+    # Углерод без водорода - неорганическое вещество, порядок не по Хиллу
+    assert empirical_formula({'Ca': 40, 'C': 12, 'O': 48})['empirical'] == 'CaCO3'
+
+    # Молярная масса не кратна простейшей формуле
+    assert empirical_formula({'C': 40, 'H': 6.7, 'O': 53.3}, 100)['molecular'] is None
+
+
+def test_worksheet():
+    """Лист задач решается одним вызовом, нераспознанные строки - None"""
+    results = solve_worksheet(['P 43.6%, O 56.4%, M = 284', 'не задача', 'N 30.4%, O 69.6%, M = 92',
+                               'C 92.3%, H 7.7%, M = 78'])
+    assert results[1] is None
+    assert [r['molecular'] for r in results if r] == ['P4O10', 'N2O4', 'C6H6']
+    assert results[0]['empirical'] == 'P2O5'
+
+
+if __name__ == "__main__":
+    test_parse_composition()
+    test_formulas()
+    test_worksheet()
+    print("✅ УСПЕХ")
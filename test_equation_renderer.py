@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Тест вывода уравнений в разных форматах
+"""
+
+from equation_renderer import render_equation
+from telegram_chemistry_bot import ChemistryBot
+
+
+def test_formats():
+    """Одно уравнение - пять форматов"""
+    reactants, products = ['Al', 'H2SO4'], ['Al2(SO4)3', 'H2']
+    coefficients, marks = [2, 3, 1, 3], {'H2': '↑'}
+
+    expected = {
+        'plain': "2Al + 3H2SO4 → Al2(SO4)3 + 3H2↑",
+        'unicode': "2Al + 3H₂SO₄ → Al₂(SO₄)₃ + 3H₂↑",
+        'html': "2Al + 3H<sub>2</sub>SO<sub>4</sub> → Al<sub>2</sub>(SO<sub>4</sub>)<sub>3</sub> + 3H<sub>2</sub>↑",
+        'latex': r"2\,\mathrm{Al} + 3\,\mathrm{H_{2}SO_{4}} \rightarrow \mathrm{Al_{2}(SO_{4})_{3}} + 3\,\mathrm{H_{2}}\uparrow",
+        'markdown_v2': "2Al \\+ 3H₂SO₄ → Al₂\\(SO₄\\)₃ \\+ 3H₂↑",
+    }
+
+    for fmt, text in expected.items():
+        result = render_equation(reactants, products, coefficients, marks, fmt)
+        print(f"{fmt}: {result}")
+        assert result == text
+
+    # Без продуктов - реакция не идет
+    assert render_equation(['NaCl', 'KNO3'], [], fmt='unicode') == "NaCl + KNO₃ ≠"
+
+
+def test_unbalanceable():
+    """Нулевые и отрицательные коэффициенты не выдаются за решение"""
+    bot = ChemistryBot()
+    for equation in ['NaCl -> KCl', 'Na + H2O -> NaOH', 'H2O -> H2O2']:
+        assert bot.balance_equation(equation).startswith("❌ Не удалось сбалансировать"), equation
+    assert "2H2 + O2 → 2H2O" in bot.balance_equation('H2 + O2 -> H2O')
+
+
+if __name__ == "__main__":
+    test_formats()
+    test_unbalanceable()
+    print("✅ УСПЕХ")
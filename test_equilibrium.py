@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Тест расчета равновесного состава (таблица ICE)
+"""
+
+import numpy as np
+
+from equilibrium import equilibrium, solve_equilibria, stoichiometry
+
+
+def test_single_reaction():
+    """Одна реакция: найденный состав дает заданную K"""
+    result = equilibrium(['N2O4'], ['NO2'], 4.6e-3, {'N2O4': 0.1})
+    c = result['concentrations']
+    print(f"⚖️ N2O4 = {c['N2O4']:.4f}, NO2 = {c['NO2']:.4f}")
+    assert abs(c['NO2'] ** 2 / c['N2O4'] - 4.6e-3) < 1e-12
+    assert abs(c['N2O4'] + result['extent'] - 0.1) < 1e-12
+
+    # H2 + I2 = 2HI, K = 50: x = 0.78 из 1 моль/л
+    result = equilibrium(['H2', 'I2'], ['HI'], 50.0, {'H2': 1, 'I2': 1})
+    assert abs(result['extent'] - 0.7795) < 1e-4
+
+    # Обратное направление: из одного продукта
+    result = equilibrium(['H2', 'I2'], ['HI'], 50.0, {'HI': 2})
+    assert result['extent'] < 0
+    assert abs(result['concentrations']['HI'] - 1.559) < 1e-3
+
+    assert equilibrium(['H2'], ['O2'], 1.0, {'H2': 1}) is None
+
+
+def test_batch_conditions():
+    """Ряд начальных условий решается одним вызовом"""
+    nitrogen = np.linspace(0.5, 3, 100)
+    c = equilibrium(['N2', 'H2'], ['NH3'], 0.5, {'N2': nitrogen, 'H2': 3})['concentrations']
+    assert c['NH3'].shape == (100,)
+    assert np.allclose(c['NH3'] ** 2 / (c['N2'] * c['H2'] ** 3), 0.5)
+    assert np.allclose(c['N2'] + c['NH3'] / 2, nitrogen)
+
+
+def test_reaction_system():
+    """Две связанные реакции - метод Ньютона"""
+    reactions = [(['CO', 'H2O'], ['CO2', 'H2'], None), (['CO', 'H2'], ['CH4', 'H2O'], None)]
+    species, matrix = stoichiometry(reactions)
+    assert species == ['CO', 'H2O', 'CO2', 'H2', 'CH4']
+    assert matrix[:, 1].tolist() == [-1, 1, 0, -3, 1]
+
+    result = solve_equilibria(reactions, [1.5, 10.0], {'CO': np.linspace(0.5, 2, 50), 'H2O': 1, 'H2': 2})
+    c = result['concentrations']
+    assert np.allclose(c['CO2'] * c['H2'] / (c['CO'] * c['H2O']), 1.5)
+    assert np.allclose(c['CH4'] * c['H2O'] / (c['CO'] * c['H2'] ** 3), 10.0)
+    assert all(np.all(value > 0) for value in c.values())
+
+
+if __name__ == "__main__":
+    test_single_reaction()
+    test_batch_conditions()
+    test_reaction_system()
+    print("✅ УСПЕХ")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Тест исправления регистра и опечаток в формулах
+"""
+
+from advanced_neural_chemistry import advanced_neural_predictor
+from formula_correction import correct_formula, correct_query, segmentations
+
+
+def test_formula_correction():
+    """Регистр, опечатки и правильно записанные формулы"""
+    cases = [
+        ('hcl', 'HCl'), ('naoh', 'NaOH'), ('Nacl', 'NaCl'), ('NaCL', 'NaCl'),
+        ('kmno4', 'KMnO4'), ('ba(oh)2', 'Ba(OH)2'), ('Al2(so4)3', 'Al2(SO4)3'),
+        ('2h2o', '2H2O'), ('AgNo3', 'AgNO3'), ('h2s04', 'H2SO4'), ('Nacll', 'NaCl'),
+        ('c6h6', 'C6H6'), ('Co', 'Co'), ('co', 'CO'), ('C6H6', 'C6H6'),
+        ('balance', 'balance'), ('pH', 'pH'), ('base', 'base'), ('nacll', 'nacll'),
+    ]
+
+    for term, expected in cases:
+        corrected = correct_formula(term)
+        print(f"🔡 {term} -> {corrected}")
+        assert corrected == expected
+
+    # Автомат перебирает разбиения с откатом: сначала длинные символы
+    assert segmentations('co') == ['Co', 'CO']
+    assert correct_query('balance h2 + o2 -> h2o') == 'balance H2 + O2 -> H2O'
+
+    # Обычные английские слова не превращаются в формулы
+    assert correct_query('what is a base and an acid') == 'what is a base and an acid'
+
+
+def test_engine_corrects_queries():
+    """Исправление работает до решения запроса"""
+    result = advanced_neural_predictor.solve_structured('Nacl + AgNo3')
+    assert result.equation == 'NaCl + AgNO3 → AgCl↓ + NaNO3'
+
+
+if __name__ == "__main__":
+    test_formula_correction()
+    test_engine_corrects_queries()
+    print("✅ УСПЕХ")
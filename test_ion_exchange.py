@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Тест предсказания реакций ионного обмена
+"""
+
+from ion_exchange import (IonExchangePredictor, format_solubility_table, generate_exchange_table,
+                          ion_exchange_predictor, load_exchange_table, make_compound, solubility,
+                          split_ions)
+
+
+def test_ions_and_table():
+    """Разложение на ионы, сборка формул и таблица растворимости"""
+    assert split_ions('Al2(SO4)3') == (('Al', 3), 2, 'SO4', 3)
+    assert split_ions('(NH4)2SO4') == (('NH4', 1), 2, 'SO4', 1)
+    assert split_ions('CH3COONa') == (('Na', 1), 1, 'CH3COO', 1)
+    assert split_ions('KMnO4') is None
+
+    assert make_compound(('Al', 3), 'SO4') == 'Al2(SO4)3'
+    assert make_compound(('Ca', 2), 'PO4') == 'Ca3(PO4)2'
+    assert make_compound(('Fe', 3), 'OH') == 'Fe(OH)3'
+
+    assert solubility(('Ba', 2), 'SO4') == 'Н'
+    assert solubility(('Na', 1), 'Cl') == 'Р'
+    for cation in (('Ba', 2), ('Ca', 2), ('Mg', 2), ('Sr', 2)):
+        assert solubility(cation, 'SiO3') == 'Н'
+
+    # Текст для бота строится из той же таблицы
+    assert "• Ba²⁺ - Нерастворимы: SO₃²⁻, SO₄²⁻, PO₄³⁻, CO₃²⁻, SiO₃²⁻" in format_solubility_table()
+
+
+def test_exchange_predictions():
+    """Осадок, газ, вода, гидролиз и отсутствие реакции"""
+    cases = [
+        ('BaCl2', 'Na2SO4', "BaCl2 + Na2SO4 → BaSO4↓ + 2NaCl"),
+        ('Na2CO3', 'HCl', "Na2CO3 + 2HCl → 2NaCl + H2O + CO2↑"),
+        ('CuO', 'H2SO4', "CuO + H2SO4 → CuSO4 + H2O"),
+        ('AlCl3', 'Na2CO3', "2AlCl3 + 3Na2CO3 + 3H2O → 2Al(OH)3↓ + 6NaCl + 3CO2↑"),
+        ('CaCl2', 'Na2SiO3', "CaCl2 + Na2SiO3 → CaSiO3↓ + 2NaCl"),
+        ('NaCl', 'KNO3', "NaCl + KNO3 ≠"),
+    ]
+
+    for first, second, expected in cases:
+        result = ion_exchange_predictor.predict(first, second)
+        print(f"🧪 {result['equation']} ({result['reason']})")
+        assert result['equation'] == expected
+
+
+def test_table_matches_derivation():
+    """Готовая таблица совпадает с выводом по ионам в любом порядке реагентов"""
+    table = generate_exchange_table()
+    # Файл должен быть пересоздан после любой правки таблицы растворимости
+    assert load_exchange_table() == table, "exchange_reactions.json устарел: python ion_exchange.py"
+
+    deriving = IonExchangePredictor(table={})
+    for key in list(table)[::250]:
+        first, second = table[key][0][:2]
+        for pair in ((first, second), (second, first)):
+            assert ion_exchange_predictor.predict(*pair) == deriving.predict(*pair)
+
+
+if __name__ == "__main__":
+    test_ions_and_table()
+    test_exchange_predictions()
+    test_table_matches_derivation()
+    print("✅ УСПЕХ")
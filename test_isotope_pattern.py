@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Тест изотопного распределения
+"""
+
+import time
+
+from chemistry_data import ISOTOPES
+from isotope_pattern import isotope_pattern, monoisotopic_mass
+
+
+def test_small_molecules():
+    """Распределения хлора, брома и органических веществ"""
+    chlorine = isotope_pattern('Cl2')
+    assert [p['nominal'] for p in chlorine] == [70, 72, 74]
+    assert [p['abundance'] for p in chlorine] == [100.0, 63.92, 10.22]
+
+    bromine = isotope_pattern('Br2')
+    assert max(bromine, key=lambda p: p['abundance'])['nominal'] == 160
+
+    # M+1 у метана - 13C и 2H
+    methane = isotope_pattern('CH4')
+    assert methane[0]['mass'] == 16.0313 and abs(methane[1]['abundance'] - 1.13) < 0.01
+
+    assert monoisotopic_mass('C6H12O6') == 180.0634
+    assert isotope_pattern('Xe2') is None
+
+    # Доли изотопов каждого элемента в сумме дают 1
+    for element, isotopes in ISOTOPES.items():
+        assert abs(sum(abundance for _, abundance in isotopes) - 1) < 1e-3, element
+
+
+def test_large_formula():
+    """Большая молекула считается быстро, повторный запрос - из кэша"""
+    start = time.perf_counter()
+    peaks = isotope_pattern('C254H377N65O75S6')
+    elapsed = time.perf_counter() - start
+    print(f"⏱ {len(peaks)} пиков за {elapsed * 1000:.1f} мс")
+    assert elapsed < 0.1
+
+    total = sum(p['probability'] for p in isotope_pattern('C254H377N65O75S6', threshold=0))
+    assert abs(total - 1) < 1e-6
+
+    # Наибольший пик сдвинут от моноизотопного на несколько единиц
+    top = max(peaks, key=lambda p: p['abundance'])
+    assert top['mass'] - monoisotopic_mass('C254H377N65O75S6') > 2
+
+
+if __name__ == "__main__":
+    test_small_molecules()
+    test_large_formula()
+    print("✅ УСПЕХ")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Тест кинетики элементарных механизмов
+"""
+
+import numpy as np
+
+from kinetics import Mechanism, parse_step, simulate
+
+
+def test_mechanism_matrices():
+    """Матрица коэффициентов и порядки стадий из уравнений"""
+    assert parse_step('2NO + O2 -> 2NO2') == (['NO', 'O2'], ['NO2'], [2, 1, 2])
+    assert parse_step('NO + O2') is None
+
+    # Катализатор входит в порядок стадии, но не в итоговую матрицу
+    mechanism = Mechanism([('A + E -> C + E', 2.0), ('C -> B', 1.0)])
+    assert mechanism.species == ['A', 'E', 'C', 'B']
+    assert mechanism.matrix[:, 0].tolist() == [-1, 0, 1, 0]
+    assert mechanism.orders[:, 0].tolist() == [1, 1, 0, 0]
+    assert mechanism.rates(np.array([0.5, 0.1, 0.2, 0])).tolist() == [0.1, 0.2]
+
+
+def test_analytic_solutions():
+    """Сравнение с аналитическими решениями"""
+    # A -> B -> C, k1 = 1, k2 = 0.5: [B] = 2(e^-0.5t - e^-t)
+    mechanism = Mechanism([('A -> B', 1.0), ('B -> C', 0.5)])
+    t, c = list(mechanism.simulate({'A': 1}, 10))[-1]
+    assert t == 10
+    assert abs(c[0] - np.exp(-10)) < 1e-6
+    assert abs(c[1] - 2 * (np.exp(-5) - np.exp(-10))) < 1e-6
+    assert abs(c.sum() - 1) < 1e-9
+
+    # 2A -> B: 1/[A] = 1/[A]0 + 2kt
+    t, c = list(Mechanism([('2A -> B', 1.0)]).simulate({'A': 1}, 10))[-1]
+    assert abs(c[0] - 1 / 21) < 1e-6
+
+
+def test_streaming():
+    """Точки отдаются по одной, без расчета всей кривой заранее"""
+    points = simulate([('2NO + O2 -> 2NO2', 7e3)], {'NO': 0.01, 'O2': 0.01}, 100)
+    t, c = next(points)
+    assert t == 0 and c == {'NO': 0.01, 'O2': 0.01, 'NO2': 0.0}
+    t, c = next(points)
+    assert 0 < t < 1 and c['NO2'] > 0
+
+    times = [t for t, _ in points]
+    assert times == sorted(times) and times[-1] == 100
+
+
+def test_invalid_mechanism():
+    """Пустой механизм и отрицательные константы отклоняются до расчета"""
+    for steps in ([], [('A -> B', -1)], [('A -> B', float('nan'))]):
+        try:
+            Mechanism(steps)
+        except ValueError:
+            continue
+        raise AssertionError(f"механизм {steps} принят")
+
+
+if __name__ == "__main__":
+    test_mechanism_matrices()
+    test_analytic_solutions()
+    test_streaming()
+    test_invalid_mechanism()
+    print("✅ УСПЕХ")
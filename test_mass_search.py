@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Тест поиска формул по молярной массе
+"""
+
+import time
+
+from chemistry_data import ATOMIC_MASSES
+from mass_search import DEFAULT_ELEMENTS, formulas_for_mass, parse_elements, rdbe
+
+
+def test_known_formulas():
+    """Известные вещества находятся, все ответы укладываются в допуск"""
+    formulas = [r['formula'] for r in formulas_for_mass(180.16, 0.05)]
+    assert 'C6H12O6' in formulas
+    assert [r['formula'] for r in formulas_for_mass(180.16, 0.05, bounds={'C': (6, 6), 'N': (0, 0)})] == ['C6H12O6']
+    assert 'C6H6' in [r['formula'] for r in formulas_for_mass(78.11, 0.05, ('C', 'H'))]
+    assert [r['formula'] for r in formulas_for_mass(32.0, 0.05, ('O',))] == ['O2']
+
+    for result in formulas_for_mass(342.3, 0.05, ('C', 'H', 'N', 'O', 'S', 'Cl'), limit=1000):
+        mass = sum(ATOMIC_MASSES[e] * n for e, n in result['counts'].items())
+        assert abs(mass - 342.3) <= 0.05 + 1e-6
+        assert result['rdbe'] >= 0 and rdbe(result['counts']) == result['rdbe']
+
+
+def test_rdbe():
+    """Степень ненасыщенности и разбор набора элементов"""
+    assert rdbe({'C': 6, 'H': 6}) == 4
+    assert rdbe({'C': 2, 'H': 6, 'O': 1}) == 0
+    assert rdbe({'C': 5, 'H': 5, 'N': 1}) == 4
+    assert parse_elements('CHNOCl') == ('C', 'H', 'N', 'O', 'Cl')
+    assert parse_elements('C, H, O') == ('C', 'H', 'O')
+
+
+def test_speed():
+    """Шесть элементов - за доли секунды"""
+    start = time.perf_counter()
+    results = formulas_for_mass(342.3, 0.05, ('C', 'H', 'N', 'O', 'S', 'Cl'))
+    elapsed = time.perf_counter() - start
+    print(f"⏱ {len(results)} формул за {elapsed * 1000:.1f} мс")
+    assert elapsed < 0.5
+
+
+def test_request_limits():
+    """Слишком большие запросы отклоняются сразу, а не считаются секундами"""
+    start = time.perf_counter()
+    for mass, tolerance, elements in [(1500, 0.01, ('C', 'H', 'N', 'O', 'S', 'P')), (5000, 0.05, DEFAULT_ELEMENTS),
+                                      (180, 5, DEFAULT_ELEMENTS), (float('nan'), 0.05, DEFAULT_ELEMENTS),
+                                      (-10, 0.05, DEFAULT_ELEMENTS)]:
+        try:
+            formulas_for_mass(mass, tolerance, elements)
+        except ValueError:
+            continue
+        raise AssertionError(f"запрос {mass} ± {tolerance} принят")
+    assert time.perf_counter() - start < 0.1
+
+
+def test_bounds():
+    """Границы зажимаются массой, неверные границы отклоняются"""
+    start = time.perf_counter()
+    results = formulas_for_mass(180.16, 0.05, bounds={'C': (0, 10_000_000)})
+    assert time.perf_counter() - start < 0.1
+    assert results == formulas_for_mass(180.16, 0.05)
+    assert formulas_for_mass(180.16, 0.05, bounds={'C': (20, 30)}) == []
+
+    for bound in [(-2, 5), (5, 2), (1,), 'x']:
+        try:
+            formulas_for_mass(180.16, 0.05, bounds={'C': bound})
+        except ValueError:
+            continue
+        raise AssertionError(f"граница {bound!r} принята")
+
+
+if __name__ == "__main__":
+    test_known_formulas()
+    test_rdbe()
+    test_speed()
+    test_request_limits()
+    test_bounds()
+    print("✅ УСПЕХ")
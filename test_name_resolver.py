@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Тест распознавания названий веществ
+"""
+
+from advanced_neural_chemistry import advanced_neural_predictor
+from name_resolver import NameResolver, genitive, known_names, name_resolver, stem
+
+
+def test_name_resolution():
+    """Названия, падежные формы и многословные названия"""
+    cases = [
+        ("цинк + соляная кислота", "Zn + HCl"),
+        ("Цинк и соляной кислотой", "Zn + HCl"),
+        ("гидроксида натрия + серная кислота", "NaOH + H2SO4"),
+        ("хлорид бария и сульфат натрия", "BaCl2 + Na2SO4"),
+        ("железо + сульфат меди(II)", "Fe + CuSO4"),
+        ("хлорид железа (III)", "FeCl3"),
+        ("sodium hydroxide and hydrochloric acid", "NaOH + HCl"),
+        ("copper(II) sulfate + zinc", "CuSO4 + Zn"),
+        ("метан + кислород", "CH4 + O2"),
+        ("оксид кальция + вода", "CaO + H2O"),
+        ("Zn + HCl", "Zn + HCl"),
+        ("Что такое кислота?", "Что такое кислота?"),
+    ]
+
+    for query, expected in cases:
+        resolved = name_resolver.resolve(query)
+        print(f"🔤 {query} -> {resolved}")
+        assert resolved == expected
+
+    # Беглая гласная и падежи сводятся к одной основе
+    assert stem("кислотой") == stem("кислота") == "кислот"
+    assert stem("натрием") == stem("натрий")
+    assert stem("железа(II)") == "желез(ii)"
+
+    # Самое длинное совпадение выигрывает у префикса
+    resolver = NameResolver({"оксид углерода": "CO", "оксид углерода(IV)": "CO2"})
+    assert resolver.resolve("оксид углерода(IV)") == "CO2"
+
+    # Катион в названиях солей и оксидов - в родительном падеже
+    names = known_names()
+    assert names["хлорид меди(II)"] == names["хлорид меди"] == "CuCl2"
+    assert names["хлорид бария"] == "BaCl2"
+    assert names["оксид свинца(II)"] == "PbO"
+    assert "хлорид медь" not in names and "хлорид барий" not in names
+    assert [genitive(name) for name in ("никель", "ртуть", "олово", "цинк")] == ["никеля", "ртути", "олова", "цинка"]
+
+
+def test_engine_accepts_names():
+    """Движок решает запросы, записанные названиями"""
+    result = advanced_neural_predictor.solve_structured("цинк + соляная кислота")
+    assert result.kind == 'prediction'
+    assert result.equation == "Zn + 2HCl → ZnCl2 + H2"
+
+
+if __name__ == "__main__":
+    test_name_resolution()
+    test_engine_accepts_names()
+    print("✅ УСПЕХ")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Тест степеней окисления и распознавания ОВР
+"""
+
+from fractions import Fraction
+
+from advanced_neural_chemistry import advanced_neural_predictor
+from oxidation_states import is_redox, oxidation_states, state_changes
+
+
+def test_oxidation_states():
+    """Правила по приоритету, пероксиды, гидриды и соли по ионам"""
+    cases = [
+        ('KMnO4', {'K': 1, 'Mn': 7, 'O': -2}),
+        ('K2Cr2O7', {'K': 1, 'Cr': 6, 'O': -2}),
+        ('H2O2', {'H': 1, 'O': -1}),
+        ('OF2', {'O': 2, 'F': -1}),
+        ('NaH', {'Na': 1, 'H': -1}),
+        ('NH3', {'N': -3, 'H': 1}),
+        ('PH3', {'P': -3, 'H': 1}),
+        ('CaH2', {'Ca': 2, 'H': -1}),
+        ('FeS2', {'Fe': 2, 'S': -1}),
+        ('BaO2', {'Ba': 2, 'O': -1}),
+        ('MnO2', {'Mn': 4, 'O': -2}),
+        ('MoS2', {'Mo': 4, 'S': -2}),
+        ('Fe2(SO4)3', {'Fe': 3, 'S': 6, 'O': -2}),
+        ('(NH4)2SO4', {'N': -3, 'H': 1, 'S': 6, 'O': -2}),
+        ('CH3COOH', {'C': 0, 'H': 1, 'O': -2}),
+        ('Fe3O4', {'Fe': Fraction(8, 3), 'O': -2}),
+        ('Cl2', {'Cl': 0}),
+        ('2H2O', {'H': 1, 'O': -2}),
+    ]
+
+    for formula, expected in cases:
+        states = oxidation_states(formula)
+        print(f"⚡ {formula}: {states}")
+        assert states == expected
+
+    assert oxidation_states('SO4', charge=-2) == {'S': 6, 'O': -2}
+
+
+def test_redox_detection():
+    """ОВР - хотя бы один элемент меняет степень окисления"""
+    assert state_changes(['Zn', 'HCl'], ['ZnCl2', 'H2']) == {'Zn': ([0], [2]), 'H': ([1], [0])}
+    assert is_redox(['MnO2', 'HCl'], ['MnCl2', 'Cl2', 'H2O'])
+    assert not is_redox(['NaOH', 'HCl'], ['NaCl', 'H2O'])
+    assert not is_redox(['CaCO3'], ['CaO', 'CO2'])
+    assert not is_redox(['BaCl2', 'Na2SO4'], ['BaSO4', 'NaCl'])
+
+
+def test_pipeline_marks_redox():
+    """Тип, не определенный по запросу, уточняется по степеням окисления"""
+    result = advanced_neural_predictor.pipeline.solve('Fe + Cl2 -> FeCl3')
+    assert result['reaction_type'] == 'redox'
+
+    # Тип определяется по степеням окисления, а не по наличию окислителя в запросе
+    assert advanced_neural_predictor.analyze_query('MnO2 + HCl')['reaction_type'] == 'redox'
+    assert advanced_neural_predictor.analyze_query('BaCl2 + Na2SO4')['reaction_type'] == 'exchange'
+
+
+if __name__ == "__main__":
+    test_oxidation_states()
+    test_redox_detection()
+    test_pipeline_marks_redox()
+    print("✅ УСПЕХ")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Тест растворимости и осаждения по произведению растворимости
+"""
+
+import numpy as np
+
+from chemistry_data import KSP_DATA
+from ion_exchange import split_ions
+from precipitation import molar_solubility, precipitation_grid, will_precipitate
+
+
+def test_molar_solubility():
+    """Растворимость в воде: s = (Ksp / m^m·n^n)^(1/(m+n))"""
+    assert abs(molar_solubility('AgCl') - 1.34e-5) < 1e-7
+    assert abs(molar_solubility('CaF2') - 2.14e-4) < 1e-6
+    assert abs(molar_solubility('Ca3(PO4)2') - 7.14e-7) < 1e-9
+    assert molar_solubility('NaCl') is None
+
+    # Все соли таблицы раскладываются на ионы
+    assert all(split_ions(salt) for salt in KSP_DATA)
+
+
+def test_common_ion():
+    """Одноименный ион снижает растворимость, ряд концентраций - одним вызовом"""
+    chloride = np.array([0, 1e-3, 1e-2, 0.1])
+    values = molar_solubility('AgCl', anion=chloride)
+    print(f"💧 AgCl в растворе Cl-: {values}")
+    assert values.shape == (4,) and np.all(np.diff(values) < 0)
+    assert abs(values[-1] - 1.8e-9) < 1e-12
+
+    s = molar_solubility('Ag2CO3', cation=0.01)
+    assert abs((2 * s + 0.01) ** 2 * s - KSP_DATA['Ag2CO3']) < 1e-18
+
+    # Раствор уже пересыщен
+    assert molar_solubility('AgCl', cation=0.01, anion=0.01) == 0.0
+
+
+def test_precipitation():
+    """Ионное произведение против Ksp, сетка концентраций"""
+    assert will_precipitate('BaSO4', 1e-4, 1e-4)['precipitates']
+    assert not will_precipitate('PbCl2', 0.01, 0.01)['precipitates']
+
+    grid = precipitation_grid('AgCl', np.logspace(-8, -2, 4), np.logspace(-8, -2, 4))
+    assert grid['precipitates'].shape == (4, 4)
+    assert grid['precipitates'].sum() == 6
+    assert not grid['precipitates'][0].any() and grid['precipitates'][-1, 1:].all()
+
+
+if __name__ == "__main__":
+    test_molar_solubility()
+    test_common_ion()
+    test_precipitation()
+    print("✅ УСПЕХ")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Тест многошаблонного анализа запросов
+"""
+
+from query_matcher import ChemicalQueryMatcher
+from advanced_neural_chemistry import AdvancedNeuralChemistry
+
+
+def test_nested_and_case_rules():
+    """Вложенные шаблоны и учет регистра"""
+    matcher = ChemicalQueryMatcher({
+        'keywords': (['how', 'how much'], False),
+        'formulas': (['MnO2', 'O2'], True),
+    })
+
+    found = matcher.scan("How much MnO2?")
+    assert found['keywords'] == ['how much', 'how']
+    assert found['formulas'] == ['MnO2', 'O2']
+
+    # Формулы чувствительны к регистру
+    assert matcher.scan("mno2")['formulas'] == []
+
+
+def test_analyze_query_single_pass():
+    """Тип запроса, тип реакции и вещества за один проход"""
+    ai = AdvancedNeuralChemistry()
+
+    cases = [
+        ("Zn + HCl", 'reaction_prediction', 'metal_acid', ['Zn', 'HCl']),
+        ("MnO2 + HCl", 'reaction_prediction', 'redox', ['MnO2', 'HCl']),
+        ("CH4 + O2", 'reaction_prediction', 'combustion', ['O2']),
+        ("H2 + O2 -> H2O", 'balancing', 'combustion', ['O2']),
+        ("Почему горит магний?", 'explanation', 'decomposition', []),
+        ("Сколько граммов соли?", 'calculation', 'decomposition', []),
+    ]
+
+    for query, query_type, reaction_type, species in cases:
+        analysis = ai.analyze_query(query)
+        print(f"📥 {query} -> {analysis['type']}, {analysis['reaction_type']}, {analysis['species']}")
+        assert analysis['type'] == query_type
+        assert analysis['reaction_type'] == reaction_type
+        assert analysis['species'] == species
+
+
+if __name__ == "__main__":
+    test_nested_and_case_rules()
+    test_analyze_query_single_pass()
+    print("✅ УСПЕХ")
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Тест поиска ближайших известных реакций
+"""
+
+from advanced_neural_chemistry import AdvancedNeuralChemistry
+
+
+def test_analogy_by_group():
+    """Sr + HCl решается по аналогии с металлами II группы"""
+    ai = AdvancedNeuralChemistry()
+
+    tests = [
+        (["Sr", "HCl"], "SrCl2+H2"),
+        (["Rb", "H2SO4"], "Rb2SO4+H2"),
+        (["Sr", "O2"], "SrO"),
+    ]
+
+    for reactants, expected in tests:
+        neighbours = ai.similarity_index.nearest(reactants, k=3)
+        analogies = [n['analogy'] for n in neighbours if n['analogy']]
+        print(f"📥 {' + '.join(reactants)} -> {analogies[:1]}")
+        assert analogies and analogies[0] == expected
+
+
+def test_invalid_formulas_are_ignored():
+    """Текст вместо формул не дает соседей"""
+    ai = AdvancedNeuralChemistry()
+    assert ai.similarity_index.nearest(["Что такое кислота?"]) == []
+
+
+if __name__ == "__main__":
+    test_analogy_by_group()
+    test_invalid_formulas_are_ignored()
+    print("✅ УСПЕХ")
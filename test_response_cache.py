@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Тест кэша ответов
+"""
+
+from advanced_neural_chemistry import AdvancedNeuralChemistry
+from response_cache import ResponseCache
+
+
+def test_size_and_ttl():
+    """Вытеснение самой старой записи и устаревание по времени"""
+    cache = ResponseCache(maxsize=2, ttl=60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None and cache.get('a') == 1 and len(cache) == 2
+
+    expired = ResponseCache(maxsize=2, ttl=0)
+    expired.put('a', 1)
+    assert expired.get('a') is None
+
+
+def test_engine_responses():
+    """Ответ берется из кэша по нормализованному запросу"""
+    ai = AdvancedNeuralChemistry()
+    first = ai.solve_reaction_chatgpt_style("Zn + HCl")
+    assert ai.solve_reaction_chatgpt_style("Zn+HCl") == first
+    assert ai.response_cache.hits == 1
+
+    # Структурированный результат и текст бота делят одну запись
+    ai.solve_structured("zn + hcl")
+    assert len(ai.response_cache) == 1 and ai.response_cache.hits == 2
+
+    # Перезагрузка базы знаний сбрасывает кэш
+    ai.load_advanced_knowledge()
+    assert len(ai.response_cache) == 0
+
+
+if __name__ == "__main__":
+    test_size_and_ttl()
+    test_engine_responses()
+    print("✅ УСПЕХ")
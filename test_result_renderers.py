@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Тест структурированных результатов и рендереров
+"""
+
+from advanced_neural_chemistry import AdvancedNeuralChemistry
+from chemistry_result import ChemistryResult
+from result_renderers import render
+
+
+def test_structured_result():
+    """Движок возвращает вещества, коэффициенты, тип и ступень"""
+    ai = AdvancedNeuralChemistry()
+    result = ai.solve_structured("BaCl2 + Na2SO4")
+
+    assert result.kind == 'prediction'
+    assert result.products == ['BaSO4', 'NaCl']
+    assert result.coefficients == [1, 1, 1, 2]
+    assert result.reaction_type == 'exchange'
+    assert result.tier == 'rules'
+    assert result.confidence == 0.8
+
+
+def test_renderers():
+    """Один результат - три формата"""
+    result = ChemistryResult('prediction', "Zn + HCl", reactants=['Zn', 'HCl'],
+                             products=['ZnCl2', 'H2'], coefficients=[1, 2, 1, 1],
+                             reaction_type='metal_acid', confidence=1.0, tier='knowledge_base')
+
+    text = render(result, 'text')
+    assert "🤖 Продукты: Zn + 2HCl → ZnCl2 + H2" in text
+
+    html = render(result, 'html')
+    assert '<p class="equation">Zn + 2HCl → ZnCl<sub>2</sub> + H<sub>2</sub></p>' in html
+
+    # В JSON не попадают пустые поля
+    data = render(result, 'json')
+    assert data['equation'] == "Zn + 2HCl → ZnCl2 + H2"
+    assert 'marks' not in data and 'neighbours' not in data
+
+    unsafe = ChemistryResult('unmatched', "<b>X</b> + Y")
+    assert '&lt;b&gt;' in render(unsafe, 'html')
+
+
+if __name__ == "__main__":
+    test_structured_result()
+    test_renderers()
+    print("✅ УСПЕХ")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Тест конвейера решения: ступени, остановка и кэш
+"""
+
+from advanced_neural_chemistry import AdvancedNeuralChemistry
+
+
+def test_tiers_and_short_circuit():
+    """Каждый запрос отвечает своя ступень, дальше конвейер не идет"""
+    pipeline = AdvancedNeuralChemistry().pipeline
+
+    cases = [
+        ("Zn + HCl", 'knowledge_base', "Zn + 2HCl → ZnCl2 + H2"),
+        ("BaCl2 + Na2SO4", 'rules', "BaCl2 + Na2SO4 → BaSO4↓ + 2NaCl"),
+        ("C8H18 + O2", 'rules', "2C8H18 + 25O2 → 16CO2 + 18H2O"),
+        ("H2 + O2 = H2O", 'balancer', "2H2 + O2 → 2H2O"),
+        ("H2 + O2 + O3 -> H2O", 'search', "5H2 + O2 + O3 → 5H2O"),
+    ]
+
+    for query, tier, equation in cases:
+        result = pipeline.solve(query)
+        stages = [name for name, _ in result['timings']]
+        print(f"🧪 {query}: {result['tier']} {stages} -> {result['equation']}")
+        assert result['tier'] == tier
+        assert result['equation'] == equation
+        # Правила уже дают коэффициенты - балансировка не нужна
+        if tier == 'rules':
+            assert stages[-1] == 'rules'
+
+    assert pipeline.solve("Xx + Q") is None
+
+
+def test_cache_tier():
+    """Повторный запрос отвечает кэш, нормализация объединяет записи"""
+    ai = AdvancedNeuralChemistry()
+    first = ai.pipeline.solve("Fe + CuCl2")
+    second = ai.pipeline.solve("  Fe+CuCl2 ")
+
+    assert not first['cached'] and second['cached']
+    assert second['equation'] == first['equation']
+    assert ai.pipeline.metrics['cache']['answers'] == 1
+
+    # Перестроение индекса базы знаний сбрасывает кэш
+    ai.pipeline.rebuild_index()
+    assert not ai.pipeline.solve("Fe + CuCl2")['cached']
+
+
+if __name__ == "__main__":
+    test_tiers_and_short_circuit()
+    test_cache_tier()
+    print("✅ УСПЕХ")
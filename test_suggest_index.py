@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Тест подсказок при вводе запроса
+"""
+
+import time
+
+from advanced_neural_chemistry import advanced_neural_predictor
+from suggest_index import SuggestIndex, suggest_key
+
+
+def test_suggestions():
+    """Реакции, формулы, названия и дополнение последнего вещества"""
+    index = advanced_neural_predictor.suggest_index
+
+    texts = [item['text'] for item in index.suggest('zn + h', 3)]
+    print(f"💡 zn + h -> {texts}")
+    assert texts == ['Zn + HCl', 'Zn + HNO3', 'Zn + H2SO4']
+
+    names = index.suggest('соля')
+    assert names[0] == {'text': 'соляная кислота', 'kind': 'name', 'formula': 'HCl'}
+
+    completed = index.suggest('Zn + соля')
+    assert completed[0]['text'] == 'Zn + соляная кислота'
+
+    assert index.suggest('') == []
+    assert index.suggest('qqq') == []
+
+    # Отрицательный и нулевой limit не обрезают выдачу с конца
+    assert len(index.suggest('Zn', -1)) == len(index.suggest('Zn', 0)) == 1
+
+    assert suggest_key('Zn  +  HCl') == 'zn+hcl'
+
+    # Реакции одного набора реагентов не повторяются
+    texts = [item['text'] for item in index.suggest('Zn')]
+    assert len(texts) == len(set(texts))
+
+
+def test_suggestions_speed():
+    """Ответ - проход по префиксу, без перебора записей"""
+    index = SuggestIndex(advanced_neural_predictor.knowledge_base)
+    start = time.perf_counter()
+    for _ in range(1000):
+        index.suggest('Zn + h')
+    average_ms = (time.perf_counter() - start)
+    print(f"⏱ {average_ms:.4f} мс на запрос")
+    assert average_ms < 1.0
+
+
+if __name__ == "__main__":
+    test_suggestions()
+    test_suggestions_speed()
+    print("✅ УСПЕХ")
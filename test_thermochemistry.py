@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Тест термохимических расчетов
+"""
+
+import numpy as np
+
+from advanced_neural_chemistry import advanced_neural_predictor
+from thermochemistry import gibbs_sweep, reaction_thermo, spontaneity_curve
+
+
+def test_reaction_thermo():
+    """ΔH°, ΔS°, ΔG° и температура смены знака"""
+    thermo = reaction_thermo(['CaCO3'], ['CaO', 'CO2'])
+    print(f"🔥 CaCO3 -> CaO + CO2: {thermo}")
+    assert thermo['coefficients'] == [1, 1, 1]
+    assert abs(thermo['dH'] - 179.2) < 0.01
+    assert abs(thermo['dS'] - 160.2) < 0.01
+    assert not thermo['spontaneous']
+    assert abs(thermo['crossover'] - 1118.6) < 0.1
+
+    combustion = reaction_thermo(['CH4', 'O2'], ['CO2', 'H2O'], [1, 2, 1, 2])
+    assert abs(combustion['dH'] + 890.5) < 0.01
+    assert combustion['spontaneous']
+
+    # Нет данных или уравнение не уравнивается
+    assert reaction_thermo(['XeF2', 'H2'], ['Xe', 'HF']) is None
+    assert reaction_thermo(['H2'], ['H2O']) is None
+
+
+def test_gibbs_sweep():
+    """ΔG°(T) для нескольких реакций одним выражением"""
+    decomposition = reaction_thermo(['CaCO3'], ['CaO', 'CO2'])
+    synthesis = reaction_thermo(['N2', 'H2'], ['NH3'])
+    temperatures = np.array([298.15, 1000, 1500])
+
+    sweep = gibbs_sweep([decomposition, synthesis], temperatures)
+    assert sweep.shape == (3, 2)
+    assert np.allclose(sweep[:, 0], decomposition['dH'] - temperatures * decomposition['dS'] / 1000)
+    assert sweep[0, 1] < 0 < sweep[2, 1]
+
+    curve = spontaneity_curve(decomposition, 200, 1500, 14)
+    assert len(curve['temperatures']) == len(curve['dG']) == 14
+    assert curve['dG'][0] > 0 > curve['dG'][-1]
+
+
+def test_engine_thermochemistry():
+    """Запрос с названиями балансируется и считается"""
+    thermo = advanced_neural_predictor.thermochemistry('метан + кислород')
+    assert thermo['reactants'] == ['CH4', 'O2']
+    assert thermo['coefficients'] == [1, 2, 1, 2]
+
+
+if __name__ == "__main__":
+    test_reaction_thermo()
+    test_gibbs_sweep()
+    test_engine_thermochemistry()
+    print("✅ УСПЕХ")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Тест кривых титрования и их кэширования
+"""
+
+import numpy as np
+
+from titration import curve_svg, parse_titration_key, titration_curve
+
+
+def test_equivalence_points():
+    """Объем и pH в точках эквивалентности"""
+    curve = titration_curve('CH3COOH', 0.1, 25, 'NaOH', 0.1)
+    assert curve['volumes'].shape == curve['ph'].shape == (2001,)
+    assert np.all(np.diff(curve['ph']) >= 0)
+    assert abs(curve['ph'][0] - 2.88) < 0.01
+    assert curve['equivalence_points'] == [{'volume': 25.0, 'ph': 8.72}]
+
+    # Многоосновная кислота - по точке на каждую ступень
+    phosphoric = titration_curve('H3PO4', 0.1, 25, 'NaOH', 0.1)
+    assert [p['volume'] for p in phosphoric['equivalence_points']] == [25.0, 50.0, 75.0]
+
+    # Основание кислотой: pH убывает, в точке эквивалентности среда кислая
+    ammonia = titration_curve('NH3', 0.1, 25, 'HCl', 0.1)
+    assert np.all(np.diff(ammonia['ph']) <= 0)
+    assert ammonia['equivalence_points'][0]['ph'] < 7
+
+    assert titration_curve('H2SO4', 0.1, 25, 'Ba(OH)2', 0.1)['equivalence_points'][-1]['volume'] == 25.0
+
+    # Сильное двухкислотное основание нейтрализуется сразу - одна точка
+    barium = titration_curve('Ba(OH)2', 0.1, 25, 'HCl', 0.1)
+    assert [p['volume'] for p in barium['equivalence_points']] == [50.0]
+    assert barium['equivalence_points'][0]['ph'] == 7.0
+
+    assert titration_curve('HCl', float('nan'), 25, 'NaOH', 0.1) is None
+    assert titration_curve('HCl', 0.1, float('inf'), 'NaOH', 0.1) is None
+    assert titration_curve('HCl', 0.1, 25, 'HNO3', 0.1) is None
+    assert titration_curve('NaCl', 0.1, 25, 'NaOH', 0.1) is None
+
+
+def test_cache_by_key():
+    """Повторный запрос по ключу отдает ту же кривую и картинку"""
+    curve = titration_curve('HCl', 0.1, 20, 'NaOH', 0.2)
+    assert curve['key'] == 'HCl:0.1:20.0:NaOH:0.2'
+    assert titration_curve(*parse_titration_key(curve['key'])) is curve
+    assert parse_titration_key('HCl:0.1') is None
+    assert parse_titration_key('HCl:nan:20:NaOH:0.2') is None
+
+    # Близкие концентрации - разные ключи и разные кривые
+    first = titration_curve('HCl', 0.1234561, 20, 'NaOH', 0.2)
+    second = titration_curve('HCl', 0.1234564, 20, 'NaOH', 0.2)
+    assert first['key'] != second['key'] and first is not second
+
+    svg = curve_svg(curve)
+    assert svg.startswith('<svg') and svg.endswith('</svg>')
+    assert svg.count('<circle') == 1
+    assert curve_svg(curve) is svg
+
+
+if __name__ == "__main__":
+    test_equivalence_points()
+    test_cache_by_key()
+    print("✅ УСПЕХ")
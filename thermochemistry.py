@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Термохимия реакций по табличным данным образования
+Таблица THERMO_DATA один раз переводится в массивы, поэтому ΔH° и ΔS°
+реакции - скалярные произведения с вектором коэффициентов, а ΔG°(T)
+для многих температур и реакций считается одним матричным выражением
+"""
+
+import numpy as np
+
+from chemistry_core import balance
+from chemistry_data import THERMO_DATA
+
+# Стандартная температура, K
+STANDARD_TEMPERATURE = 298.15
+
+THERMO_SPECIES = tuple(THERMO_DATA)
+THERMO_INDEX = {formula: i for i, formula in enumerate(THERMO_SPECIES)}
+FORMATION_ENTHALPY = np.array([THERMO_DATA[f][0] for f in THERMO_SPECIES])  # кДж/моль
+STANDARD_ENTROPY = np.array([THERMO_DATA[f][1] for f in THERMO_SPECIES])    # Дж/(моль·К)
+
+
+def stoichiometry_vector(reactants, products, coefficients):
+    """Вектор коэффициентов по таблице (реагенты со знаком минус) или None"""
+    vector = np.zeros(len(THERMO_SPECIES))
+    species = list(reactants) + list(products)
+    for i, (formula, coefficient) in enumerate(zip(species, coefficients)):
+        index = THERMO_INDEX.get(formula)
+        if index is None:
+            return None
+        vector[index] += -coefficient if i < len(reactants) else coefficient
+    return vector
+
+
+def reaction_thermo(reactants, products, coefficients=None, temperature=STANDARD_TEMPERATURE):
+    """
+    ΔH° (кДж/моль), ΔS° (Дж/(моль·К)) и ΔG°(T) (кДж/моль) реакции
+    Без коэффициентов уравнение балансируется. Возвращает None, если
+    уравнение не уравнивается или для вещества нет данных
+    """
+    if coefficients is None:
+        coefficients = balance(reactants, products)
+        if coefficients is None:
+            return None
+
+    vector = stoichiometry_vector(reactants, products, coefficients)
+    if vector is None:
+        return None
+
+    enthalpy = float(vector @ FORMATION_ENTHALPY)
+    entropy = float(vector @ STANDARD_ENTROPY)
+    gibbs = enthalpy - temperature * entropy / 1000
+
+    # Температура, при которой знак ΔG меняется (если ΔH и ΔS одного знака)
+    crossover = round(enthalpy * 1000 / entropy, 1) if enthalpy * entropy > 0 else None
+
+    return {
+        'reactants': list(reactants),
+        'products': list(products),
+        'coefficients': [int(c) for c in coefficients],
+        'dH': round(enthalpy, 2),
+        'dS': round(entropy, 2),
+        'dG': round(gibbs, 2),
+        'temperature': temperature,
+        'spontaneous': gibbs < 0,
+        'crossover': crossover,
+    }
+
+
+def gibbs_sweep(thermos, temperatures):
+    """
+    ΔG°(T) для нескольких реакций сразу: матрица (температуры x реакции)
+    thermos - результаты reaction_thermo
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    enthalpy = np.array([t['dH'] for t in thermos])
+    entropy = np.array([t['dS'] for t in thermos])
+    return enthalpy[np.newaxis, :] - temperatures[:, np.newaxis] * entropy[np.newaxis, :] / 1000
+
+
+def spontaneity_curve(thermo, t_min=200, t_max=1500, points=27):
+    """Кривая ΔG°(T) одной реакции: {'temperatures': [...], 'dG': [...]}"""
+    temperatures = np.linspace(t_min, t_max, points)
+    gibbs = gibbs_sweep([thermo], temperatures)[:, 0]
+    return {'temperatures': temperatures.round(2).tolist(), 'dG': gibbs.round(2).tolist()}
+
+
+def format_thermo(thermo, temperatures=(298.15, 500, 1000, 1500)):
+    """Текст для бота: ΔH°, ΔS°, ΔG° и знак ΔG при нескольких температурах"""
+    response = f"🔥 ΔH° = {thermo['dH']:.1f} кДж/моль "
+    response += "(экзотермическая)\n" if thermo['dH'] < 0 else "(эндотермическая)\n"
+    response += f"📐 ΔS° = {thermo['dS']:.1f} Дж/(моль·К)\n"
+    response += f"⚖️ ΔG°({thermo['temperature']:.0f} K) = {thermo['dG']:.1f} кДж/моль\n\n"
+
+    response += "🌡 ΔG° при разных температурах:\n"
+    for temperature, gibbs in zip(temperatures, gibbs_sweep([thermo], temperatures)[:, 0]):
+        mark = "✅ самопроизвольно" if gibbs < 0 else "❌ не идет самопроизвольно"
+        response += f"• {temperature:.0f} K: {gibbs:.1f} кДж/моль - {mark}\n"
+
+    if thermo['crossover']:
+        response += f"\n💡 Знак ΔG меняется при T ≈ {thermo['crossover']:.0f} K"
+    return response
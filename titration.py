@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Кривые титрования
+pH во всех точках кривой считается одним векторным вызовом решателя
+электронейтральности по массиву объемов титранта. Готовая кривая и ее
+SVG-картинка хранятся в кэше по ключу титрования, поэтому бот и
+веб-приложение не пересчитывают одну и ту же кривую
+"""
+
+from math import isfinite
+
+import numpy as np
+
+from acid_base_equilibrium import Solution
+from chemistry_data import ACID_CONSTANTS, BASE_CONSTANTS, STRONG_BASES
+from ion_exchange import split_ions
+from response_cache import ResponseCache
+
+DEFAULT_POINTS = 2001
+
+# Размер SVG и поля под оси
+SVG_WIDTH, SVG_HEIGHT = 640, 400
+SVG_MARGIN = 50
+
+# Кривые и картинки по ключу титрования
+titration_cache = ResponseCache(maxsize=128, ttl=24 * 3600)
+
+
+def reacting_units(formula):
+    """
+    Сколько H+ отдает кислота или принимает основание на формульную единицу
+    и сколько точек эквивалентности дает вещество:
+    ('acid' | 'base', число, точки) или None. Многоосновная кислота
+    нейтрализуется по ступеням, сильное основание Ba(OH)2 - сразу
+    """
+    if formula in ACID_CONSTANTS:
+        return 'acid', len(ACID_CONSTANTS[formula]), len(ACID_CONSTANTS[formula])
+    if formula in BASE_CONSTANTS:
+        return 'base', 1, 1
+    if formula in STRONG_BASES:
+        (_, charge), cation_count, _, _ = split_ions(formula)
+        return 'base', charge * cation_count, 1
+    return None
+
+
+def titration_key(analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration):
+    """Ключ кривой с полной точностью чисел: 'CH3COOH:0.1:25.0:NaOH:0.1'"""
+    numbers = (float(analyte_concentration), float(analyte_volume), float(titrant_concentration))
+    return f"{analyte}:{numbers[0]!r}:{numbers[1]!r}:{titrant}:{numbers[2]!r}"
+
+
+def parse_titration_key(key):
+    """Параметры титрования из ключа или None"""
+    parts = key.split(':')
+    if len(parts) != 5:
+        return None
+    try:
+        numbers = float(parts[1]), float(parts[2]), float(parts[4])
+    except ValueError:
+        return None
+    if not all(isfinite(number) for number in numbers):
+        return None
+    return parts[0], numbers[0], numbers[1], parts[3], numbers[2]
+
+
+def titration_curve(analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration,
+                    points=DEFAULT_POINTS):
+    """
+    Кривая титрования: объемы титранта (мл), pH и точки эквивалентности
+    Кислота титруется основанием или основание кислотой; титрант добавляется
+    до объема, вдвое большего последней точки эквивалентности.
+    Возвращает None, если пара не подходит или для веществ нет констант
+    """
+    numbers = (analyte_concentration, analyte_volume, titrant_concentration)
+    if not all(isfinite(number) and number > 0 for number in numbers):
+        return None
+
+    key = titration_key(analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration)
+    cached = titration_cache.get(('curve', key, points))
+    if cached is not None:
+        return cached
+
+    analyte_units, titrant_units = reacting_units(analyte), reacting_units(titrant)
+    if not analyte_units or not titrant_units or analyte_units[0] == titrant_units[0]:
+        return None
+
+    # Объем титранта для каждой ступени нейтрализации анализируемого вещества
+    equivalents = analyte_concentration * analyte_volume * analyte_units[1]
+    step = equivalents / (titrant_concentration * titrant_units[1])
+    steps = analyte_units[2]
+    equivalence_volumes = [step * k / steps for k in range(1, steps + 1)]
+
+    volumes = np.linspace(0, 2 * equivalence_volumes[-1], points)
+    total = analyte_volume + volumes
+    mixture = Solution()
+    mixture.add(analyte, analyte_concentration * analyte_volume / total)
+    mixture.add(titrant, titrant_concentration * volumes / total)
+    values = mixture.ph()
+
+    curve = {
+        'key': key,
+        'analyte': analyte,
+        'titrant': titrant,
+        'volumes': volumes,
+        'ph': values,
+        'equivalence_points': [
+            {'volume': round(volume, 3), 'ph': round(float(np.interp(volume, volumes, values)), 2)}
+            for volume in equivalence_volumes
+        ],
+    }
+    titration_cache.put(('curve', key, points), curve)
+    return curve
+
+
+def curve_svg(curve):
+    """SVG-картинка кривой: линия pH(V), сетка по pH и точки эквивалентности"""
+    cached = titration_cache.get(('svg', curve['key']))
+    if cached is not None:
+        return cached
+
+    volumes, values = curve['volumes'], curve['ph']
+    max_volume = volumes[-1]
+    plot_width = SVG_WIDTH - 2 * SVG_MARGIN
+    plot_height = SVG_HEIGHT - 2 * SVG_MARGIN
+
+    def x(volume):
+        return SVG_MARGIN + volume / max_volume * plot_width
+
+    def y(value):
+        return SVG_MARGIN + (14 - np.clip(value, 0, 14)) / 14 * plot_height
+
+    # Для картинки хватает ~400 точек
+    stride = max(1, len(volumes) // 400)
+    xs, ys = x(volumes[::stride]), y(values[::stride])
+    line = ' '.join(f"{a:.1f},{b:.1f}" for a, b in zip(xs, ys))
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_WIDTH}" height="{SVG_HEIGHT}" '
+             f'font-family="sans-serif" font-size="12">',
+             f'<rect width="{SVG_WIDTH}" height="{SVG_HEIGHT}" fill="white"/>']
+    for value in range(0, 15, 2):
+        parts.append(f'<line x1="{SVG_MARGIN}" y1="{y(value):.1f}" x2="{SVG_WIDTH - SVG_MARGIN}" '
+                     f'y2="{y(value):.1f}" stroke="#e5e7eb"/>')
+        parts.append(f'<text x="{SVG_MARGIN - 8}" y="{y(value) + 4:.1f}" text-anchor="end">{value}</text>')
+    for fraction in (0, 0.25, 0.5, 0.75, 1):
+        parts.append(f'<text x="{x(max_volume * fraction):.1f}" y="{SVG_HEIGHT - SVG_MARGIN + 18}" '
+                     f'text-anchor="middle">{max_volume * fraction:.1f}</text>')
+
+    parts.append(f'<polyline points="{line}" fill="none" stroke="#6366f1" stroke-width="2"/>')
+    for point in curve['equivalence_points']:
+        parts.append(f'<circle cx="{x(point["volume"]):.1f}" cy="{y(point["ph"]):.1f}" r="4" fill="#ef4444"/>')
+
+    parts.append(f'<text x="{SVG_WIDTH / 2}" y="{SVG_HEIGHT - 10}" text-anchor="middle">'
+                 f'V({curve["titrant"]}), мл</text>')
+    parts.append(f'<text x="{SVG_MARGIN}" y="{SVG_MARGIN - 15}">pH: {curve["analyte"]} + {curve["titrant"]}</text>')
+    parts.append('</svg>')
+
+    svg = ''.join(parts)
+    titration_cache.put(('svg', curve['key']), svg)
+    return svg
+
+
+def format_titration(curve):
+    """Текст для бота: точки эквивалентности"""
+    response = f"📈 Титрование {curve['analyte']} раствором {curve['titrant']}\n\n"
+    response += f"🧪 Начальный pH: {curve['ph'][0]:.2f}\n"
+    for i, point in enumerate(curve['equivalence_points'], start=1):
+        response += f"⚖️ Точка эквивалентности {i}: V = {point['volume']:.2f} мл, pH = {point['ph']:.2f}\n"
+    return response
@@ -5,8 +5,18 @@
 Flask сервер для веб-приложения, которое работает внутри Telegram
 """
 
-from flask import Flask, render_template, request, jsonify
-from advanced_neural_chemistry import solve_chemistry_chatgpt
+from flask import Flask, Response, render_template, request, jsonify
+from advanced_neural_chemistry import advanced_neural_predictor, solve_chemistry_chatgpt
+from acid_base_equilibrium import parse_ph_query, solution_ph
+from thermochemistry import STANDARD_TEMPERATURE, spontaneity_curve
+from titration import curve_svg, parse_titration_key, titration_curve
+from kinetics import MAX_TIME, Mechanism
+from precipitation import molar_solubility, precipitation_grid
+from electron_configuration import electron_configuration
+from empirical_formula import solve_worksheet
+from isotope_pattern import isotope_pattern, monoisotopic_mass
+from mass_search import DEFAULT_ELEMENTS, DEFAULT_TOLERANCE, formulas_for_mass, parse_elements
+from suggest_index import MAX_SUGGESTIONS
 import json
 import os
 
@@ -27,6 +37,7 @@ def solve_reaction():
         data = request.get_json()
         query = data.get('query', '').strip()
         user_id = data.get('user_id', 'anonymous')
+        fmt = data.get('format', 'text')
 
         if not query:
             return jsonify({
@@ -35,7 +46,7 @@ def solve_reaction():
             })
 
         # Используем ChatGPT-стиль ИИ
-        result = solve_chemistry_chatgpt(query)
+        result = solve_chemistry_chatgpt(query, fmt)
 
         # Сохраняем в историю пользователя
         if user_id not in user_data:
@@ -63,6 +74,338 @@ def solve_reaction():
             'error': str(e)
         })
 
+@app.route('/api/suggest', methods=['GET'])
+def suggest():
+    """Подсказки по началу запроса: формулы, названия и известные реакции"""
+    prefix = request.args.get('prefix', '')
+    limit = max(1, min(request.args.get('limit', 10, type=int), MAX_SUGGESTIONS))
+    return jsonify({
+        'success': True,
+        'suggestions': advanced_neural_predictor.suggest_index.suggest(prefix, limit)
+    })
+
+@app.route('/api/thermo', methods=['POST'])
+def thermo():
+    """ΔH°, ΔS°, ΔG°(T) реакции и кривая ΔG° по температуре"""
+    try:
+        data = request.get_json()
+        query = data.get('query', '').strip()
+        temperature = float(data.get('temperature', STANDARD_TEMPERATURE))
+
+        result = advanced_neural_predictor.thermochemistry(query, temperature)
+        if result is None:
+            return jsonify({
+                'success': False,
+                'error': 'Нет термодинамических данных для этой реакции'
+            })
+
+        curve = spontaneity_curve(result, float(data.get('t_min', 200)), float(data.get('t_max', 1500)),
+                                  min(int(data.get('points', 27)), 1000))
+        return jsonify({
+            'success': True,
+            'thermo': result,
+            'curve': curve
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/ph', methods=['POST'])
+def solution_acidity():
+    """
+    pH раствора: {'query': 'pH 0.1M CH3COOH'} или {'solution': {'CH3COOH': [0.001, 0.01, 0.1]}}
+    Списки концентраций считаются за один вызов
+    """
+    try:
+        data = request.get_json()
+        solution = data.get('solution') or parse_ph_query(data.get('query', ''))
+        if not solution:
+            return jsonify({
+                'success': False,
+                'error': 'Укажите раствор: pH 0.1M CH3COOH'
+            })
+
+        value = solution_ph(solution)
+        if value is None:
+            return jsonify({
+                'success': False,
+                'error': 'Нет констант диссоциации для этих веществ'
+            })
+
+        return jsonify({
+            'success': True,
+            'solution': solution,
+            'ph': value.round(3).tolist() if hasattr(value, 'tolist') else round(value, 3)
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/titration', methods=['POST'])
+def titration():
+    """
+    Кривая титрования: {'analyte': 'CH3COOH', 'analyte_concentration': 0.1,
+    'analyte_volume': 25, 'titrant': 'NaOH', 'titrant_concentration': 0.1}
+    Картинка доступна по ключу: /api/titration/<key>.svg
+    """
+    try:
+        data = request.get_json()
+        curve = titration_curve(
+            data.get('analyte', ''), float(data.get('analyte_concentration', 0.1)),
+            float(data.get('analyte_volume', 25)), data.get('titrant', ''),
+            float(data.get('titrant_concentration', 0.1))
+        )
+        if curve is None:
+            return jsonify({
+                'success': False,
+                'error': 'Укажите кислоту и основание с известными константами'
+            })
+
+        # Для графика на странице хватает каждой десятой точки
+        return jsonify({
+            'success': True,
+            'key': curve['key'],
+            'equivalence_points': curve['equivalence_points'],
+            'volumes': curve['volumes'][::10].round(3).tolist(),
+            'ph': curve['ph'][::10].round(3).tolist(),
+            'svg_url': f"/api/titration/{curve['key']}.svg"
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/titration/<key>.svg', methods=['GET'])
+def titration_image(key):
+    """SVG кривой титрования по ключу (из кэша или заново)"""
+    params = parse_titration_key(key)
+    curve = titration_curve(*params) if params else None
+    if curve is None:
+        return jsonify({'success': False, 'error': 'Неверный ключ титрования'}), 404
+    return Response(curve_svg(curve), mimetype='image/svg+xml')
+
+@app.route('/api/equilibrium', methods=['POST'])
+def chemical_equilibrium():
+    """
+    Равновесный состав: {'query': 'N2 + H2 -> NH3', 'K': 0.5, 'initial': {'N2': 1, 'H2': [1, 2, 3]}}
+    Для системы реакций - {'reactions': [{'query': ..., 'K': ...}, ...], 'initial': {...}}
+    """
+    try:
+        data = request.get_json()
+        reactions = data.get('reactions') or [{'query': data.get('query', ''), 'K': data.get('K')}]
+        if any(reaction.get('K') is None or float(reaction['K']) <= 0 for reaction in reactions):
+            return jsonify({
+                'success': False,
+                'error': 'Укажите константу равновесия K > 0'
+            })
+
+        result = advanced_neural_predictor.equilibrium(
+            [reaction['query'] for reaction in reactions],
+            [float(reaction['K']) for reaction in reactions],
+            data.get('initial', {})
+        )
+        if result is None:
+            return jsonify({
+                'success': False,
+                'error': 'Не удалось составить уравнение реакции'
+            })
+
+        def to_json(value):
+            return value.round(6).tolist() if hasattr(value, 'tolist') else round(value, 6)
+
+        return jsonify({
+            'success': True,
+            'species': result['species'],
+            'extents': [to_json(extent) for extent in result['extents']],
+            'concentrations': {formula: to_json(c) for formula, c in result['concentrations'].items()}
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/kinetics', methods=['POST'])
+def kinetics():
+    """
+    Кинетическая кривая механизма, по строке JSON на точку:
+    {'steps': [['2NO + O2 -> 2NO2', 7000]], 'initial': {'NO': 0.01, 'O2': 0.01}, 't_end': 100}
+    """
+    try:
+        data = request.get_json()
+        mechanism = Mechanism(data.get('steps', []))
+        t_end = float(data.get('t_end', 10))
+        if not 0 < t_end <= MAX_TIME:
+            raise ValueError(f"t_end должно быть в пределах (0, {MAX_TIME:g}]")
+        points = mechanism.simulate(data.get('initial', {}), t_end)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+    def stream():
+        yield json.dumps({'species': mechanism.species}) + '\n'
+        # Заголовок уже отправлен - ошибка расчета приходит последней строкой
+        try:
+            for t, c in points:
+                yield json.dumps({'t': float(t), 'c': c.tolist()}) + '\n'
+        except Exception as e:
+            yield json.dumps({'error': str(e)}) + '\n'
+
+    return Response(stream(), mimetype='application/x-ndjson')
+
+@app.route('/api/ksp', methods=['POST'])
+def solubility_product():
+    """
+    Растворимость и осаждение по Ksp:
+    {'salt': 'AgCl', 'anion': [0, 0.001, 0.01]} - растворимость с одноименным ионом;
+    {'salt': 'AgCl', 'cations': [...], 'anions': [...]} - сетка "выпадет ли осадок"
+    """
+    try:
+        data = request.get_json()
+        salt = data.get('salt', '').strip()
+
+        if 'cations' in data or 'anions' in data:
+            grid = precipitation_grid(salt, data.get('cations', [0]), data.get('anions', [0]))
+            if grid is None:
+                return jsonify({'success': False, 'error': f'Нет Ksp для {salt}'})
+            return jsonify({
+                'success': True,
+                'salt': salt,
+                'Ksp': grid['Ksp'],
+                'Q': grid['Q'].tolist(),
+                'precipitates': grid['precipitates'].tolist()
+            })
+
+        solubility = molar_solubility(salt, data.get('cation', 0.0), data.get('anion', 0.0))
+        if solubility is None:
+            return jsonify({'success': False, 'error': f'Нет Ksp для {salt}'})
+        return jsonify({
+            'success': True,
+            'salt': salt,
+            'solubility': solubility.tolist() if hasattr(solubility, 'tolist') else solubility
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/formula', methods=['POST'])
+def formula_from_composition():
+    """
+    Формула по массовым долям: {'query': '40% C, 6.7% H, 53.3% O; M = 180'}
+    или лист задач {'worksheet': ['...', '...']} - все строки решаются вместе
+    """
+    try:
+        data = request.get_json()
+        texts = data.get('worksheet') or [data.get('query', '')]
+        results = solve_worksheet(texts)
+
+        if 'worksheet' in data:
+            return jsonify({
+                'success': True,
+                'results': results
+            })
+        if results[0] is None:
+            return jsonify({
+                'success': False,
+                'error': 'Укажите массовые доли: 40% C, 6.7% H, 53.3% O'
+            })
+        return jsonify({
+            'success': True,
+            'result': results[0]
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/mass_search', methods=['POST'])
+def mass_search():
+    """
+    Формулы с молярной массой M ± допуск:
+    {'mass': 180.16, 'tolerance': 0.05, 'elements': 'CHNO', 'bounds': {'N': [0, 2]}}
+    """
+    try:
+        data = request.get_json()
+        elements = parse_elements(data['elements']) if data.get('elements') else DEFAULT_ELEMENTS
+        bounds = data.get('bounds') or {}
+        if not isinstance(bounds, dict):
+            raise ValueError("Границы задаются так: {'N': [0, 2]}")
+        results = formulas_for_mass(float(data['mass']), float(data.get('tolerance', DEFAULT_TOLERANCE)),
+                                    elements, bounds, max(1, min(int(data.get('limit', 100)), 1000)))
+        return jsonify({
+            'success': True,
+            'results': results
+        })
+
+    except ValueError as e:
+        # Неверные масса, допуск или границы - ошибка запроса
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/isotopes', methods=['POST'])
+def isotopes():
+    """Изотопное распределение: {'formula': 'CH2Cl2', 'threshold': 0.1}"""
+    try:
+        data = request.get_json()
+        formula = data.get('formula', '').strip()
+        peaks = isotope_pattern(formula, float(data.get('threshold', 0.1)))
+        if not peaks:
+            return jsonify({
+                'success': False,
+                'error': f'Нет данных об изотопах для {formula}'
+            })
+        return jsonify({
+            'success': True,
+            'formula': formula,
+            'monoisotopic_mass': monoisotopic_mass(formula),
+            'peaks': peaks
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/electron_configuration/<element>', methods=['GET'])
+def element_configuration(element):
+    """Электронная конфигурация, валентные электроны и орбитальная диаграмма элемента"""
+    try:
+        info = electron_configuration(element)
+        if info is None:
+            return jsonify({'success': False, 'error': f'Неизвестный элемент: {element}'}), 404
+        return jsonify({'success': True, **info})
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 @app.route('/api/history/<user_id>', methods=['GET'])
 def get_history(user_id):
     """Получить историю пользователя"""